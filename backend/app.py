@@ -1,58 +1,128 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response
 from flask_cors import CORS
 import os
 import sys
 import joblib
 import json
-import nltk
 import time
+import functools
 import traceback
 
-# Setup NLTK - Download resource yang dibutuhkan
-def setup_nltk():
-    """Download semua resource NLTK yang dibutuhkan aplikasi"""
-    print("Menyiapkan resource NLTK...")
-    # Pastikan resource punkt dan stopwords tersedia
-    try:
-        nltk.download('punkt_tab')
-        nltk.download('stopwords')
-        print("Resource NLTK berhasil disiapkan")
-    except Exception as e:
-        print(f"Gagal menyiapkan NLTK: {e}")
-
-# Jalankan setup NLTK pertama kali
-setup_nltk()
-
 # Menambahkan path untuk import
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import modul-modul aplikasi
-from backend.utils.preprocessor import preprocess_text, extract_film_patterns
-from backend.models.classifier import FilmRecommender
+from backend.utils.preprocessor import preprocess_text, extract_film_patterns, STOPWORDS_PATH
+from backend.models.compact import open_recommender, CompactRecommender
 from backend.models.translator import FilmTranslator
 from backend.models.chatbot import FilmChatbot
+from backend.models.catalogue import FilmCatalogue
+from backend.models.storage import open_film_store
+from backend.utils.json_encoder import dumps_bytes
+from backend.utils.batching import RequestCoalescer
+from backend.utils.admission import AdmissionController, AdmissionRejected
 
 # Inisialisasi Flask app
 app = Flask(__name__)
 CORS(app)  # Enable CORS untuk semua domain
 
-# Inisialisasi model-model
-film_recommender = FilmRecommender()
-film_translator = FilmTranslator()
-film_chatbot = FilmChatbot()
+# Inisialisasi model-model (runtime compact tanpa scikit-learn jika RECOMMENDER_RUNTIME=compact)
+film_recommender = open_recommender()
+
+# Satu penyimpanan film dipakai bersama (snapshot katalog jika masih sesuai dengan JSON)
+film_store = open_film_store()
+film_translator = FilmTranslator(film_store)
+film_chatbot = FilmChatbot(film_store)
+film_catalogue = FilmCatalogue.from_store(film_store, text_index=film_chatbot.fulltext)
+
+# Prediksi genre /api/analyze dari request bersamaan digabung menjadi satu batch
+# (ANALYZE_BATCH_SIZE=1 untuk menonaktifkan, ANALYZE_BATCH_WAIT_MS untuk jendela maksimal).
+# Runtime compact sudah cukup cepat per request sehingga default-nya tidak digabung
+analyze_coalescer = RequestCoalescer(
+    lambda texts: film_recommender.predict_batch(texts, workers=1, report=False),
+    max_batch_size=int(os.environ.get('ANALYZE_BATCH_SIZE', 1 if isinstance(film_recommender, CompactRecommender) else 32)),
+    max_wait=float(os.environ.get('ANALYZE_BATCH_WAIT_MS', 2)) / 1000,
+    name='analyze-coalescer'
+)
+
+# Batas request bersamaan, antrean, dan waktu tunggu (detik) untuk endpoint berat;
+# dapat diganti dengan ADMISSION_<NAMA>="bersamaan,antrean,tunggu". Endpoint lain
+# (/api/film, /api/genre, /api/search) tidak dibatasi agar tetap cepat saat beban tinggi
+admission = AdmissionController({
+    'analyze': (32, 64, 2.0),
+    'chat': (os.cpu_count() or 1, 16, 2.0),
+    'train': (1, 0, 0.0),
+})
+
+def admission_limited(name):
+    """Decorator endpoint berat: batasi request bersamaan, 503 + Retry-After jika kelebihan beban"""
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            try:
+                with admission.admit(name):
+                    return view(*args, **kwargs)
+            except AdmissionRejected as e:
+                response = jsonify({
+                    "error": "Server sedang sibuk, silakan coba lagi nanti",
+                    "retry_after": e.retry_after
+                })
+                response.status_code = 503
+                response.headers['Retry-After'] = str(e.retry_after)
+                return response
+        return wrapper
+    return decorator
+
+def json_bytes_response(body, status=200):
+    """Membuat respons Flask dari bytes JSON yang sudah di-encode"""
+    return Response(body, status=status, mimetype='application/json')
+
+def optional_number(name, cast=float):
+    """Mengambil query parameter numerik opsional, None jika tidak diisi"""
+    value = request.args.get(name, '').strip()
+    if not value:
+        return None
+    try:
+        return cast(value)
+    except ValueError:
+        raise ValueError(f"Parameter '{name}' harus berupa angka")
+
+# Setup NLTK - Download resource yang dibutuhkan
+def setup_nltk():
+    """Download resource NLTK yang dibutuhkan aplikasi jika stopwords belum tersedia"""
+    # Stopwords yang sudah disalin ke STOPWORDS_PATH (scripts/build_stopwords.py) tidak membutuhkan NLTK; paket
+    # nltk diimpor di sini saja karena impor nltk ikut memuat scikit-learn.
+    # punkt hanya diunduh saat tokenizer mode 'nltk' dipakai (TOKENIZER_MODE)
+    if os.path.exists(STOPWORDS_PATH):
+        return
+    
+    print("Menyiapkan resource NLTK...")
+    try:
+        import nltk
+        nltk.download('stopwords')
+        print("Resource NLTK berhasil disiapkan")
+    except Exception as e:
+        print(f"Gagal menyiapkan NLTK: {e}")
 
 # Load model jika sudah ada
 def load_models():
     """Load semua model yang dibutuhkan aplikasi"""
+    setup_nltk()
+    
     try:
         # Cek apakah model film_recommender sudah ada
         model_path = os.path.join('models', 'film_recommender.joblib')
-        if os.path.exists(model_path):
+        training_data_path = os.path.join('data', 'training_films.csv')
+        if os.path.exists(model_path) or isinstance(film_recommender, CompactRecommender):
             print("Model recommender ditemukan, memuat...")
+            # Artifact lama (tanpa sidik jari) atau data training yang berubah hanya dilaporkan;
+            # training ulang lewat /api/train
+            if (not isinstance(film_recommender, CompactRecommender) and os.path.exists(training_data_path)
+                    and not film_recommender.is_trained_on(film_recommender.training_fingerprint(training_data_path))):
+                print("Model recommender tidak sesuai data training saat ini; latih ulang lewat /api/train")
         else:
             print("Model recommender tidak ditemukan. Training model...")
             # Training model dengan data yang tersedia
-            training_data_path = os.path.join('data', 'training_films.csv')
             if os.path.exists(training_data_path):
                 film_recommender.train_from_csv(training_data_path)
                 print("Model recommender berhasil dilatih dan disimpan")
@@ -73,7 +143,26 @@ def health_check():
         "timestamp": time.time()
     })
 
+@app.route('/api/metrics', methods=['GET'])
+def metrics():
+    """
+    Endpoint metrik beban server
+    
+    Response JSON:
+    {
+        "admission": {endpoint: {active, queued, max_queue_depth, admitted, rejected, ...}},
+        "analyze_batching": {requests, batches, average_batch_size, ...},
+        "timestamp": waktu
+    }
+    """
+    return jsonify({
+        "admission": admission.metrics(),
+        "analyze_batching": analyze_coalescer.stats(),
+        "timestamp": time.time()
+    })
+
 @app.route('/api/analyze', methods=['POST'])
+@admission_limited('analyze')
 def analyze_text():
     """
     Endpoint untuk menganalisis teks dan memberikan rekomendasi film
@@ -116,21 +205,20 @@ def analyze_text():
         processed_text = preprocess_text(text)
         
         # Ekstrak pola film secara eksplisit
-        film_patterns = extract_film_patterns(text)
+        film_patterns = extract_film_patterns(text, known_person=film_translator.known_person)
         
-        # Prediksi genre berdasarkan teks yang telah diproses
-        prediction_result = film_recommender.predict(processed_text)
+        # Prediksi genre berdasarkan teks yang telah diproses (digabung dengan request lain)
+        prediction_result = analyze_coalescer.submit(processed_text)
         
         # Dapatkan rekomendasi film berdasarkan genre yang diprediksi
         top_genres = prediction_result.get('top_genres', [])
         
-        # Gunakan Film Translator untuk mendapatkan rekomendasi film
-        film_recommendations = film_translator.get_recommendations(top_genres)
+        # Gunakan Film Translator untuk mendapatkan rekomendasi film,
+        # kandidat disaring dulu dengan pola film (sutradara, aktor, tahun, rating)
+        film_recommendations = film_translator.get_recommendations(top_genres, constraints=film_patterns)
         
-        # Format respons untuk frontend
-        response = film_translator.format_response(film_recommendations, input_text)
-        
-        return jsonify(response)
+        # Format respons untuk frontend dari fragmen JSON film yang sudah di-cache
+        return json_bytes_response(film_translator.render_response_json(film_recommendations, input_text))
     
     except Exception as e:
         print(f"Error in /api/analyze: {e}")
@@ -141,6 +229,7 @@ def analyze_text():
         }), 500
 
 @app.route('/api/chat', methods=['POST'])
+@admission_limited('chat')
 def chat():
     """
     Endpoint untuk chatbot film
@@ -208,15 +297,15 @@ def get_film_info():
                 "error": "Judul film tidak boleh kosong"
             }), 400
         
-        # Dapatkan informasi film
-        film_info = film_translator.get_film_details(title)
+        # Dapatkan informasi film (bytes JSON dari cache fragmen)
+        film_info, exact = film_translator.get_film_details_json(title)
         
-        if not film_info or "message" in film_info and "tidak ditemukan" in film_info["message"]:
+        if film_info is None or not exact:
             return jsonify({
                 "error": f"Film dengan judul '{title}' tidak ditemukan"
             }), 404
         
-        return jsonify(film_info)
+        return json_bytes_response(film_info)
     
     except Exception as e:
         print(f"Error in /api/film: {e}")
@@ -234,6 +323,8 @@ def get_films_by_genre():
     Query parameters:
     - name: nama genre
     - limit: jumlah maksimum film yang dikembalikan (opsional, default: 5)
+    - sort: urutan film: default, rating, year, popularity (opsional, default: default)
+    - cursor: cursor halaman berikutnya dari respons sebelumnya (opsional)
     
     Response JSON:
     {
@@ -245,28 +336,37 @@ def get_films_by_genre():
                 ...
             }
         ],
-        "count": "jumlah film"
+        "count": "jumlah film",
+        "total": "jumlah seluruh film dengan genre ini",
+        "next_cursor": "cursor halaman berikutnya atau null"
     }
     """
     try:
         # Ambil parameter dari query
         genre_name = request.args.get('name', '')
         limit = int(request.args.get('limit', '5'))
+        sort = request.args.get('sort', 'default')
+        cursor = request.args.get('cursor')
         
         if not genre_name:
             return jsonify({
                 "error": "Nama genre tidak boleh kosong"
             }), 400
         
-        # Dapatkan film berdasarkan genre
-        result = film_translator.get_films_by_genre(genre_name, limit)
+        # Dapatkan film berdasarkan genre (bytes JSON dari cache fragmen)
+        try:
+            result, count = film_translator.get_films_by_genre_json(genre_name, limit, sort, cursor)
+        except ValueError as e:
+            return jsonify({
+                "error": str(e)
+            }), 400
         
-        if not result["films"]:
+        if not count:
             return jsonify({
                 "error": f"Tidak ada film dengan genre '{genre_name}' yang ditemukan"
             }), 404
         
-        return jsonify(result)
+        return json_bytes_response(result)
     
     except Exception as e:
         print(f"Error in /api/genre: {e}")
@@ -276,21 +376,105 @@ def get_films_by_genre():
             "details": str(e)
         }), 500
 
+@app.route('/api/search', methods=['GET'])
+def search_films():
+    """
+    Endpoint pencarian film berfaset
+    
+    Query parameters:
+    - q: teks bebas yang dicari di judul, deskripsi, dan aktor film, misalnya "planet gurun" (opsional)
+    - genre: daftar genre dipisah koma, misalnya "Action,Sci-Fi" (opsional)
+    - genre_mode: all (film memiliki semua genre) atau any (salah satu genre) (opsional, default: all)
+    - year_min, year_max: rentang tahun rilis, inklusif (opsional)
+    - rating_min, rating_max: rentang rating, inklusif (opsional)
+    - duration_min: durasi minimal dalam menit, inklusif (opsional)
+    - duration_max: durasi maksimal dalam menit, eksklusif (opsional)
+    - sort: urutan film: relevance, rating, year, duration, default
+      (opsional, default: relevance jika ada q, selain itu rating)
+    - limit: jumlah maksimum film yang dikembalikan (opsional, default: 20)
+    - offset: jumlah film yang dilewati (opsional, default: 0)
+    
+    Response JSON:
+    {
+        "films": [
+            {
+                "title": "judul film",
+                ...
+            }
+        ],
+        "count": "jumlah film pada respons",
+        "total": "jumlah seluruh film yang cocok",
+        "facets": {
+            "genre": {"nama genre": "jumlah film"},
+            "decade": {"2010": "jumlah film"},
+            "rating": {"8": "jumlah film"},
+            "duration": {"120-150": "jumlah film"}
+        }
+    }
+    """
+    try:
+        # Ambil parameter dari query
+        try:
+            genres = [genre for genre in request.args.get('genre', '').split(',') if genre.strip()]
+            limit = optional_number('limit', int)
+            offset = optional_number('offset', int)
+            for name, value in (('limit', limit), ('offset', offset)):
+                if value is not None and value < 0:
+                    raise ValueError(f"Parameter '{name}' tidak boleh negatif")
+            
+            result = film_catalogue.search(
+                genres=genres,
+                genre_mode=request.args.get('genre_mode', 'all'),
+                year_min=optional_number('year_min'),
+                year_max=optional_number('year_max'),
+                rating_min=optional_number('rating_min'),
+                rating_max=optional_number('rating_max'),
+                duration_min=optional_number('duration_min'),
+                duration_max=optional_number('duration_max'),
+                query=request.args.get('q', '').strip() or None,
+                sort=request.args.get('sort'),
+                limit=20 if limit is None else limit,
+                offset=0 if offset is None else offset
+            )
+        except ValueError as e:
+            return jsonify({
+                "error": str(e)
+            }), 400
+        
+        # Data film diambil dari cache fragmen JSON translator
+        body = (b'{"films":' + film_translator.render_films_json(result['film_names'])
+                + b',"count":' + dumps_bytes(len(result['film_names']))
+                + b',"total":' + dumps_bytes(result['total'])
+                + b',"facets":' + dumps_bytes(result['facets']) + b'}')
+        
+        return json_bytes_response(body)
+    
+    except Exception as e:
+        print(f"Error in /api/search: {e}")
+        traceback.print_exc()
+        return jsonify({
+            "error": "Terjadi kesalahan saat memproses permintaan",
+            "details": str(e)
+        }), 500
+
 # Route untuk training model
 @app.route('/api/train', methods=['POST'])
+@admission_limited('train')
 def train_model():
     """
     Endpoint untuk melatih model secara manual
     
     Request JSON:
     {
-        "file_path": "path ke file training data (opsional)"
+        "file_path": "path ke file training data (opsional)",
+        "force": true/false (opsional, latih ulang walaupun data dan konfigurasi tidak berubah),
+        "verify": true/false (opsional, evaluasi ulang model jika training dilewati)
     }
     
     Response JSON:
     {
         "message": "hasil training",
-        "evaluation": {object}
+        "evaluation": {object, "retrained": true/false}
     }
     """
     try:
@@ -304,12 +488,15 @@ def train_model():
                 "error": f"File training data '{file_path}' tidak ditemukan"
             }), 404
         
-        # Latih model
-        evaluation = film_recommender.train_from_csv(file_path)
+        # Latih model (dilewati jika data, preprocessing, dan hyperparameter tidak berubah)
+        evaluation = film_recommender.train_from_csv(
+            file_path, force=bool(data.get('force', False)), verify=bool(data.get('verify', False))
+        )
         
         if evaluation:
             return jsonify({
-                "message": "Model berhasil dilatih",
+                "message": "Model berhasil dilatih" if evaluation.get('retrained', True)
+                           else "Data training tidak berubah, model yang ada tetap dipakai",
                 "evaluation": evaluation
             })
         else:
@@ -0,0 +1,461 @@
+"""
+Indeks approximate nearest neighbour (ANN) untuk vektor deskripsi film
+menggunakan random-projection LSH (cosine similarity)
+"""
+import os
+import numpy as np
+import joblib
+from scipy import sparse
+
+from backend.utils.preprocessor import preprocess_text
+
+def normalize_rows(vectors):
+    """
+    Menormalisasi setiap baris matrix sparse ke norma L2 = 1 (baris nol tetap nol)
+    
+    Parameters
+    ----------
+    vectors : scipy.sparse.csr_matrix
+        Matrix vektor
+    
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        Matrix vektor ternormalisasi
+    """
+    norms = np.sqrt(np.asarray(vectors.multiply(vectors).sum(axis=1)).ravel())
+    scale = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+    return (sparse.diags(scale.astype(vectors.dtype)) @ vectors).tocsr()
+
+class LSHIndex:
+    """
+    Indeks LSH berbasis random hyperplane untuk pencarian tetangga terdekat
+    secara cosine. Mendukung penambahan vektor secara bertahap.
+    
+    Recall dan latency diatur lewat tiga parameter:
+    - n_tables: lebih banyak tabel = recall naik, memori dan latency naik
+    - n_bits: lebih banyak bit = bucket lebih kecil, kandidat lebih sedikit
+    - n_probes: jumlah bucket tetangga (beda 1 bit) yang ikut diperiksa per tabel
+    
+    Untuk indeks kecil (di bawah `exact_threshold`) query langsung memakai
+    pencarian exact karena lebih cepat dan recall-nya sempurna.
+    """
+    
+    def __init__(self, n_features, n_tables=16, n_bits=10, n_probes=2, exact_threshold=1000,
+                 random_state=42):
+        """
+        Inisialisasi indeks LSH
+        
+        Parameters
+        ----------
+        n_features : int
+            Dimensi vektor
+        n_tables : int, optional
+            Jumlah tabel hash, by default 16
+        n_bits : int, optional
+            Jumlah bit (hyperplane) per tabel, maksimal 62, by default 10
+        n_probes : int, optional
+            Jumlah bucket tambahan yang diperiksa per tabel (multi-probe), by default 2
+        exact_threshold : int, optional
+            Batas jumlah vektor untuk memakai pencarian exact, by default 1000
+        random_state : int, optional
+            Seed untuk hyperplane acak, by default 42
+        """
+        if not 0 < n_bits <= 62:
+            raise ValueError("n_bits harus antara 1 dan 62")
+        
+        self.n_features = n_features
+        self.n_tables = n_tables
+        self.n_bits = n_bits
+        self.n_probes = n_probes
+        self.exact_threshold = exact_threshold
+        
+        rng = np.random.default_rng(random_state)
+        self.planes = rng.standard_normal((n_features, n_tables * n_bits)).astype(np.float32)
+        self.bit_weights = (1 << np.arange(n_bits, dtype=np.int64))
+        
+        # Setiap tabel memetakan kode hash -> list id internal
+        self.tables = [{} for _ in range(n_tables)]
+        
+        # Penyimpanan vektor untuk reranking exact
+        self.keys = []
+        self.key_positions = {}
+        self._pending_rows = []
+        self._matrix = sparse.csr_matrix((0, n_features), dtype=np.float32)
+    
+    def __len__(self):
+        return len(self.keys)
+    
+    def _projections(self, vectors):
+        """
+        Memproyeksikan vektor ke semua hyperplane
+        
+        Parameters
+        ----------
+        vectors : scipy.sparse matrix or numpy.ndarray
+            Matrix vektor (n, n_features)
+        
+        Returns
+        -------
+        numpy.ndarray
+            Matrix proyeksi (n, n_tables, n_bits)
+        """
+        projections = vectors @ self.planes
+        return np.asarray(projections).reshape(-1, self.n_tables, self.n_bits)
+    
+    def _hash_codes(self, projections):
+        """
+        Mengubah proyeksi menjadi kode hash per tabel
+        
+        Parameters
+        ----------
+        projections : numpy.ndarray
+            Matrix proyeksi (n, n_tables, n_bits)
+        
+        Returns
+        -------
+        numpy.ndarray
+            Kode hash (n, n_tables)
+        """
+        return (projections > 0).astype(np.int64) @ self.bit_weights
+    
+    def add(self, keys, vectors):
+        """
+        Menambahkan vektor baru ke indeks (bisa dipanggil berkali-kali)
+        
+        Parameters
+        ----------
+        keys : list
+            Kunci untuk setiap vektor (misalnya nama film)
+        vectors : scipy.sparse matrix
+            Matrix vektor (len(keys), n_features), sebaiknya sudah dinormalisasi L2
+        """
+        vectors = sparse.csr_matrix(vectors, dtype=np.float32)
+        codes = self._hash_codes(self._projections(vectors))
+        
+        for row, key in enumerate(keys):
+            if key in self.key_positions:
+                raise ValueError(f"Kunci '{key}' sudah ada di indeks")
+            
+            item_id = len(self.keys)
+            self.keys.append(key)
+            self.key_positions[key] = item_id
+            
+            for table, code in zip(self.tables, codes[row]):
+                table.setdefault(int(code), []).append(item_id)
+        
+        self._pending_rows.append(vectors)
+    
+    @property
+    def matrix(self):
+        """Matrix semua vektor di indeks (digabung saat dibutuhkan)"""
+        if self._pending_rows:
+            self._matrix = sparse.vstack([self._matrix] + self._pending_rows).tocsr()
+            self._pending_rows = []
+        return self._matrix
+    
+    def _probe_codes(self, codes, projections):
+        """
+        Menentukan kode bucket yang diperiksa per tabel: bucket utama ditambah
+        bucket yang berbeda satu bit pada bit dengan proyeksi paling dekat nol
+        
+        Parameters
+        ----------
+        codes : numpy.ndarray
+            Kode hash utama (n_tables,)
+        projections : numpy.ndarray
+            Proyeksi query (n_tables, n_bits)
+        
+        Returns
+        -------
+        list
+            List berisi list kode bucket untuk setiap tabel
+        """
+        n_probes = min(self.n_probes, self.n_bits)
+        if n_probes <= 0:
+            return [[int(code)] for code in codes]
+        
+        weakest_bits = np.argsort(np.abs(projections), axis=1)[:, :n_probes]
+        return [
+            [int(code)] + [int(code) ^ (1 << int(bit)) for bit in bits]
+            for code, bits in zip(codes, weakest_bits)
+        ]
+    
+    def candidates(self, vector):
+        """
+        Mengambil id kandidat dari bucket yang cocok dengan vektor query
+        
+        Parameters
+        ----------
+        vector : scipy.sparse matrix
+            Vektor query (1, n_features)
+        
+        Returns
+        -------
+        numpy.ndarray
+            Array id internal kandidat (unik)
+        """
+        projections = self._projections(vector)[0]
+        codes = self._hash_codes(projections[np.newaxis])[0]
+        
+        found = []
+        for table, table_codes in zip(self.tables, self._probe_codes(codes, projections)):
+            for code in table_codes:
+                bucket = table.get(code)
+                if bucket:
+                    found.extend(bucket)
+        
+        return np.unique(np.asarray(found, dtype=np.int64))
+    
+    def query(self, vector, k=10, exclude=None):
+        """
+        Mencari k tetangga terdekat (perkiraan) untuk sebuah vektor
+        
+        Parameters
+        ----------
+        vector : scipy.sparse matrix
+            Vektor query (1, n_features), sudah dinormalisasi L2
+        k : int, optional
+            Jumlah tetangga, by default 10
+        exclude : set, optional
+            Kunci yang tidak boleh muncul di hasil, by default None
+        
+        Returns
+        -------
+        list
+            List tuple (kunci, skor_cosine) terurut dari yang paling mirip
+        """
+        if len(self) <= self.exact_threshold:
+            return self.brute_force_query(vector, k=k, exclude=exclude)
+        
+        vector = sparse.csr_matrix(vector, dtype=np.float32)
+        candidate_ids = self.candidates(vector)
+        if exclude:
+            excluded_ids = [self.key_positions[key] for key in exclude if key in self.key_positions]
+            candidate_ids = np.setdiff1d(candidate_ids, excluded_ids, assume_unique=True)
+        
+        if candidate_ids.size == 0:
+            return []
+        
+        # Rerank kandidat dengan cosine similarity exact
+        scores = (self.matrix[candidate_ids] @ vector.T).toarray().ravel()
+        
+        k = min(k, scores.size)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        
+        return [(self.keys[candidate_ids[i]], float(scores[i])) for i in top]
+    
+    def brute_force_query(self, vector, k=10, exclude=None):
+        """
+        Pencarian exact ke semua vektor (untuk pembanding recall)
+        
+        Parameters
+        ----------
+        vector : scipy.sparse matrix
+            Vektor query (1, n_features), sudah dinormalisasi L2
+        k : int, optional
+            Jumlah tetangga, by default 10
+        exclude : set, optional
+            Kunci yang tidak boleh muncul di hasil, by default None
+        
+        Returns
+        -------
+        list
+            List tuple (kunci, skor_cosine) terurut dari yang paling mirip
+        """
+        vector = sparse.csr_matrix(vector, dtype=np.float32)
+        scores = (self.matrix @ vector.T).toarray().ravel()
+        
+        if exclude:
+            for key in exclude:
+                if key in self.key_positions:
+                    scores[self.key_positions[key]] = -np.inf
+        
+        k = min(k, scores.size)
+        if k <= 0:
+            return []
+        
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        
+        return [(self.keys[i], float(scores[i])) for i in top if np.isfinite(scores[i])]
+
+class FilmDescriptionIndex:
+    """
+    Indeks ANN untuk deskripsi film. Deskripsi diproses dengan
+    `preprocess_text` lalu di-hash ke vektor berdimensi tetap, sehingga film
+    baru dapat ditambahkan tanpa melatih ulang vocabulary.
+    """
+    
+    def __init__(self, n_features=2 ** 14, n_tables=16, n_bits=10, n_probes=2, index_path=None):
+        """
+        Inisialisasi indeks deskripsi film
+        
+        Parameters
+        ----------
+        n_features : int, optional
+            Dimensi vektor hashing, by default 2**14
+        n_tables : int, optional
+            Jumlah tabel LSH, by default 16
+        n_bits : int, optional
+            Jumlah bit per tabel LSH, by default 10
+        n_probes : int, optional
+            Jumlah bucket tambahan per tabel saat query, by default 2
+        index_path : str, optional
+            Path file indeks, by default 'models/film_ann_index.joblib'
+        """
+        self.index_path = index_path or os.path.join('models', 'film_ann_index.joblib')
+        self.n_features = n_features
+        self._vectorizer = None
+        self.index = LSHIndex(n_features, n_tables=n_tables, n_bits=n_bits, n_probes=n_probes)
+    
+    @property
+    def vectorizer(self):
+        """HashingVectorizer untuk teks baru, dibuat saat pertama kali dibutuhkan"""
+        if self._vectorizer is None:
+            # scikit-learn hanya diimpor saat teks di-vectorize, sehingga indeks
+            # tersimpan dapat dimuat dan dipakai untuk film yang ada tanpa scikit-learn
+            from sklearn.feature_extraction.text import HashingVectorizer
+            self._vectorizer = HashingVectorizer(
+                n_features=self.n_features,
+                token_pattern=r'\S+',
+                alternate_sign=False,
+                norm=None,
+                dtype=np.float32
+            )
+        return self._vectorizer
+    
+    def __getstate__(self):
+        # Vectorizer tidak ikut disimpan (dibuat ulang dari n_features)
+        state = dict(self.__dict__)
+        state['_vectorizer'] = None
+        return state
+    
+    def __setstate__(self, state):
+        # Indeks versi lama menyimpan objek vectorizer
+        state.pop('vectorizer', None)
+        state.setdefault('n_features', state['index'].n_features)
+        state.setdefault('_vectorizer', None)
+        self.__dict__.update(state)
+    
+    def vectorize(self, texts, preprocessed=False):
+        """
+        Mengubah teks menjadi vektor ternormalisasi L2
+        
+        Parameters
+        ----------
+        texts : list
+            List teks deskripsi
+        preprocessed : bool, optional
+            True jika teks sudah melalui `preprocess_text`, by default False
+        
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Matrix vektor (len(texts), n_features)
+        """
+        if not preprocessed:
+            texts = [preprocess_text(text) for text in texts]
+        
+        vectors = self.vectorizer.transform(texts)
+        # Skala logaritmik untuk term frequency
+        vectors.data = 1 + np.log(vectors.data)
+        return normalize_rows(vectors)
+    
+    def add_films(self, films_data):
+        """
+        Menambahkan film baru ke indeks; film yang sudah ada dilewati
+        
+        Parameters
+        ----------
+        films_data : dict
+            Dictionary berisi informasi film
+        
+        Returns
+        -------
+        int
+            Jumlah film yang ditambahkan
+        """
+        new_films = [name for name in films_data if name not in self.index.key_positions]
+        if not new_films:
+            return 0
+        
+        descriptions = [
+            f"{films_data[name].get('title', name)} {films_data[name].get('description', '')}"
+            for name in new_films
+        ]
+        self.index.add(new_films, self.vectorize(descriptions))
+        return len(new_films)
+    
+    def similar_films(self, film_name, k=5):
+        """
+        Mencari film dengan deskripsi paling mirip dengan film tertentu
+        
+        Parameters
+        ----------
+        film_name : str
+            Nama film yang sudah ada di indeks
+        k : int, optional
+            Jumlah film yang dikembalikan, by default 5
+        
+        Returns
+        -------
+        list
+            List tuple (nama_film, skor_kemiripan)
+        """
+        position = self.index.key_positions.get(film_name)
+        if position is None:
+            return []
+        
+        return self.index.query(self.index.matrix[position], k=k, exclude={film_name})
+    
+    def search(self, text, k=5):
+        """
+        Mencari film dengan deskripsi paling mirip dengan teks bebas
+        
+        Parameters
+        ----------
+        text : str
+            Teks deskripsi dari pengguna
+        k : int, optional
+            Jumlah film yang dikembalikan, by default 5
+        
+        Returns
+        -------
+        list
+            List tuple (nama_film, skor_kemiripan)
+        """
+        return self.index.query(self.vectorize([text]), k=k)
+    
+    def save(self):
+        """
+        Menyimpan indeks ke file
+        """
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        joblib.dump(self, self.index_path)
+        print(f"Indeks ANN film berhasil disimpan ke {self.index_path}")
+    
+    @classmethod
+    def load(cls, index_path=None):
+        """
+        Memuat indeks dari file
+        
+        Parameters
+        ----------
+        index_path : str, optional
+            Path file indeks, by default 'models/film_ann_index.joblib'
+        
+        Returns
+        -------
+        FilmDescriptionIndex or None
+            Indeks yang dimuat, atau None jika gagal
+        """
+        index_path = index_path or os.path.join('models', 'film_ann_index.joblib')
+        try:
+            film_index = joblib.load(index_path)
+            film_index.index_path = index_path
+            return film_index
+        except Exception as e:
+            print(f"Gagal memuat indeks ANN film: {e}")
+            return None
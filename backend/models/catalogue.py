@@ -0,0 +1,479 @@
+"""
+Representasi kolumnar katalog film untuk pencarian berfaset (faceted search)
+"""
+from difflib import get_close_matches
+import numpy as np
+from scipy import sparse
+
+from backend.models.storage import NUMERIC_FIELDS, numeric_values
+
+# Batas bucket durasi (menit) untuk faset durasi
+DURATION_BUCKETS = (90, 120, 150)
+
+# Jika proporsi film hasil filter di bawah batas ini, faset dihitung dengan
+# mengumpulkan baris faset film tersebut; selebihnya dengan perkalian matrix
+GATHER_THRESHOLD = 0.02
+
+# Pilihan urutan hasil pencarian
+SEARCH_SORT_OPTIONS = ('relevance', 'rating', 'year', 'duration', 'default')
+
+class FilmCatalogue:
+    """
+    Katalog film dalam bentuk kolom NumPy: tahun, rating, dan durasi sebagai
+    array, serta genre sebagai bitset per film. Filter faset dievaluasi
+    sebagai mask vektor sehingga tidak perlu menelusuri dictionary film.
+    """
+    
+    def __init__(self, films_data, text_index=None, genre_index=None, columns=None):
+        """
+        Membangun katalog kolumnar dari data film
+        
+        Parameters
+        ----------
+        films_data : Mapping
+            Mapping nama film -> data film. Jika genre_index dan columns
+            diberikan, hanya nama filmnya yang dibaca
+        text_index : FullTextIndex, optional
+            Index full-text BM25 dari database film yang sama, untuk
+            pencarian teks bebas, by default None
+        genre_index : dict, optional
+            Indeks genre -> list nama film, by default None (dibangun dari films_data)
+        columns : dict, optional
+            Kolom numerik per field NUMERIC_FIELDS sesuai urutan films_data,
+            by default None (dibangun dari films_data)
+        """
+        self.film_names = list(films_data.keys())
+        self.film_positions = {name: i for i, name in enumerate(self.film_names)}
+        n_films = len(self.film_names)
+        
+        # Posisi katalog untuk setiap id film di index full-text
+        self.text_index = text_index
+        if text_index is not None:
+            self._text_positions = np.array(
+                [self.film_positions[name] for name in text_index.film_names], dtype=np.int64
+            )
+        
+        # Indeks genre -> film; urutan genre sesuai urutan kemunculan
+        if genre_index is None:
+            genre_index = {}
+            for film_name, film_data in films_data.items():
+                for genre in film_data.get("genre", []):
+                    genre_index.setdefault(genre, []).append(film_name)
+        self.genre_names = list(genre_index)
+        self.genre_positions = {genre: i for i, genre in enumerate(self.genre_names)}
+        self._genre_lookup = {genre.lower(): genre for genre in self.genre_names}
+        
+        # Posisi film untuk setiap genre
+        genre_films = [
+            np.fromiter((self.film_positions[name] for name in genre_index[genre]), dtype=np.int64)
+            for genre in self.genre_names
+        ]
+        
+        # Kolom numerik; nilai yang tidak diketahui disimpan sebagai NaN
+        if columns is None:
+            columns = {
+                field: numeric_values(film_data.get(field) for film_data in films_data.values())
+                for field in NUMERIC_FIELDS
+            }
+        self.years = np.asarray(columns['release_year'], dtype=np.float32)
+        self.ratings = np.asarray(columns['rating'], dtype=np.float32)
+        self.durations = np.asarray(columns['duration'], dtype=np.float32)
+        
+        # Bitset genre: satu word uint64 untuk setiap 64 genre
+        n_words = max(1, (len(self.genre_names) + 63) // 64)
+        self.genre_bits = np.zeros((n_films, n_words), dtype=np.uint64)
+        
+        for position, films in enumerate(genre_films):
+            self.genre_bits[films, position // 64] |= np.uint64(1 << (position % 64))
+        
+        # Matrix faset x film (genre, dekade, rating, durasi) untuk menghitung
+        # semua faset dengan satu perkalian matrix sparse
+        self.facet_labels, self.facet_matrix = self._build_facet_matrix(genre_films)
+        self._film_facets = self.facet_matrix.T.tocsr()
+        self._total_counts = self._count_rows(np.arange(n_films))
+        
+        # Kunci urutan (nilai kosong diletakkan di akhir) dan urutan seluruh katalog
+        self._sort_keys = {
+            sort: np.nan_to_num(column, nan=-np.inf)
+            for sort, column in (('rating', self.ratings), ('year', self.years), ('duration', self.durations))
+        }
+        self._sort_orders = {
+            sort: np.lexsort((np.arange(n_films), -keys))
+            for sort, keys in self._sort_keys.items()
+        }
+    
+    @classmethod
+    def from_store(cls, film_store, text_index=None):
+        """
+        Membangun katalog dari indeks genre dan kolom numerik penyimpanan
+        film, tanpa membaca data film satu per satu
+        
+        Parameters
+        ----------
+        film_store : FilmStore
+            Penyimpanan film
+        text_index : FullTextIndex, optional
+            Index full-text BM25 dari database film yang sama, by default None
+        
+        Returns
+        -------
+        FilmCatalogue
+            Katalog kolumnar
+        """
+        columns = {field: film_store.numeric_column(field) for field in NUMERIC_FIELDS}
+        return cls(film_store.index_records(), text_index=text_index,
+                   genre_index=film_store.genre_index(), columns=columns)
+    
+    def _build_facet_matrix(self, genre_films):
+        """
+        Membangun matrix insidensi faset x film
+        
+        Parameters
+        ----------
+        genre_films : list
+            Posisi film (numpy.ndarray) untuk setiap genre sesuai urutan genre_names
+        
+        Returns
+        -------
+        tuple
+            (list pasangan (nama faset, label), scipy.sparse.csr_matrix faset x film)
+        """
+        n_films = len(self.film_names)
+        known_years = ~np.isnan(self.years)
+        known_ratings = ~np.isnan(self.ratings)
+        known_durations = ~np.isnan(self.durations)
+        
+        decades = (self.years[known_years] // 10 * 10).astype(np.int64)
+        ratings = np.clip(self.ratings[known_ratings], 0, 10).astype(np.int64)
+        durations = np.searchsorted(DURATION_BUCKETS, self.durations[known_durations], side='right')
+        duration_labels = [f"<{DURATION_BUCKETS[0]}"] + [
+            f"{low}-{high}" for low, high in zip(DURATION_BUCKETS, DURATION_BUCKETS[1:])
+        ] + [f">={DURATION_BUCKETS[-1]}"]
+        
+        labels = [('genre', genre) for genre in self.genre_names]
+        
+        # Faset genre
+        rows = [np.full(len(films), position, dtype=np.int64) for position, films in enumerate(genre_films)]
+        cols = list(genre_films)
+        
+        # Faset numerik: nilai bucket per film diubah menjadi baris faset
+        for facet, known, values, names in (
+            ('decade', known_years, decades, None),
+            ('rating', known_ratings, ratings, None),
+            ('duration', known_durations, durations, duration_labels)
+        ):
+            buckets, codes = np.unique(values, return_inverse=True)
+            rows.append(codes.ravel() + len(labels))
+            cols.append(np.flatnonzero(known))
+            labels.extend((facet, names[bucket] if names else str(bucket)) for bucket in buckets)
+        
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+        matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float32), (rows, cols)),
+            shape=(len(labels), n_films)
+        )
+        # Genre yang tercatat dua kali pada satu film tetap dihitung sekali
+        matrix.sum_duplicates()
+        matrix.data[:] = 1.0
+        
+        return labels, matrix
+    
+    def __len__(self):
+        return len(self.film_names)
+    
+    def resolve_genre(self, genre):
+        """
+        Mencari nama genre di katalog (tidak peka huruf besar/kecil, toleran typo)
+        
+        Parameters
+        ----------
+        genre : str
+            Nama genre dari pengguna
+        
+        Returns
+        -------
+        str
+            Nama genre di katalog
+        
+        Raises
+        ------
+        ValueError
+            Jika genre tidak ditemukan
+        """
+        key = genre.strip().lower()
+        if key in self._genre_lookup:
+            return self._genre_lookup[key]
+        
+        matches = get_close_matches(key, list(self._genre_lookup), n=1, cutoff=0.7)
+        if matches:
+            return self._genre_lookup[matches[0]]
+        
+        raise ValueError(f"Genre '{genre}' tidak ditemukan")
+    
+    def _genre_mask(self, genres, mode):
+        """
+        Membuat mask film berdasarkan genre menggunakan operasi bitset
+        
+        Parameters
+        ----------
+        genres : list
+            Daftar nama genre di katalog
+        mode : str
+            'all' jika film harus memiliki semua genre, 'any' jika cukup salah satu
+        
+        Returns
+        -------
+        numpy.ndarray
+            Mask boolean per film
+        """
+        required = np.zeros(self.genre_bits.shape[1], dtype=np.uint64)
+        for genre in genres:
+            position = self.genre_positions[genre]
+            required[position // 64] |= np.uint64(1 << (position % 64))
+        
+        mask = None
+        for word in np.flatnonzero(required):
+            matched = self.genre_bits[:, word] & required[word]
+            word_mask = matched == required[word] if mode == 'all' else matched != 0
+            
+            if mask is None:
+                mask = word_mask
+            elif mode == 'all':
+                mask &= word_mask
+            else:
+                mask |= word_mask
+        
+        return mask
+    
+    @staticmethod
+    def _range_mask(mask, column, minimum, maximum, inclusive_max=True):
+        """
+        Menerapkan filter rentang pada sebuah kolom
+        
+        Parameters
+        ----------
+        mask : numpy.ndarray or None
+            Mask yang sudah ada
+        column : numpy.ndarray
+            Kolom numerik
+        minimum : float or None
+            Batas bawah (inklusif)
+        maximum : float or None
+            Batas atas
+        inclusive_max : bool, optional
+            True jika batas atas inklusif, by default True
+        
+        Returns
+        -------
+        numpy.ndarray or None
+            Mask gabungan
+        """
+        for bound, check in ((minimum, np.greater_equal),
+                             (maximum, np.less_equal if inclusive_max else np.less)):
+            if bound is None:
+                continue
+            bound_mask = check(column, bound)
+            mask = bound_mask if mask is None else mask & bound_mask
+        return mask
+    
+    def search(self, genres=None, genre_mode='all', year_min=None, year_max=None,
+               rating_min=None, rating_max=None, duration_min=None, duration_max=None,
+               query=None, sort=None, limit=20, offset=0):
+        """
+        Mencari film dengan filter faset dan menghitung jumlah per faset
+        
+        Parameters
+        ----------
+        genres : list, optional
+            Daftar genre, by default None
+        genre_mode : str, optional
+            'all' (semua genre) atau 'any' (salah satu genre), by default 'all'
+        year_min, year_max : int, optional
+            Rentang tahun rilis (inklusif)
+        rating_min, rating_max : float, optional
+            Rentang rating (inklusif)
+        duration_min : int, optional
+            Durasi minimal dalam menit (inklusif)
+        duration_max : int, optional
+            Durasi maksimal dalam menit (eksklusif, misalnya "durasi < 150")
+        query : str, optional
+            Teks bebas yang dicari di judul, deskripsi, dan aktor, by default None
+        sort : str, optional
+            Urutan hasil: 'relevance', 'rating', 'year', 'duration', atau 'default',
+            by default 'relevance' jika ada query, selain itu 'rating'
+        limit : int, optional
+            Jumlah film yang dikembalikan, by default 20
+        offset : int, optional
+            Jumlah film yang dilewati, by default 0
+        
+        Returns
+        -------
+        dict
+            Dictionary berisi 'total', 'film_names', dan 'facets'
+        
+        Raises
+        ------
+        ValueError
+            Jika genre, mode, atau urutan tidak valid
+        """
+        sort = sort or ('relevance' if query else 'rating')
+        if genre_mode not in ('all', 'any'):
+            raise ValueError("genre_mode harus 'all' atau 'any'")
+        if sort not in SEARCH_SORT_OPTIONS:
+            raise ValueError(f"Urutan '{sort}' tidak dikenal. Pilihan: {', '.join(SEARCH_SORT_OPTIONS)}")
+        
+        mask = None
+        if genres:
+            mask = self._genre_mask([self.resolve_genre(genre) for genre in genres], genre_mode)
+        
+        mask = self._range_mask(mask, self.years, year_min, year_max)
+        mask = self._range_mask(mask, self.ratings, rating_min, rating_max)
+        mask = self._range_mask(mask, self.durations, duration_min, duration_max, inclusive_max=False)
+        
+        if query:
+            if self.text_index is None:
+                raise ValueError("Pencarian teks tidak tersedia")
+            text_mask = np.zeros(len(self.film_names), dtype=bool)
+            text_mask[self._text_positions[self.text_index.match_ids(query)]] = True
+            mask = text_mask if mask is None else mask & text_mask
+        elif sort == 'relevance':
+            raise ValueError("Urutan 'relevance' membutuhkan teks pencarian")
+        
+        matched = np.arange(len(self.film_names)) if mask is None else np.flatnonzero(mask)
+        if sort == 'relevance':
+            top = self._top_by_relevance(query, mask, limit, offset)
+        else:
+            top = self._top_films(matched, sort, limit, offset, filtered=mask is not None)
+        
+        return {
+            'total': int(matched.size),
+            'film_names': [self.film_names[i] for i in top],
+            'facets': self._facets(mask, matched)
+        }
+    
+    def _top_by_relevance(self, query, mask, limit, offset):
+        """
+        Mengambil satu halaman film dengan skor BM25 tertinggi di antara film hasil filter
+        
+        Parameters
+        ----------
+        query : str
+            Teks pencarian
+        mask : numpy.ndarray
+            Mask boolean hasil filter (sudah termasuk film yang cocok dengan query)
+        limit : int
+            Jumlah film per halaman
+        offset : int
+            Jumlah film yang dilewati
+        
+        Returns
+        -------
+        numpy.ndarray
+            Indeks film pada halaman yang diminta
+        """
+        offset = max(offset, 0)
+        if limit <= 0:
+            return np.empty(0, dtype=np.int64)
+        
+        text_ids, _ = self.text_index.search_ids(query, offset + limit, allowed=mask[self._text_positions])
+        return self._text_positions[text_ids[offset:]]
+    
+    def _top_films(self, matched, sort, limit, offset, filtered=True):
+        """
+        Mengambil satu halaman film teratas dari hasil filter
+        
+        Parameters
+        ----------
+        matched : numpy.ndarray
+            Indeks film yang lolos filter
+        sort : str
+            Urutan hasil
+        limit : int
+            Jumlah film per halaman
+        offset : int
+            Jumlah film yang dilewati
+        filtered : bool, optional
+            False jika semua film lolos filter, by default True
+        
+        Returns
+        -------
+        numpy.ndarray
+            Indeks film pada halaman yang diminta
+        """
+        offset = max(offset, 0)
+        end = offset + limit
+        if limit <= 0 or offset >= matched.size:
+            return matched[:0]
+        
+        if sort == 'default':
+            return matched[offset:end]
+        
+        # Tanpa filter, urutan seluruh katalog sudah tersedia
+        if not filtered:
+            return self._sort_orders[sort][offset:end]
+        
+        keys = self._sort_keys[sort][matched]
+        
+        # Hanya end teratas yang perlu diurutkan
+        if end < matched.size:
+            top = np.argpartition(-keys, end - 1)[:end]
+        else:
+            top = np.arange(matched.size)
+        top = top[np.lexsort((matched[top], -keys[top]))]
+        
+        return matched[top[offset:end]]
+    
+    def _count_rows(self, film_ids):
+        """
+        Menghitung faset dengan mengumpulkan baris faset film yang dipilih.
+        Lebih cepat daripada perkalian matrix jika film yang dipilih sedikit.
+        
+        Parameters
+        ----------
+        film_ids : numpy.ndarray
+            Indeks film
+        
+        Returns
+        -------
+        numpy.ndarray
+            Jumlah film per baris faset
+        """
+        indptr = self._film_facets.indptr
+        starts = indptr[film_ids]
+        lengths = indptr[film_ids + 1] - starts
+        
+        # Posisi setiap entri faset milik film yang dipilih dalam array indices
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        
+        return np.bincount(self._film_facets.indices[offsets], minlength=len(self.facet_labels))
+    
+    def _facets(self, mask, matched):
+        """
+        Menghitung jumlah film per faset untuk hasil filter
+        
+        Parameters
+        ----------
+        mask : numpy.ndarray or None
+            Mask boolean hasil filter, None jika tanpa filter
+        matched : numpy.ndarray
+            Indeks film yang lolos filter
+        
+        Returns
+        -------
+        dict
+            Faset genre, dekade, rating (dibulatkan ke bawah), dan durasi
+        """
+        if mask is None:
+            counts = self._total_counts
+        elif matched.size <= GATHER_THRESHOLD * len(self.film_names):
+            counts = self._count_rows(matched)
+        else:
+            counts = self.facet_matrix @ mask.astype(np.float32)
+        
+        facets = {'genre': {}, 'decade': {}, 'rating': {}, 'duration': {}}
+        for row in np.flatnonzero(counts):
+            facet, label = self.facet_labels[row]
+            facets[facet][label] = int(counts[row])
+        
+        return facets
@@ -2,21 +2,87 @@
 Chatbot sederhana untuk menjawab pertanyaan tentang film
 """
 import os
-import json
 import re
 import numpy as np
+from functools import cached_property
 from backend.utils.preprocessor import preprocess_text
+from backend.models.similarity import FilmSimilarity
+from backend.models.fulltext import FullTextIndex
+from backend.models.link_graph import RecommendationGraph
+from backend.models.storage import open_film_store, load_faq_data
 from difflib import get_close_matches
 from difflib import SequenceMatcher
 
+# Skor BM25 minimal agar hasil pencarian deskripsi dianggap relevan
+FULLTEXT_MIN_SCORE = 1.5
+
+class MessageAnalysis:
+    """
+    Hasil analisis satu pesan pengguna dalam satu request.
+    
+    Setiap atribut dihitung saat pertama kali dibutuhkan lalu disimpan,
+    sehingga semua cabang di `FilmChatbot.get_response` berbagi hasil
+    pencocokan yang sama tanpa mengulang proses fuzzy matching.
+    """
+    
+    def __init__(self, chatbot, text):
+        """
+        Inisialisasi analisis pesan
+        
+        Parameters
+        ----------
+        chatbot : FilmChatbot
+            Chatbot yang menyediakan data film, genre, dan pola pertanyaan
+        text : str
+            Teks pesan dari pengguna
+        """
+        self.chatbot = chatbot
+        self.text = text
+    
+    @cached_property
+    def text_lower(self):
+        """Teks pesan dalam huruf kecil"""
+        return self.text.lower()
+    
+    @cached_property
+    def words(self):
+        """Token kata dari teks pesan"""
+        return self.text_lower.split()
+    
+    @cached_property
+    def question_type(self):
+        """Tipe pertanyaan ('rekomendasi', 'informasi', 'genre', dll)"""
+        return self.chatbot._get_question_type(self)
+    
+    @cached_property
+    def film_match(self):
+        """Tuple (nama_film, score_kecocokan) terbaik untuk pesan ini"""
+        return self.chatbot._find_film_name(self)
+    
+    @cached_property
+    def film_matches(self):
+        """List nama film yang disebut dalam pesan, sesuai urutan kemunculan"""
+        return self.chatbot._find_film_names(self)
+    
+    @cached_property
+    def genre_match(self):
+        """Tuple (nama_genre, score_kecocokan) terbaik untuk pesan ini"""
+        return self.chatbot._find_genre_name(self)
+
 class FilmChatbot:
     """
     Kelas untuk chatbot sederhana yang menjawab pertanyaan tentang film
     """
     
-    def __init__(self):
+    def __init__(self, film_store=None):
         """
         Inisialisasi chatbot
+        
+        Parameters
+        ----------
+        film_store : FilmStore, optional
+            Penyimpanan film yang dipakai bersama komponen lain, by default None
+            (dibuka sesuai konfigurasi)
         """
         # Path ke file data film
         self.films_data_path = os.path.join('data', 'films.json')
@@ -24,12 +90,48 @@ class FilmChatbot:
         self.faq_data_path = os.path.join('data', 'faq_films.json')
         
         # Muat data film
+        self.film_store = film_store
         self.films_data = self._load_films_data()
         # Muat data FAQ
         self.faq_data = self._load_faq_data()
 
+        # Snapshot katalog sudah menyimpan sinonim dan daftar genre yang jadi
+        index_records = self.film_store.index_records()
+        
         # Siapkan kamus sinonim film untuk meningkatkan pengenalan
-        self.film_synonyms = self._prepare_film_synonyms()
+        self.film_synonyms = self.film_store.film_synonyms()
+        if self.film_synonyms is None:
+            self.film_synonyms = self.prepare_film_synonyms(index_records, self.faq_data)
+        
+        # Satu pola regex untuk semua nama dan sinonim film, agar semua film
+        # dalam pesan ("film seperti A dan B") ditemukan dalam satu kali pemindaian
+        self.film_mention_pattern, self.film_mention_names = self.compile_film_mentions(
+            self.films_data.keys(), self.film_synonyms
+        )
+        
+        # Kumpulkan daftar genre sekali saja agar tidak dibangun ulang setiap pesan
+        self.all_genres = self.film_store.all_genres()
+        if self.all_genres is None:
+            self.all_genres = self.collect_genres(index_records, self.faq_data)
+        
+        # Tabel tetangga terdekat berbasis konten untuk pertanyaan "film seperti X"
+        self.similarity = FilmSimilarity(self.films_data)
+        if not self.similarity.is_ready():
+            print("Tabel kemiripan film tidak ditemukan. Membangun tabel...")
+            self.similarity.build()
+        
+        # Graf tautan rekomendasi (random walk with restart) untuk rekomendasi beberapa lompatan
+        self.link_graph = RecommendationGraph(self.films_data)
+        if not self.link_graph.is_ready():
+            print("Graf rekomendasi film tidak ditemukan. Membangun graf...")
+            self.link_graph.build()
+        
+        # Index full-text BM25 untuk pertanyaan berupa deskripsi cerita film
+        # (penyimpanan SQLite memakai index FTS5 miliknya sendiri)
+        self.fulltext = self.film_store.text_index() or FullTextIndex(self.films_data)
+        if not self.fulltext.is_ready():
+            print("Index full-text film tidak ditemukan. Membangun index...")
+            self.fulltext.build()
         
         # Pattern untuk mendeteksi tipe pertanyaan
         self.question_patterns = {
@@ -90,78 +192,46 @@ class FilmChatbot:
     
     def _load_films_data(self):
         """
-        Memuat data film dari JSON
+        Memuat data film dari penyimpanan yang dikonfigurasi (FILM_STORAGE:
+        file JSON, snapshot katalog, atau SQLite). Jika file JSON tidak ada,
+        akan dibuat data contoh.
         
         Returns
         -------
-        dict
-            Dictionary berisi informasi film
-        """
-        try:
-            with open(self.films_data_path, 'r', encoding='utf-8') as file:
-                return json.load(file)
-        except (FileNotFoundError, json.JSONDecodeError):
-            # Buat contoh data default jika file tidak ditemukan
-            default_data = {
-                "Dune": {
-                    "title": "Dune",
-                    "release_year": 2021,
-                    "director": "Denis Villeneuve",
-                    "genre": ["Sci-Fi", "Action", "Adventure", "Drama"],
-                    "description": "Film yang mengadaptasi novel fiksi ilmiah terkenal karya Frank Herbert.",
-                    "rating": 8.0,
-                    "recommendations": ["Blade Runner 2049", "Arrival", "Interstellar"]
-                }
-            }
-            
-            # Simpan data default
-            os.makedirs(os.path.dirname(self.films_data_path), exist_ok=True)
-            with open(self.films_data_path, 'w', encoding='utf-8') as file:
-                json.dump(default_data, file, ensure_ascii=False, indent=4)
-            
-            return default_data
+        Mapping
+            Mapping nama film -> informasi film; untuk SQLite dan snapshot
+            data film dibaca saat dibutuhkan
+        """
+        if self.film_store is None:
+            self.film_store = open_film_store(json_path=self.films_data_path, faq_path=self.faq_data_path)
+        return self.film_store.films
     
     def _load_faq_data(self):
         """
-        Memuat data FAQ dari JSON
+        Memuat data FAQ dari snapshot katalog atau dari JSON
         
         Returns
         -------
         dict
             Dictionary berisi pertanyaan dan jawaban umum
         """
-        try:
-            with open(self.faq_data_path, 'r', encoding='utf-8') as file:
-                return json.load(file)
-        except (FileNotFoundError, json.JSONDecodeError):
-            # Buat contoh data default jika file tidak ditemukan
-            default_data = {
-                "umum": {
-                    "rekomendasi film action terbaru": "Beberapa film action terbaru yang direkomendasikan termasuk 'John Wick: Chapter 4', 'The Equalizer 3', dan 'Fast X'."
-                },
-                "genre_info": {
-                    "Action": "Genre film dengan penekanan pada adegan kekerasan atau fisik seperti perkelahian, adegan kejar-kejaran, atau aksi ketangkasan."
-                },
-                "film_detail": {
-                    "Dune": [
-                        "film tentang planet gurun",
-                        "film adaptasi novel",
-                        "film denis villeneuve"
-                    ]
-                }
-            }
-            
-            # Simpan data default
-            os.makedirs(os.path.dirname(self.faq_data_path), exist_ok=True)
-            with open(self.faq_data_path, 'w', encoding='utf-8') as file:
-                json.dump(default_data, file, ensure_ascii=False, indent=4)
-            
-            return default_data
+        faq_data = self.film_store.faq_data()
+        if faq_data is None:
+            faq_data = load_faq_data(self.faq_data_path)
+        return faq_data
     
-    def _prepare_film_synonyms(self):
+    @staticmethod
+    def prepare_film_synonyms(films_data, faq_data):
         """
         Menyiapkan kamus sinonim untuk film
         
+        Parameters
+        ----------
+        films_data : Mapping
+            Mapping nama film -> data film
+        faq_data : dict
+            Data FAQ chatbot
+        
         Returns
         -------
         dict
@@ -170,11 +240,11 @@ class FilmChatbot:
         synonyms = {}
         
         # Menggunakan data dari faq_data untuk informasi alternatif film
-        film_details = self.faq_data.get('film_detail', {})
+        film_details = faq_data.get('film_detail', {})
         
         for film_name, alt_names in film_details.items():
             # Pastikan film ada di database
-            if film_name in self.films_data:
+            if film_name in films_data:
                 # Tambahkan nama asli ke daftar sinonim
                 if film_name not in synonyms:
                     synonyms[film_name] = set()
@@ -184,29 +254,104 @@ class FilmChatbot:
                     synonyms[film_name].add(alt_name)
                 
                 # Tambahkan judul film dari data film
-                film_data = self.films_data[film_name]
+                film_data = films_data[film_name]
                 title = film_data.get('title', '')
                 if title and title != film_name:
                     synonyms[film_name].add(title.lower())
         
         return synonyms
     
-    def _find_film_name(self, text):
+    @staticmethod
+    def compile_film_mentions(film_names, film_synonyms):
         """
-        Mencari nama film dalam teks
+        Menyusun pola regex untuk semua nama dan sinonim film
+        
+        Parameters
+        ----------
+        film_names : iterable
+            Nama film di database
+        film_synonyms : dict
+            Dictionary nama film -> alternatif nama
+        
+        Returns
+        -------
+        tuple
+            (pola regex atau None jika tidak ada film, dictionary teks huruf kecil -> nama film)
+        """
+        mention_names = {}
+        for film_name, synonyms in film_synonyms.items():
+            for synonym in synonyms:
+                mention_names.setdefault(synonym.lower(), film_name)
+        # Nama film asli didahulukan dari sinonim yang sama
+        for film_name in film_names:
+            mention_names[film_name.lower()] = film_name
+        
+        if not mention_names:
+            return None, mention_names
+        
+        # Teks terpanjang dicoba lebih dulu agar "dune part two" tidak terbaca sebagai "dune"
+        alternatives = "|".join(re.escape(mention) for mention in sorted(mention_names, key=len, reverse=True))
+        return re.compile(rf"(?<!\w)(?:{alternatives})(?!\w)"), mention_names
+    
+    @staticmethod
+    def collect_genres(films_data, faq_data):
+        """
+        Mengumpulkan semua genre unik (huruf kecil) dari database film dan FAQ
+        
+        Parameters
+        ----------
+        films_data : Mapping
+            Mapping nama film -> data film
+        faq_data : dict
+            Data FAQ chatbot
+        
+        Returns
+        -------
+        list
+            Daftar genre unik sesuai urutan kemunculannya
+        """
+        all_genres = {}
+        for film_data in films_data.values():
+            for genre in film_data.get('genre', []):
+                all_genres.setdefault(genre.lower(), None)
+        
+        # Tambahkan genre dari FAQ
+        for genre in faq_data.get('genre_info', {}).keys():
+            all_genres.setdefault(genre.lower(), None)
+        
+        return list(all_genres)
+    
+    def analyze_message(self, text):
+        """
+        Membuat objek analisis untuk satu pesan pengguna
         
         Parameters
         ----------
         text : str
-            Teks yang akan dicari
+            Teks pesan dari pengguna
+        
+        Returns
+        -------
+        MessageAnalysis
+            Analisis pesan yang dievaluasi secara lazy dan di-memoize
+        """
+        return MessageAnalysis(self, text)
+    
+    def _find_film_name(self, message):
+        """
+        Mencari nama film dalam pesan
+        
+        Parameters
+        ----------
+        message : MessageAnalysis
+            Analisis pesan yang akan dicari
             
         Returns
         -------
         tuple
             (nama_film, score_kecocokan)
         """
-        # Preprocessing teks
-        text_lower = text.lower()
+        text_lower = message.text_lower
         
         # Cek kecocokan langsung dengan nama film dalam database
         for film_name in self.films_data.keys():
@@ -222,7 +367,7 @@ class FilmChatbot:
         # Jika tidak ada kecocokan langsung, cari yang paling mirip
         best_match = None
         best_score = 0
-        words = text_lower.split()
+        words = message.words
         
         # Cek kecocokan dengan setiap word (untuk mendeteksi sebagian nama film)
         for film_name in self.films_data.keys():
@@ -242,47 +387,56 @@ class FilmChatbot:
                 best_match = film_name
                 best_score = score
         
-        return best_match, best_score if best_match else (None, 0)
+        return (best_match, best_score) if best_match else (None, 0)
     
-    def _find_genre_name(self, text):
+    def _find_film_names(self, message):
         """
-        Mencari nama genre dalam teks
+        Mencari semua nama film (atau sinonimnya) yang disebut dalam pesan
         
         Parameters
         ----------
-        text : str
-            Teks yang akan dicari
+        message : MessageAnalysis
+            Analisis pesan yang akan dicari
+        
+        Returns
+        -------
+        list
+            Nama film tanpa duplikat, sesuai urutan kemunculan dalam pesan
+        """
+        if self.film_mention_pattern is None:
+            return []
+        
+        mentions = self.film_mention_pattern.finditer(message.text_lower)
+        return list(dict.fromkeys(self.film_mention_names[match.group(0)] for match in mentions))
+    
+    def _find_genre_name(self, message):
+        """
+        Mencari nama genre dalam pesan
+        
+        Parameters
+        ----------
+        message : MessageAnalysis
+            Analisis pesan yang akan dicari
             
         Returns
         -------
         tuple
             (nama_genre, score_kecocokan)
         """
-        # Preprocessing teks
-        text_lower = text.lower()
-        
-        # Kumpulkan semua genre unik dari database film
-        all_genres = set()
-        for film_data in self.films_data.values():
-            genres = film_data.get('genre', [])
-            all_genres.update([g.lower() for g in genres])
-        
-        # Tambahkan genre dari FAQ
-        genre_info = self.faq_data.get('genre_info', {})
-        all_genres.update([g.lower() for g in genre_info.keys()])
+        text_lower = message.text_lower
         
         # Cek kecocokan langsung dengan nama genre
-        for genre in all_genres:
-            if genre.lower() in text_lower:
+        for genre in self.all_genres:
+            if genre in text_lower:
                 return genre, 1.0
         
         # Jika tidak ada kecocokan langsung, cari yang paling mirip
         best_match = None
         best_score = 0
-        words = text_lower.split()
+        words = message.words
         
         # Cek kecocokan dengan setiap word
-        for genre in all_genres:
+        for genre in self.all_genres:
             genre_lower = genre.lower()
             
             # Hitung skor kesamaan menggunakan SequenceMatcher
@@ -299,23 +453,23 @@ class FilmChatbot:
                 best_match = genre
                 best_score = score
         
-        return best_match, best_score if best_match else (None, 0)
+        return (best_match, best_score) if best_match else (None, 0)
     
-    def _get_question_type(self, text):
+    def _get_question_type(self, message):
         """
         Menentukan tipe pertanyaan berdasarkan pola regex
         
         Parameters
         ----------
-        text : str
-            Teks pertanyaan
+        message : MessageAnalysis
+            Analisis pesan pertanyaan
             
         Returns
         -------
         str
             Tipe pertanyaan ('rekomendasi', 'informasi', 'genre', dll)
         """
-        text_lower = text.lower()
+        text_lower = message.text_lower
         
         for q_type, patterns in self.question_patterns.items():
             for pattern in patterns:
@@ -404,19 +558,13 @@ class FilmChatbot:
         list
             Daftar film dengan genre yang diminta
         """
-        # Normalisasi genre (case insensitive)
-        genre_lower = genre.lower()
-        
-        # Cari film dengan genre yang cocok
+        # Cari film dengan genre yang cocok (case insensitive) lewat query berindeks
         matching_films = []
         
-        for film_name, film_data in self.films_data.items():
-            film_genres = [g.lower() for g in film_data.get('genre', [])]
-            
-            if genre_lower in film_genres:
-                film_info = self._get_film_info(film_name)
-                if film_info:
-                    matching_films.append(film_info)
+        for film_name in self.film_store.query(genre=genre):
+            film_info = self._get_film_info(film_name)
+            if film_info:
+                matching_films.append(film_info)
         
         return matching_films
     
@@ -449,38 +597,80 @@ class FilmChatbot:
         
         return None
     
-    def _get_film_recommendations(self, film_name):
+    def _get_film_recommendations(self, film_name, top_n=5):
         """
-        Mendapatkan daftar rekomendasi film berdasarkan film tertentu
+        Mendapatkan daftar rekomendasi film berdasarkan film tertentu.
+        Film di database yang terhubung lewat graf tautan rekomendasi
+        (langsung maupun beberapa lompatan) didahulukan, lalu dilengkapi
+        dengan film yang paling mirip dari tabel kemiripan konten.
         
         Parameters
         ----------
         film_name : str
             Nama film
+        top_n : int, optional
+            Jumlah maksimum rekomendasi, by default 5
             
         Returns
         -------
         list
             Daftar rekomendasi film
         """
-        film_data = self.films_data.get(film_name, {})
+        return self._get_films_recommendations([film_name], top_n)
+    
+    def _get_films_recommendations(self, film_names, top_n=5):
+        """
+        Mendapatkan daftar rekomendasi film berdasarkan satu atau beberapa film.
+        Skor graf dan skor kemiripan semua film awal digabung, sehingga film
+        yang dekat dengan lebih banyak film awal berada di urutan atas; film
+        awal sendiri tidak pernah direkomendasikan.
         
-        if not film_data:
+        Parameters
+        ----------
+        film_names : list
+            Nama film awal
+        top_n : int, optional
+            Jumlah maksimum rekomendasi, by default 5
+        
+        Returns
+        -------
+        list
+            Daftar rekomendasi film
+        """
+        film_names = [name for name in film_names if self.films_data.get(name)]
+        
+        if not film_names:
             return []
         
-        recommendations = film_data.get("recommendations", [])
+        # Film terhubung, terurut dari skor random walk tertinggi
+        linked = self.link_graph.recommend(film_names, top_n=self.link_graph.top_k)
         
         # Kumpulkan informasi lengkap untuk film yang direkomendasikan
         rec_info = []
-        
-        for rec_name in recommendations:
-            rec_data = self._get_film_info(rec_name)
-            
-            if rec_data:
-                rec_info.append(rec_data)
-            else:
-                # Jika tidak ada di database, tambahkan info minimal
+        seen = set(film_names)
+        
+        # Film terhubung yang ada di database
+        for rec_name, _, in_database in linked:
+            if len(rec_info) >= top_n:
+                break
+            if in_database and rec_name not in seen:
+                rec_info.append(self._get_film_info(rec_name))
+                seen.add(rec_name)
+        
+        # Lengkapi dengan film yang paling mirip secara konten
+        for similar_name, _ in self.similarity.similar_to_films(film_names, top_n, exclude=seen):
+            if len(rec_info) >= top_n:
+                break
+            rec_info.append(self._get_film_info(similar_name))
+            seen.add(similar_name)
+        
+        # Jika masih kurang, tambahkan film terhubung yang tidak ada di database
+        for rec_name, _, in_database in linked:
+            if len(rec_info) >= top_n:
+                break
+            if not in_database and rec_name not in seen:
                 rec_info.append({"title": rec_name})
+                seen.add(rec_name)
         
         return rec_info
     
@@ -510,6 +700,30 @@ class FilmChatbot:
         
         return response
     
+    def _format_search_response(self, film_info, other_results):
+        """
+        Memformat respons hasil pencarian film berdasarkan deskripsi
+        
+        Parameters
+        ----------
+        film_info : dict
+            Informasi film dengan skor tertinggi
+        other_results : list
+            List tuple (nama_film, skor) film lain yang juga cocok
+        
+        Returns
+        -------
+        str
+            Teks respons
+        """
+        response = "Mungkin film yang Anda maksud:\n\n" + self._format_film_info_response(film_info)
+        
+        others = [film_name for film_name, score in other_results if score >= FULLTEXT_MIN_SCORE]
+        if others:
+            response += "\n\nFilm lain yang mungkin cocok: " + ", ".join(f"*{name}*" for name in others)
+        
+        return response
+    
     def _format_genre_films_response(self, genre, films):
         """
         Memformat respons daftar film berdasarkan genre
@@ -546,8 +760,8 @@ class FilmChatbot:
         
         Parameters
         ----------
-        film_name : str
-            Nama film
+        film_name : str or list
+            Nama film, atau daftar nama film awal
         recommendations : list
             Daftar film yang direkomendasikan
             
@@ -556,10 +770,14 @@ class FilmChatbot:
         str
             Teks respons
         """
+        film_names = [film_name] if isinstance(film_name, str) else film_name
+        
         if not recommendations:
-            return f"Maaf, saya tidak memiliki rekomendasi untuk film {film_name}."
+            return f"Maaf, saya tidak memiliki rekomendasi untuk film {' dan '.join(film_names)}."
         
-        response = f"Jika Anda menyukai *{film_name}*, Anda mungkin juga akan menyukai:\n\n"
+        marked = [f"*{name}*" for name in film_names]
+        liked = marked[0] if len(marked) == 1 else f"{', '.join(marked[:-1])} dan {marked[-1]}"
+        response = f"Jika Anda menyukai {liked}, Anda mungkin juga akan menyukai:\n\n"
         
         for i, film in enumerate(recommendations, 1):
             response += f"{i}. *{film['title']}*"
@@ -591,12 +809,15 @@ class FilmChatbot:
                 "content": faq_answer
             }
         
+        # Analisis pesan sekali; semua cabang membaca hasil yang sama
+        message = self.analyze_message(text)
+        
         # Tentukan tipe pertanyaan
-        question_type = self._get_question_type(text)
+        question_type = message.question_type
         
         if question_type == 'informasi':
             # Cari nama film dalam teks
-            film_name, score = self._find_film_name(text)
+            film_name, score = message.film_match
             
             if film_name and score > 0.7:
                 film_info = self._get_film_info(film_name)
@@ -607,8 +828,20 @@ class FilmChatbot:
                 }
         
         elif question_type == 'rekomendasi':
+            # Beberapa film disebut sekaligus, misalnya "film seperti Dune dan Inception"
+            film_names = message.film_matches
+            if len(film_names) > 1:
+                recommendations = self._get_films_recommendations(film_names)
+                return {
+                    "type": "recommendations",
+                    "content": self._format_recommendations_response(film_names, recommendations),
+                    "recommendations": recommendations,
+                    "based_on": film_names[0],
+                    "based_on_films": film_names
+                }
+            
             # Cek apakah ada nama film spesifik
-            film_name, score = self._find_film_name(text)
+            film_name, score = message.film_match
             
             if film_name and score > 0.7:
                 recommendations = self._get_film_recommendations(film_name)
@@ -620,7 +853,7 @@ class FilmChatbot:
                 }
             else:
                 # Jika tidak ada film spesifik, cek apakah ada genre
-                genre_name, genre_score = self._find_genre_name(text)
+                genre_name, genre_score = message.genre_match
                 
                 if genre_name and genre_score > 0.7:
                     genre_films = self._get_films_by_genre(genre_name)
@@ -639,11 +872,11 @@ class FilmChatbot:
         
         elif question_type == 'genre':
             # Cari nama genre dalam teks
-            genre_name, score = self._find_genre_name(text)
+            genre_name, score = message.genre_match
             
             if genre_name and score > 0.7:
                 # Cek apakah pengguna bertanya tentang deskripsi genre
-                if any(word in text.lower() for word in ['apa', 'artikan', 'jelaskan', 'maksud']):
+                if any(word in message.text_lower for word in ['apa', 'artikan', 'jelaskan', 'maksud']):
                     genre_description = self._get_genre_description(genre_name)
                     
                     if genre_description:
@@ -662,8 +895,8 @@ class FilmChatbot:
                 }
         
         # Default: mencoba mencari kecocokan dengan film atau genre
-        film_name, film_score = self._find_film_name(text)
-        genre_name, genre_score = self._find_genre_name(text)
+        film_name, film_score = message.film_match
+        genre_name, genre_score = message.genre_match
         
         # Pilih yang paling tinggi skor kecocokannya
         if film_score > genre_score and film_score > 0.7:
@@ -682,6 +915,16 @@ class FilmChatbot:
                 "films": genre_films
             }
         
+        # Cari film berdasarkan deskripsi, misalnya "film tentang planet gurun"
+        search_results = self.fulltext.search(text, top_n=3)
+        if search_results and search_results[0][1] >= FULLTEXT_MIN_SCORE:
+            film_info = self._get_film_info(search_results[0][0])
+            return {
+                "type": "film_info",
+                "content": self._format_search_response(film_info, search_results[1:]),
+                "film": film_info
+            }
+        
         # Jika tidak ada kecocokan yang spesifik
         return {
             "type": "text",
@@ -2,18 +2,405 @@
 Model Klasifikasi Film menggunakan TF-IDF dan Naive Bayes
 """
 import os
+import json
+import time
+import numbers
 import pandas as pd
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer, TfidfTransformer
 from sklearn.naive_bayes import MultinomialNB, ComplementNB
 from sklearn.pipeline import Pipeline
-from sklearn.model_selection import train_test_split, GridSearchCV, cross_val_score
-from sklearn.metrics import accuracy_score, classification_report
+from sklearn.model_selection import train_test_split, KFold, ParameterGrid
 from sklearn.ensemble import VotingClassifier
 from sklearn.preprocessing import LabelEncoder, MultiLabelBinarizer
 import joblib
+from joblib import Parallel, delayed
 
-from backend.utils.preprocessor import preprocess_text
+from backend.utils.preprocessor import preprocess_text, preprocess_batch, preprocess_fingerprint
+from backend.utils.preprocess_cache import preprocess_cached
+from backend.models.compact import export_compact
+from backend.models.snapshot import file_signature
+
+# Hyperparameter default TF-IDF dan Naive Bayes; hasil tune() disimpan di artifact model
+DEFAULT_PARAMS = {
+    'max_features': 10000,  # Jumlah fitur maksimal untuk menangkap lebih banyak pola
+    'ngram_range': (1, 3),  # Menggunakan n-gram dari 1 hingga 3 untuk menangkap frasa
+    'min_df': 2,            # Minimal muncul di 2 dokumen
+    'max_df': 0.9,          # Maksimal muncul di 90% dokumen
+    'sublinear_tf': True,   # Skala logaritmik untuk term frequency
+    'alpha': 0.1,           # Smoothing Naive Bayes
+    # Seleksi fitur setelah TF-IDF: 'chi2' atau 'nb_log_ratio' (None berarti semua fitur dipakai)
+    'feature_selection': os.environ.get('FEATURE_SELECTION') or None,
+    # Target jumlah fitur per genre (scope 'genre') atau untuk kosakata bersama (scope 'shared')
+    'selected_features': int(os.environ.get('SELECTED_FEATURES', 0)) or None,
+    'selection_scope': os.environ.get('SELECTION_SCOPE', 'genre'),
+}
+
+# Metode seleksi fitur dan cakupan pemangkasan kosakata
+FEATURE_SELECTION_METHODS = ('chi2', 'nb_log_ratio')
+SELECTION_SCOPES = ('genre', 'shared')
+
+# Parameter seleksi fitur selalu mengikuti konfigurasi (environment), bukan artifact
+SELECTION_PARAMS = ('feature_selection', 'selected_features', 'selection_scope')
+
+# Parameter yang dimiliki TF-IDF (sisanya milik Naive Bayes)
+VECTORIZER_PARAMS = ('max_features', 'ngram_range', 'min_df', 'max_df', 'sublinear_tf')
+
+# Ruang pencarian default untuk tune()
+DEFAULT_PARAM_GRID = {
+    'ngram_range': [(1, 1), (1, 2), (1, 3)],
+    'min_df': [1, 2],
+    'max_df': [0.9],
+    'max_features': [2000, 10000],
+    'sublinear_tf': [True, False],
+    'alpha': [0.01, 0.05, 0.1, 0.5, 1.0],
+}
+
+def fold_count_features(train_texts, test_texts, vectorizer_grid):
+    """
+    Menghitung matrix jumlah term satu fold sekali untuk semua kandidat
+    TF-IDF: n-gram dari rentang terluas di grid, kolom urut alfabet seperti
+    vocabulary TfidfVectorizer
+    
+    Parameters
+    ----------
+    train_texts : list
+        Teks hasil preprocessing untuk training
+    test_texts : list
+        Teks hasil preprocessing untuk validasi
+    vectorizer_grid : list
+        List dictionary parameter TF-IDF kandidat
+        
+    Returns
+    -------
+    dict
+        Matrix jumlah term train/test, orde n-gram, document frequency,
+        dan term frequency setiap kolom
+    """
+    min_n = min(params['ngram_range'][0] for params in vectorizer_grid)
+    max_n = max(params['ngram_range'][1] for params in vectorizer_grid)
+    
+    # dtype float64 sama dengan TfidfVectorizer, agar urutan fitur dengan frekuensi sama identik
+    counter = CountVectorizer(ngram_range=(min_n, max_n), dtype=np.float64)
+    train_counts = counter.fit_transform(train_texts)
+    
+    return {
+        'train': train_counts,
+        'test': counter.transform(test_texts),
+        'orders': np.array([term.count(' ') + 1 for term in counter.get_feature_names_out()]),
+        'dfs': np.bincount(train_counts.indices, minlength=train_counts.shape[1]),
+        'tfs': np.asarray(train_counts.sum(axis=0)).ravel()
+    }
+
+def candidate_features(fold, params):
+    """
+    Membentuk matrix TF-IDF satu kandidat dari matrix jumlah term fold.
+    Pemilihan fitur mengikuti TfidfVectorizer: filter min_df/max_df, lalu
+    max_features term dengan frekuensi tertinggi.
+    
+    Parameters
+    ----------
+    fold : dict
+        Hasil fold_count_features
+    params : dict
+        Parameter TF-IDF kandidat
+        
+    Returns
+    -------
+    tuple or None
+        (matrix TF-IDF train, matrix TF-IDF test), None jika tidak ada fitur tersisa
+    """
+    n_docs = fold['train'].shape[0]
+    min_n, max_n = params['ngram_range']
+    high = params['max_df'] if isinstance(params['max_df'], numbers.Integral) else params['max_df'] * n_docs
+    low = params['min_df'] if isinstance(params['min_df'], numbers.Integral) else params['min_df'] * n_docs
+    
+    mask = (fold['orders'] >= min_n) & (fold['orders'] <= max_n) & (fold['dfs'] <= high) & (fold['dfs'] >= low)
+    limit = params['max_features']
+    if limit is not None and mask.sum() > limit:
+        mask_inds = (-fold['tfs'][mask]).argsort()[:limit]
+        new_mask = np.zeros(len(mask), dtype=bool)
+        new_mask[np.where(mask)[0][mask_inds]] = True
+        mask = new_mask
+    
+    columns = np.where(mask)[0]
+    if columns.size == 0:
+        return None
+    
+    transformer = TfidfTransformer(use_idf=True, sublinear_tf=params['sublinear_tf'])
+    X_train = transformer.fit_transform(fold['train'][:, columns])
+    return X_train, transformer.transform(fold['test'][:, columns])
+
+def naive_bayes_counts(X_train, Y_train):
+    """
+    Menghitung jumlah fitur per kelas untuk Naive Bayes biner semua genre sekaligus
+    
+    Parameters
+    ----------
+    X_train : scipy.sparse matrix
+        Matrix fitur training
+    Y_train : numpy.ndarray
+        Matrix label multilabel (dokumen x genre)
+        
+    Returns
+    -------
+    dict
+        Jumlah fitur kelas positif/negatif (genre x fitur) dan jumlah dokumen per kelas
+    """
+    Y_train = Y_train.astype(np.float64)
+    positive = np.asarray((X_train.T @ Y_train).T)
+    total = np.asarray(X_train.sum(axis=0)).ravel()
+    n_positive = Y_train.sum(axis=0)
+    return {
+        'positive': positive,
+        'negative': total - positive,
+        'n_positive': n_positive,
+        'n_negative': Y_train.shape[0] - n_positive
+    }
+
+def naive_bayes_predict(X_test, counts, alpha):
+    """
+    Prediksi MultinomialNB biner untuk semua genre (rumus sama dengan
+    scikit-learn: prior dari jumlah dokumen, likelihood dengan smoothing alpha)
+    
+    Parameters
+    ----------
+    X_test : scipy.sparse matrix
+        Matrix fitur validasi
+    counts : dict
+        Hasil naive_bayes_counts
+    alpha : float
+        Smoothing Naive Bayes
+        
+    Returns
+    -------
+    numpy.ndarray
+        Matrix boolean prediksi (dokumen x genre)
+    """
+    def log_likelihood(feature_counts, class_counts, n_total):
+        smoothed = feature_counts + alpha
+        feature_log_prob = np.log(smoothed) - np.log(smoothed.sum(axis=1, keepdims=True))
+        with np.errstate(divide='ignore'):
+            log_prior = np.log(class_counts) - np.log(n_total)
+        return X_test @ feature_log_prob.T + log_prior
+    
+    n_total = counts['n_positive'] + counts['n_negative']
+    positive = log_likelihood(counts['positive'], counts['n_positive'], n_total)
+    negative = log_likelihood(counts['negative'], counts['n_negative'], n_total)
+    
+    # Nilai sama dipilih kelas negatif, seperti argmax scikit-learn
+    return np.asarray(positive > negative)
+
+def feature_scores(X_train, Y_train, method, alpha=1.0):
+    """
+    Menilai relevansi setiap fitur untuk setiap genre sekaligus
+    
+    Parameters
+    ----------
+    X_train : scipy.sparse matrix
+        Matrix fitur TF-IDF training
+    Y_train : numpy.ndarray
+        Matrix label multilabel (dokumen x genre)
+    method : str
+        'chi2' (sama dengan sklearn.feature_selection.chi2 per genre) atau
+        'nb_log_ratio' (|log rasio likelihood Naive Bayes|, besar bobot fitur
+        pada keputusan genre)
+    alpha : float, optional
+        Smoothing untuk 'nb_log_ratio', by default 1.0
+        
+    Returns
+    -------
+    numpy.ndarray
+        Skor (genre x fitur), makin besar makin relevan
+    """
+    if method not in FEATURE_SELECTION_METHODS:
+        raise ValueError(f"Metode seleksi fitur '{method}' tidak dikenal, pilih salah satu: {FEATURE_SELECTION_METHODS}")
+    
+    counts = naive_bayes_counts(X_train, Y_train)
+    
+    if method == 'nb_log_ratio':
+        positive = counts['positive'] + alpha
+        negative = counts['negative'] + alpha
+        return np.abs(np.log(positive / positive.sum(axis=1, keepdims=True))
+                      - np.log(negative / negative.sum(axis=1, keepdims=True)))
+    
+    # Chi-kuadrat dua kelas: jumlah fitur teramati vs harapan dari proporsi kelas
+    total = np.asarray(X_train.sum(axis=0)).ravel()
+    n_total = Y_train.shape[0]
+    scores = np.zeros_like(counts['positive'])
+    for observed, n_class in ((counts['positive'], counts['n_positive']), (counts['negative'], counts['n_negative'])):
+        expected = (n_class / n_total)[:, None] * total
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scores += (observed - expected) ** 2 / expected
+    
+    # Genre tanpa contoh positif/negatif tidak punya skor yang berarti
+    return np.nan_to_num(scores)
+
+def select_features(scores, n_features, scope='genre'):
+    """
+    Memilih indeks fitur dengan skor tertinggi
+    
+    Parameters
+    ----------
+    scores : numpy.ndarray
+        Skor fitur (genre x fitur) hasil feature_scores
+    n_features : int
+        Jumlah fitur yang disimpan per genre, atau untuk kosakata bersama
+    scope : str, optional
+        'genre' (kosakata sendiri per genre) atau 'shared' (satu kosakata
+        dengan skor maksimum antar genre), by default 'genre'
+        
+    Returns
+    -------
+    list
+        Array indeks fitur terpilih (urut naik) untuk setiap genre
+    """
+    if scope not in SELECTION_SCOPES:
+        raise ValueError(f"Cakupan seleksi fitur '{scope}' tidak dikenal, pilih salah satu: {SELECTION_SCOPES}")
+    
+    def top(row):
+        # Urutan stabil: skor sama mengikuti urutan kosakata
+        return np.sort(np.argsort(-row, kind='stable')[:n_features])
+    
+    if scope == 'shared':
+        return [top(scores.max(axis=0))] * scores.shape[0]
+    return [top(row) for row in scores]
+
+def score_fold(train_texts, test_texts, Y_train, Y_test, vectorizer_grid, alphas):
+    """
+    Menilai semua kandidat parameter pada satu fold. Matrix jumlah term
+    dihitung sekali, setiap kandidat TF-IDF dibentuk dari matrix tersebut,
+    dan semua nilai alpha memakai jumlah fitur per kelas yang sama.
+    
+    Parameters
+    ----------
+    train_texts : list
+        Teks hasil preprocessing untuk training
+    test_texts : list
+        Teks hasil preprocessing untuk validasi
+    Y_train : numpy.ndarray
+        Label multilabel training
+    Y_test : numpy.ndarray
+        Label multilabel validasi
+    vectorizer_grid : list
+        List dictionary parameter TF-IDF kandidat
+    alphas : list
+        Nilai alpha Naive Bayes kandidat
+        
+    Returns
+    -------
+    tuple
+        (matrix F1 mikro, matrix akurasi rata-rata per genre), ukuran kandidat TF-IDF x alpha;
+        NaN untuk kandidat tanpa fitur
+    """
+    f1_scores = np.full((len(vectorizer_grid), len(alphas)), np.nan)
+    accuracies = np.full((len(vectorizer_grid), len(alphas)), np.nan)
+    
+    fold = fold_count_features(train_texts, test_texts, vectorizer_grid)
+    Y_true = Y_test.astype(bool)
+    
+    for v, params in enumerate(vectorizer_grid):
+        features = candidate_features(fold, params)
+        if features is None:
+            continue
+        
+        X_train, X_test = features
+        counts = naive_bayes_counts(X_train, Y_train)
+        
+        for a, alpha in enumerate(alphas):
+            predicted = naive_bayes_predict(X_test, counts, alpha)
+            tp = np.sum(predicted & Y_true)
+            errors = np.sum(predicted != Y_true)
+            f1_scores[v, a] = 2 * tp / (2 * tp + errors) if tp + errors else 1.0
+            accuracies[v, a] = np.mean(predicted == Y_true)
+    
+    return f1_scores, accuracies
+
+def multilabel_metrics(Y_true, Y_pred):
+    """
+    Metrik evaluasi multilabel untuk semua genre sekaligus
+    
+    Parameters
+    ----------
+    Y_true : numpy.ndarray
+        Matrix label sebenarnya (dokumen x genre)
+    Y_pred : numpy.ndarray
+        Matrix label prediksi (dokumen x genre)
+        
+    Returns
+    -------
+    dict
+        Array per genre ('accuracy', 'precision', 'recall', 'f1', 'support'),
+        rata-rata 'micro' dan 'macro', 'hamming_loss', dan 'subset_accuracy'
+        (semua genre satu dokumen tepat). Pembagian dengan nol bernilai 0,
+        sama dengan default classification_report.
+    """
+    Y_true = np.asarray(Y_true).astype(bool)
+    Y_pred = np.asarray(Y_pred).astype(bool)
+    n_documents = max(Y_true.shape[0], 1)
+    
+    tp = np.sum(Y_true & Y_pred, axis=0)
+    fp = np.sum(~Y_true & Y_pred, axis=0)
+    fn = np.sum(Y_true & ~Y_pred, axis=0)
+    
+    def ratio(numerator, denominator):
+        numerator = np.asarray(numerator, dtype=np.float64)
+        return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator > 0)
+    
+    precision = ratio(tp, tp + fp)
+    recall = ratio(tp, tp + fn)
+    f1 = ratio(2 * tp, 2 * tp + fp + fn)
+    
+    TP, FP, FN = tp.sum(), fp.sum(), fn.sum()
+    return {
+        'accuracy': 1 - (fp + fn) / n_documents,
+        'precision': precision,
+        'recall': recall,
+        'f1': f1,
+        'support': tp + fn,
+        'micro': {
+            'precision': float(ratio(TP, TP + FP)),
+            'recall': float(ratio(TP, TP + FN)),
+            'f1': float(ratio(2 * TP, 2 * TP + FP + FN))
+        },
+        'macro': {
+            'precision': float(precision.mean()),
+            'recall': float(recall.mean()),
+            'f1': float(f1.mean())
+        },
+        'hamming_loss': float(np.mean(Y_true != Y_pred)),
+        'subset_accuracy': float(np.mean(np.all(Y_true == Y_pred, axis=1))) if Y_true.shape[0] else 0.0
+    }
+
+def evaluate_fold(params, multilabel_binarizer, X_train, X_test, Y_train, Y_test):
+    """
+    Melatih pipeline semua genre pada satu fold dan mengevaluasinya
+    
+    Parameters
+    ----------
+    params : dict
+        Hyperparameter model
+    multilabel_binarizer : MultiLabelBinarizer
+        Encoder genre yang sudah di-fit pada seluruh data
+    X_train : list
+        Teks hasil preprocessing untuk training
+    X_test : list
+        Teks hasil preprocessing untuk validasi
+    Y_train : numpy.ndarray
+        Label multilabel training
+    Y_test : numpy.ndarray
+        Label multilabel validasi
+        
+    Returns
+    -------
+    dict
+        Hasil _evaluate_model pada data validasi fold
+    """
+    model = FilmRecommender(load_existing=False)
+    model.params = dict(params)
+    model.multilabel_binarizer = multilabel_binarizer
+    model._fit_pipelines(X_train, Y_train)
+    return model._evaluate_model(X_test, Y_test)
 
 class FilmRecommender:
     """
@@ -21,20 +408,28 @@ class FilmRecommender:
     Menggunakan TF-IDF dan Naive Bayes dengan optimasi parameter.
     """
     
-    def __init__(self):
-        """Inisialisasi model rekomendasi film"""
+    def __init__(self, load_existing=True):
+        """
+        Inisialisasi model rekomendasi film
+        
+        Parameters
+        ----------
+        load_existing : bool, optional
+            Muat model tersimpan jika ada, by default True
+        """
+        # Hyperparameter TF-IDF dan Naive Bayes untuk training (hasil tune() dari
+        # artifact ikut dipakai) dan hyperparameter model yang sedang dimuat
+        self.params = dict(DEFAULT_PARAMS)
+        self.model_params = None
+        self.tuning = None
+        
+        # Sidik jari data training, preprocessing, dan hyperparameter artifact
+        # (lihat training_fingerprint) beserta hasil evaluasinya
+        self.fingerprint = None
+        self.evaluation = None
+        
         # Pipeline untuk preprocessing dan klasifikasi dengan parameter yang dioptimalkan
-        self.pipeline = Pipeline([
-            ('tfidf', TfidfVectorizer(
-                max_features=10000,  # Meningkatkan jumlah fitur untuk menangkap lebih banyak pola
-                ngram_range=(1, 3),  # Menggunakan n-gram dari 1 hingga 3 untuk menangkap frasa
-                min_df=2,            # Minimal muncul di 2 dokumen
-                max_df=0.9,          # Maksimal muncul di 90% dokumen
-                use_idf=True,        # Gunakan inverse document frequency
-                sublinear_tf=True,   # Skala logaritmik untuk term frequency
-            )),
-            ('clf', MultinomialNB(alpha=0.1)),  # Naive Bayes dengan smoothing yang sesuai
-        ])
+        self.pipeline = self._build_pipeline()
         
         # Label encoder untuk genre film
         self.label_encoder = None
@@ -44,24 +439,60 @@ class FilmRecommender:
         self.model_path = os.path.join('models', 'film_recommender.joblib')
         
         # Load model jika sudah ada
-        if os.path.exists(self.model_path):
+        if load_existing and os.path.exists(self.model_path):
             self._load_model()
     
-    def _preprocess_data(self, X):
+    def _build_pipeline(self, vocabulary=None):
+        """
+        Membuat pipeline TF-IDF + Naive Bayes dari hyperparameter model
+        
+        Parameters
+        ----------
+        vocabulary : list, optional
+            Kosakata tetap hasil seleksi fitur, by default None (kosakata
+            dibangun dari data dengan max_features, min_df, dan max_df)
+        
+        Returns
+        -------
+        Pipeline
+            Pipeline scikit-learn yang belum dilatih
+        """
+        return Pipeline([
+            ('tfidf', TfidfVectorizer(
+                max_features=self.params['max_features'],
+                ngram_range=tuple(self.params['ngram_range']),
+                min_df=self.params['min_df'],
+                max_df=self.params['max_df'],
+                use_idf=True,
+                sublinear_tf=self.params['sublinear_tf'],
+                vocabulary=vocabulary,
+            )),
+            ('clf', MultinomialNB(alpha=self.params['alpha'])),
+        ])
+    
+    def _preprocess_data(self, X, workers=None, report=True, cached=False):
         """
-        Melakukan preprocessing pada data teks
+        Melakukan preprocessing pada data teks secara paralel
         
         Parameters
         ----------
         X : list
             List dari string preferensi pengguna
+        workers : int, optional
+            Jumlah proses worker, by default None (lihat `preprocess_batch`)
+        report : bool, optional
+            Cetak jumlah teks dan throughput preprocessing, by default True
+        cached : bool, optional
+            Pakai cache baris persisten (untuk data training), by default False
             
         Returns
         -------
         list
             List dari string hasil preprocessing
         """
-        return [preprocess_text(text) for text in X]
+        if cached:
+            return preprocess_cached(X, workers=workers, report=report)
+        return preprocess_batch(X, workers=workers, report=report)
     
     def prepare_multilabel_data(self, y):
         """
@@ -87,7 +518,7 @@ class FilmRecommender:
         else:
             return self.multilabel_binarizer.transform(genres_list)
     
-    def train(self, X, y, test_size=0.2, random_state=42):
+    def train(self, X, y, test_size=0.2, random_state=42, workers=None, fingerprint=None):
         """
         Melatih model klasifikasi dengan data pelatihan
         
@@ -101,15 +532,45 @@ class FilmRecommender:
             Proporsi data pengujian, by default 0.2
         random_state : int, optional
             Seed untuk random number generator, by default 42
+        workers : int, optional
+            Jumlah proses worker untuk preprocessing, by default None
+        fingerprint : dict, optional
+            Sidik jari data training (lihat training_fingerprint) yang
+            disimpan di artifact, by default None
             
         Returns
         -------
         dict
             Dictionary berisi metrik evaluasi model
         """
-        # Preprocessing data teks
-        X_prep = self._preprocess_data(X)
+        # Preprocessing data teks (baris yang sudah pernah diproses diambil dari cache)
+        X_prep = self._preprocess_data(X, workers=workers, cached=True)
         
+        return self._train_prepared(X_prep, y, test_size=test_size, random_state=random_state,
+                                    fingerprint=fingerprint)
+    
+    def _train_prepared(self, X_prep, y, test_size=0.2, random_state=42, fingerprint=None):
+        """
+        Melatih model dari teks yang sudah di-preprocessing
+        
+        Parameters
+        ----------
+        X_prep : list
+            List teks hasil preprocessing
+        y : list
+            List dari string genre film (bisa multilabel dengan separator '|')
+        test_size : float, optional
+            Proporsi data pengujian, by default 0.2
+        random_state : int, optional
+            Seed untuk random number generator, by default 42
+        fingerprint : dict, optional
+            Sidik jari data training yang disimpan di artifact, by default None
+            
+        Returns
+        -------
+        dict
+            Dictionary berisi metrik evaluasi model
+        """
         # Menyiapkan data multilabel
         y_multilabel = self.prepare_multilabel_data(y)
         
@@ -118,19 +579,44 @@ class FilmRecommender:
             X_prep, y_multilabel, test_size=test_size, random_state=random_state
         )
         
-        # Latih model untuk setiap genre (pendekatan OneVsRest implisit)
-        for i in range(y_multilabel.shape[1]):
-            genre_pipeline = Pipeline([
-                ('tfidf', TfidfVectorizer(
-                    max_features=10000,
-                    ngram_range=(1, 3),
-                    min_df=2,
-                    max_df=0.9,
-                    use_idf=True,
-                    sublinear_tf=True,
-                )),
-                ('clf', MultinomialNB(alpha=0.1)),
-            ])
+        # Latih model untuk setiap genre
+        self._fit_pipelines(X_train, y_train)
+        
+        # Evaluasi model
+        evaluation = self._evaluate_model(X_test, y_test)
+        
+        # Simpan model beserta sidik jari dan evaluasinya
+        self.model_params = dict(self.params)
+        self.fingerprint = fingerprint
+        self.evaluation = evaluation
+        self._save_model()
+        
+        # Ukuran model untuk menimbang akurasi, latensi, dan memori
+        evaluation['model_size'] = self.model_size()
+        print(f"Akurasi rata-rata {evaluation['average_accuracy']:.4f}, "
+              f"latensi {evaluation['latency_ms']:.3f} ms/teks, "
+              f"{evaluation['model_size']['n_features']} fitur, "
+              f"{evaluation['model_size']['file_bytes'] / 1024:.1f} KB")
+        
+        return evaluation
+    
+    def _fit_pipelines(self, X_train, y_train):
+        """
+        Melatih pipeline TF-IDF + Naive Bayes untuk setiap genre (pendekatan
+        OneVsRest implisit)
+        
+        Parameters
+        ----------
+        X_train : list
+            List teks hasil preprocessing untuk training
+        y_train : numpy.ndarray
+            Matrix one-hot encoding untuk label multilabel
+        """
+        # Kosakata setiap genre setelah seleksi fitur (None jika seleksi tidak aktif)
+        vocabularies = self._select_vocabularies(X_train, y_train)
+        
+        for i in range(y_train.shape[1]):
+            genre_pipeline = self._build_pipeline(vocabularies[i])
             
             # Latih pada genre saat ini
             genre_pipeline.fit(X_train, y_train[:, i])
@@ -138,18 +624,219 @@ class FilmRecommender:
             # Tambahkan ke daftar model
             genre_name = self.multilabel_binarizer.classes_[i]
             setattr(self, f'pipeline_{genre_name}', genre_pipeline)
+    
+    def _select_vocabularies(self, X_train, y_train):
+        """
+        Memangkas kosakata setiap genre dengan seleksi fitur. Semua fitur
+        kandidat dinilai dari satu vectorizer bersama dengan hyperparameter
+        model, lalu fitur dengan skor tertinggi menjadi kosakata tetap
+        pipeline genre (TF-IDF dinormalisasi ulang atas fitur terpilih).
         
-        # Evaluasi model
-        evaluation = self._evaluate_model(X_test, y_test)
+        Parameters
+        ----------
+        X_train : list
+            List teks hasil preprocessing untuk training
+        y_train : numpy.ndarray
+            Matrix one-hot encoding untuk label multilabel
+            
+        Returns
+        -------
+        list
+            Kosakata (list term) untuk setiap genre, atau None untuk setiap
+            genre jika seleksi fitur tidak aktif
+        """
+        method = self.params.get('feature_selection')
+        n_features = self.params.get('selected_features')
+        if not method or not n_features:
+            return [None] * y_train.shape[1]
         
-        # Simpan model
-        self._save_model()
+        vectorizer = self._build_pipeline().named_steps['tfidf']
+        X = vectorizer.fit_transform(X_train)
+        terms = vectorizer.get_feature_names_out()
         
-        return evaluation
+        scores = feature_scores(X, y_train, method, alpha=self.params['alpha'])
+        selected = select_features(scores, n_features, scope=self.params.get('selection_scope', 'genre'))
+        print(f"Seleksi fitur {method}: {len(terms)} fitur -> {min(n_features, len(terms))} fitur per genre")
+        
+        return [terms[indices].tolist() for indices in selected]
+    
+    def model_size(self):
+        """
+        Menghitung ukuran model yang sudah dilatih
+        
+        Returns
+        -------
+        dict
+            Jumlah fitur semua genre, rata-rata fitur per genre, dan ukuran file model (byte)
+        """
+        n_features = [
+            len(getattr(self, f'pipeline_{genre}').named_steps['tfidf'].vocabulary_)
+            for genre in self.multilabel_binarizer.classes_
+        ]
+        return {
+            'n_features': int(sum(n_features)),
+            'features_per_genre': float(np.mean(n_features)),
+            'file_bytes': os.path.getsize(self.model_path) if os.path.exists(self.model_path) else 0
+        }
+    
+    def tune(self, X, y, param_grid=None, n_splits=5, random_state=42, workers=None, test_size=0.2):
+        """
+        Mencari hyperparameter TF-IDF dan Naive Bayes terbaik untuk semua genre
+        dengan cross-validation, lalu melatih dan menyimpan model dengan
+        parameter terbaik.
+        
+        Teks di-preprocessing sekali. Setiap fold menghitung matrix jumlah
+        term sekali untuk seluruh grid; kandidat TF-IDF dibentuk dari matrix
+        itu dan semua nilai alpha memakai jumlah fitur per kelas yang sama.
+        Fold dijalankan paralel. Skor kandidat adalah F1 mikro semua genre.
+        
+        Parameters
+        ----------
+        X : list
+            List dari string preferensi film
+        y : list
+            List dari string genre film (bisa multilabel dengan separator '|')
+        param_grid : dict, optional
+            Nama parameter -> list nilai, by default None (DEFAULT_PARAM_GRID);
+            parameter yang tidak disebut memakai nilai model saat ini
+        n_splits : int, optional
+            Jumlah fold, by default 5
+        random_state : int, optional
+            Seed untuk pembagian fold dan data pengujian, by default 42
+        workers : int, optional
+            Jumlah proses untuk preprocessing dan fold, by default None (jumlah CPU)
+        test_size : float, optional
+            Proporsi data pengujian saat melatih model akhir, by default 0.2
+            
+        Returns
+        -------
+        dict
+            Parameter terbaik, skor, peringkat kandidat, dan evaluasi model akhir
+        """
+        start = time.perf_counter()
+        param_grid = param_grid or DEFAULT_PARAM_GRID
+        
+        # Preprocessing sekali untuk semua fold dan kandidat
+        X_prep = np.array(self._preprocess_data(X, workers=workers, cached=True), dtype=object)
+        Y = MultiLabelBinarizer().fit_transform([genres.split('|') for genres in y])
+        
+        vectorizer_grid = list(ParameterGrid({
+            name: list(param_grid.get(name, [self.params[name]])) for name in VECTORIZER_PARAMS
+        }))
+        alphas = list(param_grid.get('alpha', [self.params['alpha']]))
+        
+        folds = list(KFold(n_splits=n_splits, shuffle=True, random_state=random_state).split(X_prep))
+        n_jobs = min(len(folds), workers or os.cpu_count() or 1)
+        fold_results = Parallel(n_jobs=n_jobs)(
+            delayed(score_fold)(list(X_prep[train]), list(X_prep[test]), Y[train], Y[test], vectorizer_grid, alphas)
+            for train, test in folds
+        )
+        
+        # Kandidat yang gagal di salah satu fold (tidak ada fitur) mendapat skor NaN
+        f1_scores = np.mean([f1 for f1, _ in fold_results], axis=0)
+        accuracies = np.mean([accuracy for _, accuracy in fold_results], axis=0)
+        
+        results = [
+            {
+                'params': dict(vectorizer_grid[v], alpha=alpha),
+                'f1_micro': float(f1_scores[v, a]),
+                'average_accuracy': float(accuracies[v, a])
+            }
+            for v in range(len(vectorizer_grid)) for a, alpha in enumerate(alphas)
+            if not np.isnan(f1_scores[v, a])
+        ]
+        if not results:
+            raise ValueError("Tidak ada kandidat parameter yang menghasilkan fitur")
+        
+        # sorted() stabil, sehingga skor sama mengikuti urutan grid
+        results.sort(key=lambda result: -result['f1_micro'])
+        best = results[0]
+        search_seconds = time.perf_counter() - start
+        print(f"Pencarian {len(results)} kandidat x {len(folds)} fold selesai dalam {search_seconds:.2f} detik, "
+              f"F1 mikro terbaik {best['f1_micro']:.4f}: {best['params']}")
+        
+        # Latih model akhir dengan parameter terbaik; parameter ikut tersimpan di artifact.
+        # Parameter seleksi fitur tidak ikut dicari, nilai model saat ini tetap dipakai
+        self.params = dict(self.params, **best['params'])
+        self.tuning = {
+            'f1_micro': best['f1_micro'],
+            'average_accuracy': best['average_accuracy'],
+            'n_splits': len(folds),
+            'n_candidates': len(results),
+            'param_grid': {name: list(values) for name, values in param_grid.items()}
+        }
+        self.pipeline = self._build_pipeline()
+        evaluation = self._train_prepared(list(X_prep), y, test_size=test_size, random_state=random_state)
+        
+        return {
+            'best_params': self.params,
+            'best_score': best['f1_micro'],
+            'results': results,
+            'evaluation': evaluation,
+            'seconds': time.perf_counter() - start
+        }
+    
+    def _predict_matrix(self, X_prep):
+        """
+        Prediksi semua genre untuk banyak teks sekaligus. Genre dengan TF-IDF
+        yang sama (kosakata dan idf identik, selalu begitu tanpa seleksi
+        fitur per genre) berbagi satu vektorisasi, lalu log-likelihood
+        Naive Bayes semua genre dihitung dengan satu perkalian matrix per
+        kelas. Hasil sama dengan pipeline.predict setiap genre.
+        
+        Parameters
+        ----------
+        X_prep : list
+            List teks hasil preprocessing
+            
+        Returns
+        -------
+        tuple
+            (matrix boolean prediksi dokumen x genre, detik vektorisasi, detik prediksi)
+        """
+        genres = self.multilabel_binarizer.classes_
+        predicted = np.zeros((len(X_prep), len(genres)), dtype=bool)
+        
+        # Kelompokkan genre berdasarkan TF-IDF yang identik
+        groups = {}
+        for g, genre in enumerate(genres):
+            pipeline = getattr(self, f'pipeline_{genre}')
+            vectorizer = pipeline.named_steps['tfidf']
+            key = (tuple(vectorizer.get_feature_names_out()), vectorizer.idf_.tobytes(),
+                   vectorizer.sublinear_tf, vectorizer.norm, tuple(vectorizer.ngram_range))
+            groups.setdefault(key, (vectorizer, []))[1].append((g, pipeline.named_steps['clf']))
+        
+        vectorize_seconds = 0.0
+        predict_seconds = 0.0
+        for vectorizer, members in groups.values():
+            start = time.perf_counter()
+            X = vectorizer.transform(X_prep)
+            vectorize_seconds += time.perf_counter() - start
+            
+            start = time.perf_counter()
+            binary = [(g, clf) for g, clf in members if len(clf.classes_) == 2]
+            for g, clf in members:
+                # Genre dengan satu kelas saja selalu memprediksi kelas itu
+                if len(clf.classes_) == 1:
+                    predicted[:, g] = bool(clf.classes_[0])
+            
+            if binary:
+                columns = [g for g, _ in binary]
+                # Log-likelihood kelas negatif dan positif, urutan operasi sama dengan
+                # MultinomialNB; nilai sama dipilih kelas negatif seperti argmax
+                negative = X @ np.column_stack([clf.feature_log_prob_[0] for _, clf in binary])
+                positive = X @ np.column_stack([clf.feature_log_prob_[1] for _, clf in binary])
+                negative += np.array([clf.class_log_prior_[0] for _, clf in binary])
+                positive += np.array([clf.class_log_prior_[1] for _, clf in binary])
+                predicted[:, columns] = positive > negative
+            predict_seconds += time.perf_counter() - start
+        
+        return predicted, vectorize_seconds, predict_seconds
     
     def _evaluate_model(self, X_test, y_test):
         """
-        Mengevaluasi model pada data pengujian
+        Mengevaluasi model pada data pengujian dengan satu matrix prediksi
+        untuk semua genre
         
         Parameters
         ----------
@@ -161,29 +848,102 @@ class FilmRecommender:
         Returns
         -------
         dict
-            Dictionary berisi metrik evaluasi model
+            Metrik per genre (accuracy, precision, recall, f1, support),
+            'average_accuracy', rata-rata 'micro' dan 'macro', 'hamming_loss',
+            'subset_accuracy', 'latency_ms' (prediksi semua genre per teks),
+            dan 'timing'
         """
+        Y_pred, vectorize_seconds, predict_seconds = self._predict_matrix(X_test)
+        
+        start = time.perf_counter()
+        metrics = multilabel_metrics(y_test, Y_pred)
+        
         # Dictionary untuk menyimpan hasil evaluasi
         evaluation = {}
-        
-        # Evaluasi setiap model genre
         for i, genre in enumerate(self.multilabel_binarizer.classes_):
-            pipeline = getattr(self, f'pipeline_{genre}')
-            y_pred = pipeline.predict(X_test)
-            
-            # Hitung akurasi
-            acc = accuracy_score(y_test[:, i], y_pred)
             evaluation[genre] = {
-                'accuracy': acc,
-                'classification_report': classification_report(y_test[:, i], y_pred, output_dict=True)
+                'accuracy': float(metrics['accuracy'][i]),
+                'precision': float(metrics['precision'][i]),
+                'recall': float(metrics['recall'][i]),
+                'f1': float(metrics['f1'][i]),
+                'support': int(metrics['support'][i])
             }
         
-        # Hitung akurasi rata-rata
-        accuracies = [evaluation[genre]['accuracy'] for genre in self.multilabel_binarizer.classes_]
-        evaluation['average_accuracy'] = sum(accuracies) / len(accuracies)
+        # Akurasi rata-rata per genre (sama dengan 1 - hamming loss)
+        evaluation['average_accuracy'] = float(np.mean(metrics['accuracy']))
+        for name in ('micro', 'macro', 'hamming_loss', 'subset_accuracy'):
+            evaluation[name] = metrics[name]
+        metrics_seconds = time.perf_counter() - start
+        
+        # Waktu prediksi semua genre per teks (tanpa preprocessing)
+        n_texts = max(len(X_test), 1)
+        prediction_seconds = vectorize_seconds + predict_seconds
+        evaluation['latency_ms'] = prediction_seconds / n_texts * 1000
+        evaluation['timing'] = {
+            'n_texts': len(X_test),
+            'vectorize_ms': vectorize_seconds * 1000,
+            'predict_ms': predict_seconds * 1000,
+            'metrics_ms': metrics_seconds * 1000,
+            # None jika waktu terlalu kecil untuk diukur (nilai tak hingga bukan JSON yang valid)
+            'texts_per_second': len(X_test) / prediction_seconds if prediction_seconds > 0 else None
+        }
         
         return evaluation
     
+    def cross_validate(self, X, y, n_splits=5, random_state=42, workers=None):
+        """
+        Evaluasi k-fold dengan hyperparameter model saat ini. Teks
+        di-preprocessing sekali (dengan cache baris) dan fold dijalankan
+        paralel. Model yang tersimpan tidak diubah.
+        
+        Parameters
+        ----------
+        X : list
+            List dari string preferensi film
+        y : list
+            List dari string genre film (bisa multilabel dengan separator '|')
+        n_splits : int, optional
+            Jumlah fold, by default 5
+        random_state : int, optional
+            Seed untuk pembagian fold, by default 42
+        workers : int, optional
+            Jumlah proses untuk preprocessing dan fold, by default None (jumlah CPU)
+            
+        Returns
+        -------
+        dict
+            Rata-rata dan simpangan baku metrik ringkasan antar fold, evaluasi
+            setiap fold, dan lama proses (detik)
+        """
+        start = time.perf_counter()
+        X_prep = np.array(self._preprocess_data(X, workers=workers, cached=True), dtype=object)
+        
+        multilabel_binarizer = MultiLabelBinarizer()
+        Y = multilabel_binarizer.fit_transform([genres.split('|') for genres in y])
+        
+        folds = list(KFold(n_splits=n_splits, shuffle=True, random_state=random_state).split(X_prep))
+        n_jobs = min(len(folds), workers or os.cpu_count() or 1)
+        evaluations = Parallel(n_jobs=n_jobs)(
+            delayed(evaluate_fold)(self.params, multilabel_binarizer, list(X_prep[train]), list(X_prep[test]),
+                                   Y[train], Y[test])
+            for train, test in folds
+        )
+        
+        summary = {
+            'average_accuracy': [evaluation['average_accuracy'] for evaluation in evaluations],
+            'micro_f1': [evaluation['micro']['f1'] for evaluation in evaluations],
+            'macro_f1': [evaluation['macro']['f1'] for evaluation in evaluations],
+            'hamming_loss': [evaluation['hamming_loss'] for evaluation in evaluations],
+            'subset_accuracy': [evaluation['subset_accuracy'] for evaluation in evaluations],
+        }
+        return {
+            'mean': {name: float(np.mean(values)) for name, values in summary.items()},
+            'std': {name: float(np.std(values)) for name, values in summary.items()},
+            'folds': evaluations,
+            'n_splits': len(folds),
+            'seconds': time.perf_counter() - start
+        }
+    
     def predict(self, text):
         """
         Memprediksi genre film berdasarkan teks preferensi pengguna
@@ -232,6 +992,52 @@ class FilmRecommender:
         
         return result
     
+    def predict_batch(self, texts, workers=None, report=True):
+        """
+        Memprediksi genre film untuk banyak teks sekaligus. Preprocessing
+        dijalankan paralel dan setiap pipeline genre dipanggil sekali untuk
+        seluruh teks.
+        
+        Parameters
+        ----------
+        texts : list
+            List teks preferensi pengguna
+        workers : int, optional
+            Jumlah proses worker untuk preprocessing, by default None
+        report : bool, optional
+            Cetak laporan preprocessing, by default True
+            
+        Returns
+        -------
+        list
+            List dictionary hasil prediksi (format sama dengan `predict`)
+        """
+        texts_prep = self._preprocess_data(texts, workers=workers, report=report)
+        
+        predictions = []
+        columns = []
+        for genre in self.multilabel_binarizer.classes_:
+            pipeline = getattr(self, f'pipeline_{genre}', None)
+            if pipeline:
+                proba = pipeline.predict_proba(texts_prep)
+                predictions.append(genre)
+                columns.append(proba[:, 1] if proba.shape[1] > 1 else np.zeros(len(texts_prep)))
+        
+        if not columns:
+            return [{'top_genres': []} for _ in texts_prep]
+        
+        scores = np.column_stack(columns)
+        top_n = min(5, len(predictions))
+        results = []
+        for row in scores:
+            # Urutan sama dengan predict: argsort menaik lalu dibalik
+            sorted_indices = np.argsort(row)[::-1][:top_n]
+            results.append({
+                'top_genres': [{'genre': predictions[i], 'confidence': row[i]} for i in sorted_indices]
+            })
+        
+        return results
+    
     def _save_model(self):
         """
         Menyimpan model ke file
@@ -241,7 +1047,11 @@ class FilmRecommender:
         
         # Kumpulkan semua komponen model yang akan disimpan
         model_data = {
-            'multilabel_binarizer': self.multilabel_binarizer
+            'multilabel_binarizer': self.multilabel_binarizer,
+            'params': self.model_params,
+            'tuning': self.tuning,
+            'fingerprint': self.fingerprint,
+            'evaluation': self.evaluation
         }
         
         # Tambahkan semua pipeline genre ke model_data
@@ -251,6 +1061,12 @@ class FilmRecommender:
         # Simpan model
         joblib.dump(model_data, self.model_path)
         print(f"Model berhasil disimpan ke {self.model_path}")
+        
+        # Ekspor untuk runtime inferensi compact (tanpa scikit-learn)
+        try:
+            print(f"Model compact disimpan ke {export_compact(self)}")
+        except ValueError as e:
+            print(f"Gagal mengekspor model compact: {e}")
     
     def _load_model(self):
         """
@@ -262,6 +1078,21 @@ class FilmRecommender:
             # Muat multilabel binarizer
             self.multilabel_binarizer = model_data['multilabel_binarizer']
             
+            # Hyperparameter model yang dimuat (artifact lama belum menyimpannya)
+            self.model_params = dict(DEFAULT_PARAMS, **(model_data.get('params') or {}))
+            
+            self.tuning = model_data.get('tuning')
+            
+            # Training berikutnya memakai hasil tune() dari artifact (jika ada), tetapi
+            # seleksi fitur tetap mengikuti FEATURE_SELECTION, SELECTED_FEATURES,
+            # dan SELECTION_SCOPE
+            tuned = self.model_params if self.tuning else {}
+            self.params = dict(DEFAULT_PARAMS, **{
+                name: value for name, value in tuned.items() if name not in SELECTION_PARAMS
+            })
+            self.fingerprint = model_data.get('fingerprint')
+            self.evaluation = model_data.get('evaluation')
+            
             # Muat semua pipeline genre
             for genre in self.multilabel_binarizer.classes_:
                 setattr(self, f'pipeline_{genre}', model_data[f'pipeline_{genre}'])
@@ -271,11 +1102,90 @@ class FilmRecommender:
             print(f"Gagal memuat model: {e}")
             # Reset model jika gagal memuat
             self.multilabel_binarizer = None
-
+    
+    def training_fingerprint(self, csv_path, preferences_col='preferences', genre_col='film_genre',
+                             test_size=0.2, random_state=42):
+        """
+        Sidik jari semua masukan training: isi file CSV, kolom, pembagian data,
+        konfigurasi preprocessing, dan hyperparameter yang dikonfigurasi untuk
+        training (`params`, bukan hyperparameter artifact yang dimuat)
+        
+        Parameters
+        ----------
+        csv_path : str
+            Path ke file CSV
+        preferences_col : str, optional
+            Nama kolom berisi teks preferensi user, by default 'preferences'
+        genre_col : str, optional
+            Nama kolom berisi genre film, by default 'film_genre'
+        test_size : float, optional
+            Proporsi data pengujian, by default 0.2
+        random_state : int, optional
+            Seed untuk random number generator, by default 42
+            
+        Returns
+        -------
+        dict or None
+            Sidik jari training; None jika file CSV tidak ada
+        """
+        signature = file_signature(csv_path)
+        if signature is None:
+            return None
+        
+        return {
+            'data_sha1': signature['sha1'],
+            'columns': [preferences_col, genre_col],
+            'split': [test_size, random_state],
+            'preprocess': preprocess_fingerprint(),
+            # Lewat JSON agar tuple dan list dibandingkan sama
+            'params': json.loads(json.dumps(self.params, sort_keys=True, default=str))
+        }
+    
+    def is_trained_on(self, fingerprint):
+        """
+        Mengecek apakah model yang dimuat dilatih dengan masukan yang sama
+        
+        Parameters
+        ----------
+        fingerprint : dict
+            Hasil training_fingerprint
+        
+        Returns
+        -------
+        bool
+            True jika model sudah dilatih dan sidik jarinya sama
+        """
+        return (fingerprint is not None and self.multilabel_binarizer is not None
+                and self.fingerprint == fingerprint and self.evaluation is not None)
+    
+    def _verify_model(self, X, y, test_size=0.2, random_state=42, workers=None):
+        """
+        Verifikasi cepat model yang dimuat: evaluasi ulang pada data pengujian
+        (preprocessing dari cache, tanpa training) dan bandingkan akurasinya
+        dengan evaluasi yang tersimpan di artifact
+        
+        Returns
+        -------
+        dict or None
+            Evaluasi ulang; None jika akurasinya berbeda
+        """
+        X_prep = self._preprocess_data(X, workers=workers, cached=True)
+        y_multilabel = self.multilabel_binarizer.transform([genres.split('|') for genres in y])
+        _, X_test, _, y_test = train_test_split(
+            X_prep, y_multilabel, test_size=test_size, random_state=random_state
+        )
+        
+        evaluation = self._evaluate_model(X_test, y_test)
+        if not np.isclose(evaluation['average_accuracy'], self.evaluation['average_accuracy']):
+            return None
+        return evaluation
+    
     def train_from_csv(self, csv_path, preferences_col='preferences', genre_col='film_genre', 
-                      test_size=0.2, random_state=42):
+                      test_size=0.2, random_state=42, workers=None, force=False, verify=False):
         """
-        Melatih model dari file CSV
+        Melatih model dari file CSV. Training dilewati jika model yang dimuat
+        sudah dilatih dengan isi CSV, konfigurasi preprocessing, dan
+        hyperparameter yang sama (lihat training_fingerprint).
         
         Parameters
         ----------
@@ -289,22 +1199,46 @@ class FilmRecommender:
             Proporsi data pengujian, by default 0.2
         random_state : int, optional
             Seed untuk random number generator, by default 42
+        workers : int, optional
+            Jumlah proses worker untuk preprocessing, by default None
+        force : bool, optional
+            Latih ulang walaupun sidik jari sama, by default False
+        verify : bool, optional
+            Jika training dilewati, evaluasi ulang model pada data pengujian
+            dan latih ulang jika hasilnya berbeda, by default False
             
         Returns
         -------
         dict
-            Dictionary berisi metrik evaluasi model
+            Dictionary berisi metrik evaluasi model; key 'retrained' bernilai
+            False jika training dilewati
         """
         # Baca data dari CSV
         try:
+            fingerprint = self.training_fingerprint(csv_path, preferences_col, genre_col, test_size, random_state)
+            skip = not force and self.is_trained_on(fingerprint)
+            if skip and not verify:
+                print("Data training, preprocessing, dan hyperparameter tidak berubah; training dilewati")
+                return dict(self.evaluation, model_size=self.model_size(), retrained=False)
+            
             data = pd.read_csv(csv_path)
             
             # Ekstrak preferensi dan genre
             X = data[preferences_col].tolist()
             y = data[genre_col].tolist()
             
+            if skip:
+                evaluation = self._verify_model(X, y, test_size=test_size, random_state=random_state, workers=workers)
+                if evaluation is not None:
+                    print("Model terverifikasi sesuai data training; training dilewati")
+                    return dict(evaluation, model_size=self.model_size(), retrained=False)
+                print("Evaluasi model berbeda dari artifact, melatih ulang...")
+            
             # Latih model
-            return self.train(X, y, test_size=test_size, random_state=random_state)
+            evaluation = self.train(X, y, test_size=test_size, random_state=random_state, workers=workers,
+                                    fingerprint=fingerprint)
+            evaluation['retrained'] = True
+            return evaluation
         except Exception as e:
             print(f"Gagal melatih model dari CSV: {e}")
             return None
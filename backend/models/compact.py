@@ -0,0 +1,369 @@
+"""
+Runtime inferensi ringan untuk model rekomendasi film (hanya NumPy)
+
+Pipeline TF-IDF + Naive Bayes setiap genre diekspor dari FilmRecommender
+ke satu file .npz: kosakata gabungan semua genre, matrix idf dan koefisien
+Naive Bayes per genre (log rasio likelihood kelas positif vs negatif)
+dalam float32 atau float16, serta intercept (log rasio prior kelas).
+CompactRecommender memuat file tersebut tanpa scikit-learn dan joblib,
+lalu menghitung probabilitas genre dengan rumus yang sama seperti
+predict_proba Pipeline:
+    p(genre) = sigmoid(tfidf(teks) . koefisien + intercept)
+"""
+import os
+import re
+import json
+import numpy as np
+
+from backend.utils.preprocessor import preprocess_text, preprocess_batch
+from backend.models.snapshot import file_signature
+
+COMPACT_FORMAT = 'film-recommender-compact v1'
+
+# Tipe data array idf dan koefisien (environment variable COMPACT_DTYPE)
+COMPACT_DTYPES = ('float32', 'float16')
+COMPACT_DTYPE = os.environ.get('COMPACT_DTYPE', 'float32')
+
+# Runtime model rekomendasi di server (environment variable RECOMMENDER_RUNTIME)
+RECOMMENDER_RUNTIMES = ('sklearn', 'compact')
+
+DEFAULT_MODEL_PATH = os.path.join('models', 'film_recommender.joblib')
+
+def compact_path(model_path):
+    """
+    Path file model compact untuk sebuah artifact joblib
+    
+    Parameters
+    ----------
+    model_path : str
+        Path file model joblib
+    
+    Returns
+    -------
+    str
+        Path file .npz di direktori yang sama
+    """
+    return os.path.splitext(model_path)[0] + '.npz'
+
+def export_compact(recommender, path=None, dtype=None):
+    """
+    Mengekspor FilmRecommender yang sudah dilatih ke file model compact
+    
+    Parameters
+    ----------
+    recommender : FilmRecommender
+        Model dengan pipeline per genre yang sudah dilatih
+    path : str, optional
+        Path file .npz, by default None (di samping recommender.model_path)
+    dtype : str, optional
+        'float32' atau 'float16', by default None (COMPACT_DTYPE)
+    
+    Returns
+    -------
+    str
+        Path file yang ditulis
+    """
+    dtype = dtype or COMPACT_DTYPE
+    if dtype not in COMPACT_DTYPES:
+        raise ValueError(f"Tipe data '{dtype}' tidak didukung, pilih salah satu: {COMPACT_DTYPES}")
+    path = path or compact_path(recommender.model_path)
+    
+    genres = [genre for genre in recommender.multilabel_binarizer.classes_
+              if getattr(recommender, f'pipeline_{genre}', None)]
+    pipelines = [getattr(recommender, f'pipeline_{genre}') for genre in genres]
+    
+    # Runtime compact hanya meniru analyzer kata standar TfidfVectorizer
+    settings = None
+    for pipeline in pipelines:
+        vectorizer = pipeline.named_steps['tfidf']
+        if (vectorizer.analyzer != 'word' or vectorizer.norm != 'l2' or not vectorizer.use_idf
+                or vectorizer.preprocessor or vectorizer.tokenizer or vectorizer.stop_words or vectorizer.strip_accents):
+            raise ValueError("Pipeline memakai pengaturan TF-IDF yang tidak didukung runtime compact")
+        pipeline_settings = {
+            'ngram_range': list(vectorizer.ngram_range),
+            'lowercase': bool(vectorizer.lowercase),
+            'token_pattern': vectorizer.token_pattern,
+            'sublinear_tf': bool(vectorizer.sublinear_tf)
+        }
+        if settings not in (None, pipeline_settings):
+            raise ValueError("Pengaturan TF-IDF antar genre berbeda")
+        settings = pipeline_settings
+    
+    # Kosakata gabungan; fitur yang tidak dimiliki genre mendapat idf dan koefisien 0
+    terms = sorted(set().union(*(pipeline.named_steps['tfidf'].vocabulary_ for pipeline in pipelines)))
+    index = {term: i for i, term in enumerate(terms)}
+    
+    idf = np.zeros((len(genres), len(terms)))
+    coef = np.zeros((len(genres), len(terms)))
+    intercept = np.full(len(genres), -np.inf)
+    for g, pipeline in enumerate(pipelines):
+        vectorizer = pipeline.named_steps['tfidf']
+        classifier = pipeline.named_steps['clf']
+        
+        columns = np.empty(len(vectorizer.vocabulary_), dtype=np.intp)
+        for term, column in vectorizer.vocabulary_.items():
+            columns[column] = index[term]
+        idf[g, columns] = vectorizer.idf_
+        
+        # Genre dengan satu kelas saja mendapat confidence 0, sama seperti predict
+        if len(classifier.classes_) > 1:
+            coef[g, columns] = classifier.feature_log_prob_[1] - classifier.feature_log_prob_[0]
+            intercept[g] = classifier.class_log_prior_[1] - classifier.class_log_prior_[0]
+    
+    meta = dict(settings, format=COMPACT_FORMAT, dtype=dtype,
+                source=file_signature(recommender.model_path, with_hash=False))
+    
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as file:
+        np.savez(file, meta=np.array(json.dumps(meta)), genres=np.array(genres), terms=np.array(terms, dtype=str),
+                 idf=idf.astype(dtype), coef=coef.astype(dtype), intercept=intercept)
+    os.replace(temp_path, path)
+    
+    return path
+
+class CompactRecommender:
+    """
+    Model rekomendasi film untuk inferensi tanpa scikit-learn.
+    Hasil predict dan predict_batch berformat sama dengan FilmRecommender.
+    """
+    
+    def __init__(self, path=None):
+        """
+        Memuat model compact
+        
+        Parameters
+        ----------
+        path : str, optional
+            Path file .npz, by default None (models/film_recommender.npz)
+        """
+        self.path = path or compact_path(DEFAULT_MODEL_PATH)
+        self._load()
+    
+    def _load(self):
+        """Membaca file model compact"""
+        with np.load(self.path, allow_pickle=False) as data:
+            self.meta = json.loads(str(data['meta']))
+            if self.meta.get('format') != COMPACT_FORMAT:
+                raise ValueError(f"Format model compact {self.path} tidak dikenal")
+            
+            self.genres = data['genres'].tolist()
+            self.vocabulary = {term: i for i, term in enumerate(data['terms'].tolist())}
+            self.idf = data['idf']
+            self.coef = data['coef']
+            self.intercept = data['intercept']
+        
+        self.ngram_range = tuple(self.meta['ngram_range'])
+        self.lowercase = self.meta['lowercase']
+        self.sublinear_tf = self.meta['sublinear_tf']
+        self.token_pattern = re.compile(self.meta['token_pattern'])
+    
+    @classmethod
+    def open_if_fresh(cls, path, model_path):
+        """
+        Membuka model compact jika masih sesuai dengan artifact joblib
+        
+        Parameters
+        ----------
+        path : str
+            Path file .npz
+        model_path : str
+            Path artifact joblib sumber ekspor
+        
+        Returns
+        -------
+        CompactRecommender or None
+            None jika file tidak ada, tidak valid, atau artifact joblib sudah berubah
+        """
+        if not os.path.exists(path):
+            return None
+        
+        try:
+            compact = cls(path)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Gagal memuat model compact: {e}")
+            return None
+        
+        # Tanpa artifact joblib (hanya model compact yang dipasang) model dianggap segar
+        source = file_signature(model_path, with_hash=False)
+        if source is not None and source != compact.meta.get('source'):
+            return None
+        
+        return compact
+    
+    def _analyze(self, text):
+        """
+        Memecah teks menjadi n-gram kata, sama seperti analyzer TfidfVectorizer
+        
+        Parameters
+        ----------
+        text : str
+            Teks hasil preprocessing
+        
+        Returns
+        -------
+        list
+            List n-gram
+        """
+        if self.lowercase:
+            text = text.lower()
+        tokens = self.token_pattern.findall(text)
+        
+        min_n, max_n = self.ngram_range
+        ngrams = list(tokens) if min_n == 1 else []
+        for n in range(max(min_n, 2), min(max_n, len(tokens)) + 1):
+            ngrams.extend(" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+        
+        return ngrams
+    
+    def _scores(self, texts_prep):
+        """
+        Menghitung probabilitas positif setiap genre untuk banyak teks sekaligus
+        
+        Parameters
+        ----------
+        texts_prep : list
+            List teks hasil preprocessing
+        
+        Returns
+        -------
+        numpy.ndarray
+            Probabilitas (teks x genre, urutan self.genres)
+        """
+        rows = []
+        for text_prep in texts_prep:
+            counts = {}
+            for ngram in self._analyze(text_prep):
+                column = self.vocabulary.get(ngram)
+                if column is not None:
+                    counts[column] = counts.get(column, 0) + 1
+            rows.append(counts)
+        
+        # Hanya kolom kosakata yang muncul di teks-teks ini
+        columns = sorted(set().union(*rows))
+        position = {column: i for i, column in enumerate(columns)}
+        tf = np.zeros((len(rows), len(columns)))
+        for r, counts in enumerate(rows):
+            for column, count in counts.items():
+                tf[r, position[column]] = count
+        if self.sublinear_tf:
+            present = tf > 0
+            tf[present] = np.log(tf[present]) + 1
+        
+        # TF-IDF dinormalisasi L2 per genre (kosakata genre bisa berbeda):
+        # panjang vektor dan hasil kali dengan koefisien untuk semua genre sekaligus
+        idf = self.idf[:, columns].astype(np.float64)
+        norms = np.sqrt((tf * tf) @ (idf * idf).T)
+        norms[norms == 0] = 1
+        logits = self.intercept + (tf @ (idf * self.coef[:, columns]).T) / norms
+        
+        # sigmoid yang aman untuk intercept -inf (genre dengan satu kelas)
+        return np.exp(-np.logaddexp(0, -logits))
+    
+    def _top_genres(self, scores):
+        """Mengambil top 5 genre dengan urutan yang sama seperti FilmRecommender.predict"""
+        sorted_indices = np.argsort(scores)[::-1][:min(5, len(self.genres))]
+        return {
+            'top_genres': [{'genre': self.genres[i], 'confidence': float(scores[i])} for i in sorted_indices]
+        }
+    
+    def predict(self, text):
+        """
+        Memprediksi genre film berdasarkan teks preferensi pengguna
+        
+        Parameters
+        ----------
+        text : str
+            Teks preferensi pengguna
+        
+        Returns
+        -------
+        dict
+            Dictionary berisi hasil prediksi dengan confidence score
+        """
+        return self._top_genres(self._scores([preprocess_text(text)])[0])
+    
+    def predict_batch(self, texts, workers=None, report=False):
+        """
+        Memprediksi genre film untuk banyak teks sekaligus
+        
+        Parameters
+        ----------
+        texts : list
+            List teks preferensi pengguna
+        workers : int, optional
+            Jumlah proses worker untuk preprocessing, by default None
+        report : bool, optional
+            Cetak laporan preprocessing, by default False
+        
+        Returns
+        -------
+        list
+            List dictionary hasil prediksi (format sama dengan `predict`)
+        """
+        texts_prep = preprocess_batch(texts, workers=workers, report=report)
+        return [self._top_genres(scores) for scores in self._scores(texts_prep)]
+    
+    def train_from_csv(self, csv_path, **kwargs):
+        """
+        Melatih ulang model scikit-learn lalu memuat hasil ekspornya.
+        Parameter sama dengan FilmRecommender.train_from_csv.
+        
+        Returns
+        -------
+        dict
+            Dictionary berisi metrik evaluasi model
+        """
+        # Import lokal agar runtime compact tidak memuat scikit-learn saat inferensi
+        from backend.models.classifier import FilmRecommender
+        
+        recommender = FilmRecommender()
+        evaluation = recommender.train_from_csv(csv_path, **kwargs)
+        if evaluation:
+            self.path = compact_path(recommender.model_path)
+            self._load()
+        
+        return evaluation
+
+def open_recommender(runtime=None, model_path=DEFAULT_MODEL_PATH):
+    """
+    Membuka model rekomendasi sesuai konfigurasi.
+    
+    Runtime dipilih dari argumen atau environment variable RECOMMENDER_RUNTIME
+    ('sklearn' atau 'compact', default 'sklearn'). Untuk runtime compact,
+    file .npz dipakai jika masih sesuai dengan artifact joblib; jika tidak
+    ada atau usang, model diekspor ulang dari artifact joblib.
+    
+    Parameters
+    ----------
+    runtime : str, optional
+        'sklearn' atau 'compact', by default None (dari environment)
+    model_path : str, optional
+        Path artifact joblib, by default 'models/film_recommender.joblib'
+    
+    Returns
+    -------
+    FilmRecommender or CompactRecommender
+        Model rekomendasi
+    """
+    runtime = (runtime or os.environ.get('RECOMMENDER_RUNTIME', 'sklearn')).lower()
+    if runtime not in RECOMMENDER_RUNTIMES:
+        raise ValueError(f"Runtime model '{runtime}' tidak dikenal. Pilihan: {', '.join(RECOMMENDER_RUNTIMES)}")
+    
+    if runtime == 'compact':
+        compact = CompactRecommender.open_if_fresh(compact_path(model_path), model_path)
+        if compact is not None:
+            return compact
+    
+    # Import lokal agar runtime compact tidak memuat scikit-learn
+    from backend.models.classifier import FilmRecommender
+    
+    recommender = FilmRecommender()
+    if runtime == 'compact' and recommender.multilabel_binarizer is not None:
+        print("Model compact tidak ada atau usang, mengekspor ulang dari artifact joblib")
+        return CompactRecommender(export_compact(recommender))
+    
+    return recommender
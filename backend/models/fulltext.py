@@ -0,0 +1,416 @@
+"""
+Pencarian teks lengkap (full-text) BM25 atas judul, deskripsi, dan aktor film
+"""
+import os
+from collections import Counter
+import numpy as np
+import joblib
+
+from backend.utils.preprocessor import preprocess_text
+from backend.models.similarity import FilmSimilarity
+
+# Bobot setiap field dalam frekuensi term (BM25F sederhana)
+FIELD_WEIGHTS = {
+    'title': 2.0,
+    'description': 1.0,
+    'actors': 1.0
+}
+
+class FullTextIndex:
+    """
+    Inverted index BM25 untuk film. Setiap term menyimpan posting berupa
+    array id film (int32) dan skor dampak BM25 yang sudah dihitung (float32),
+    terurut dari dampak terbesar. Pencarian top-k berhenti lebih awal begitu
+    film di luar kandidat tidak mungkin lagi masuk top-k.
+    """
+    
+    def __init__(self, films_data, k1=1.5, b=0.75, index_path=None):
+        """
+        Inisialisasi index full-text
+        
+        Parameters
+        ----------
+        films_data : dict
+            Dictionary berisi informasi film
+        k1 : float, optional
+            Parameter saturasi frekuensi term BM25, by default 1.5
+        b : float, optional
+            Parameter normalisasi panjang dokumen BM25, by default 0.75
+        index_path : str, optional
+            Path file index, by default 'models/film_fulltext.joblib'
+        """
+        self.films_data = films_data
+        self.k1 = k1
+        self.b = b
+        self.index_path = index_path or os.path.join('models', 'film_fulltext.joblib')
+        
+        self.film_names = []
+        self.vocabulary = {}
+        self.term_offsets = np.zeros(1, dtype=np.int64)
+        self.doc_ids = np.empty(0, dtype=np.int32)
+        self.impacts = np.empty(0, dtype=np.float32)
+        
+        # Muat index jika sudah ada dan masih sesuai dengan database film
+        if os.path.exists(self.index_path):
+            self._load_index()
+    
+    @staticmethod
+    def analyze(text):
+        """
+        Mengubah teks menjadi daftar term: normalisasi, hapus stopword, dan stemming
+        
+        Parameters
+        ----------
+        text : str
+            Teks yang akan dianalisis
+        
+        Returns
+        -------
+        list
+            Daftar term
+        """
+        return preprocess_text(text).split()
+    
+    def _film_fields(self, film_name, film_data):
+        """
+        Menyusun term setiap field satu film
+        
+        Parameters
+        ----------
+        film_name : str
+            Nama film
+        film_data : dict
+            Informasi film
+        
+        Returns
+        -------
+        dict
+            Daftar term per field
+        """
+        return {
+            'title': self.analyze(film_data.get('title', film_name)),
+            'description': self.analyze(film_data.get('description', '')),
+            'actors': self.analyze(" ".join(film_data.get('actors', [])))
+        }
+    
+    def build(self):
+        """
+        Membangun dan menyimpan index dari database film
+        """
+        film_names = list(self.films_data.keys())
+        documents = [self._film_fields(name, self.films_data[name]) for name in film_names]
+        self.build_from_fields(film_names, documents)
+        self._save_index()
+    
+    def build_from_fields(self, film_names, documents):
+        """
+        Membangun posting BM25 dari term yang sudah dianalisis
+        
+        Parameters
+        ----------
+        film_names : list
+            Daftar nama film
+        documents : list
+            Daftar dictionary field -> daftar term, sejajar dengan film_names
+        """
+        self.film_names = list(film_names)
+        
+        # Frekuensi term berbobot per field dan panjang dokumen berbobot
+        doc_terms = []
+        doc_lengths = np.zeros(len(documents), dtype=np.float64)
+        for i, fields in enumerate(documents):
+            frequencies = Counter()
+            for field, terms in fields.items():
+                weight = FIELD_WEIGHTS.get(field, 1.0)
+                for term in terms:
+                    frequencies[term] += weight
+                doc_lengths[i] += weight * len(terms)
+            doc_terms.append(frequencies)
+        
+        avg_length = doc_lengths.mean() if len(documents) and doc_lengths.mean() > 0 else 1.0
+        length_norm = self.k1 * (1 - self.b + self.b * doc_lengths / avg_length)
+        
+        # Kumpulkan pasangan (term, film, frekuensi)
+        self.vocabulary = {}
+        term_ids, film_ids, frequencies = [], [], []
+        for i, terms in enumerate(doc_terms):
+            for term, frequency in terms.items():
+                term_ids.append(self.vocabulary.setdefault(term, len(self.vocabulary)))
+                film_ids.append(i)
+                frequencies.append(frequency)
+        
+        term_ids = np.asarray(term_ids, dtype=np.int64)
+        film_ids = np.asarray(film_ids, dtype=np.int32)
+        frequencies = np.asarray(frequencies, dtype=np.float64)
+        
+        # IDF BM25 (selalu positif) dan skor dampak setiap posting
+        doc_freq = np.bincount(term_ids, minlength=len(self.vocabulary))
+        n_docs = len(documents)
+        idf = np.log(1 + (n_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+        impacts = idf[term_ids] * frequencies * (self.k1 + 1) / (frequencies + length_norm[film_ids])
+        
+        # Posting per term, terurut dari dampak terbesar (seri: id film terkecil)
+        order = np.lexsort((film_ids, -impacts, term_ids))
+        self.doc_ids = film_ids[order]
+        self.impacts = impacts[order].astype(np.float32)
+        self.term_offsets = np.zeros(len(self.vocabulary) + 1, dtype=np.int64)
+        np.cumsum(doc_freq, out=self.term_offsets[1:])
+    
+    def _query_terms(self, query):
+        """
+        Mengambil id term query yang ada di vocabulary beserta frekuensinya
+        
+        Parameters
+        ----------
+        query : str
+            Teks query
+        
+        Returns
+        -------
+        list
+            List tuple (id term, frekuensi di query)
+        """
+        counts = Counter(self.analyze(query))
+        return [(self.vocabulary[term], count) for term, count in counts.items() if term in self.vocabulary]
+    
+    def match_ids(self, query):
+        """
+        Mengambil semua film yang memuat minimal satu term query
+        
+        Parameters
+        ----------
+        query : str
+            Teks query
+        
+        Returns
+        -------
+        numpy.ndarray
+            Id film yang cocok (urut naik)
+        """
+        postings = [
+            self.doc_ids[self.term_offsets[term]:self.term_offsets[term + 1]]
+            for term, _ in self._query_terms(query)
+        ]
+        if not postings:
+            return np.empty(0, dtype=np.int32)
+        return np.unique(np.concatenate(postings))
+    
+    def search_ids(self, query, k=10, allowed=None, exhaustive=False):
+        """
+        Mencari top-k film dengan skor BM25 tertinggi.
+        
+        Term diproses dari batas atas dampak terbesar (term jarang lebih dulu).
+        Begitu skor film ke-k melebihi jumlah batas atas term yang tersisa,
+        film baru tidak mungkin lagi masuk top-k, sehingga term sisanya
+        (biasanya term umum dengan posting panjang) hanya dihitung untuk
+        kandidat yang masih bisa masuk top-k.
+        
+        Parameters
+        ----------
+        query : str
+            Teks query
+        k : int, optional
+            Jumlah film yang dikembalikan, by default 10
+        allowed : numpy.ndarray, optional
+            Mask boolean film yang boleh masuk hasil, by default None (semua)
+        exhaustive : bool, optional
+            True untuk menghitung semua posting tanpa penghentian dini
+            (untuk verifikasi), by default False
+        
+        Returns
+        -------
+        tuple
+            (numpy.ndarray id film, numpy.ndarray skor), terurut dari skor tertinggi
+        """
+        query_terms = self._query_terms(query)
+        if not query_terms or k <= 0:
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+        
+        # Posting terurut dari dampak terbesar, jadi posting pertama adalah batas atas term
+        bounds = [float(self.impacts[self.term_offsets[term]]) * count for term, count in query_terms]
+        order = np.argsort(bounds)[::-1]
+        query_terms = [query_terms[i] for i in order]
+        remaining = np.cumsum([bounds[i] for i in order][::-1])[::-1]
+        
+        scores = np.zeros(len(self.film_names), dtype=np.float32)
+        kth_score = 0.0
+        
+        for position, (term, count) in enumerate(query_terms):
+            # Film baru paling banyak mendapat remaining[position]; jika skor film
+            # ke-k sudah lebih besar, cukup lengkapi skor kandidat yang tersisa
+            if not exhaustive and kth_score > remaining[position]:
+                candidates = np.flatnonzero(scores >= kth_score - remaining[position])
+                self._score_candidates(scores, candidates, query_terms[position:])
+                return self._rank(candidates[self._top_k(scores[candidates], k)], scores)
+            
+            ids = self._score_term(scores, term, count, allowed)
+            
+            # Batas bawah skor film ke-k dari film di posting term ini saja,
+            # agar tidak perlu memilih top-k dari seluruh katalog
+            if len(ids) >= k:
+                kth_score = max(kth_score, float(np.partition(scores[ids], len(ids) - k)[len(ids) - k]))
+        
+        top = self._top_k(scores, k)
+        return self._rank(top[scores[top] > 0], scores)
+    
+    def _score_term(self, scores, term, count, allowed=None):
+        """
+        Menambahkan skor dampak satu term ke semua film di posting-nya
+        
+        Parameters
+        ----------
+        scores : numpy.ndarray
+            Akumulator skor (diubah langsung)
+        term : int
+            Id term
+        count : int
+            Frekuensi term di query
+        allowed : numpy.ndarray, optional
+            Mask boolean film yang boleh masuk hasil, by default None
+        
+        Returns
+        -------
+        numpy.ndarray
+            Id film yang mendapat skor
+        """
+        start, end = self.term_offsets[term], self.term_offsets[term + 1]
+        ids = self.doc_ids[start:end]
+        impacts = self.impacts[start:end] * count
+        if allowed is not None:
+            keep = allowed[ids]
+            ids, impacts = ids[keep], impacts[keep]
+        scores[ids] += impacts
+        return ids
+    
+    def _score_candidates(self, scores, candidates, query_terms):
+        """
+        Melengkapi skor kandidat top-k dengan term yang belum diproses
+        
+        Parameters
+        ----------
+        scores : numpy.ndarray
+            Akumulator skor (diubah langsung)
+        candidates : numpy.ndarray
+            Id film kandidat
+        query_terms : list
+            List tuple (id term, frekuensi di query) yang belum diproses
+        """
+        is_candidate = np.zeros(len(scores), dtype=bool)
+        is_candidate[candidates] = True
+        
+        for term, count in query_terms:
+            start, end = self.term_offsets[term], self.term_offsets[term + 1]
+            ids = self.doc_ids[start:end]
+            hits = is_candidate[ids]
+            scores[ids[hits]] += self.impacts[start:end][hits] * count
+    
+    @staticmethod
+    def _top_k(scores, k):
+        """
+        Mengambil posisi k skor tertinggi
+        
+        Parameters
+        ----------
+        scores : numpy.ndarray
+            Skor
+        k : int
+            Jumlah film
+        
+        Returns
+        -------
+        numpy.ndarray
+            Posisi dalam `scores`
+        """
+        if k >= len(scores):
+            return np.arange(len(scores))
+        
+        # Skor yang sama diputuskan dengan posisi terkecil agar hasil deterministik
+        kth_score = np.partition(scores, len(scores) - k)[len(scores) - k]
+        above = np.flatnonzero(scores > kth_score)
+        ties = np.flatnonzero(scores == kth_score)[:k - len(above)]
+        return np.concatenate([above, ties])
+    
+    @staticmethod
+    def _rank(top, scores):
+        """
+        Mengurutkan film berdasarkan skor tertinggi (seri: id film terkecil)
+        
+        Returns
+        -------
+        tuple
+            (numpy.ndarray id film, numpy.ndarray skor)
+        """
+        top = top[np.lexsort((top, -scores[top]))]
+        return top.astype(np.int32), scores[top]
+    
+    def search(self, query, top_n=5):
+        """
+        Mencari film berdasarkan deskripsi bebas, misalnya "film tentang planet gurun"
+        
+        Parameters
+        ----------
+        query : str
+            Teks query
+        top_n : int, optional
+            Jumlah film yang dikembalikan, by default 5
+        
+        Returns
+        -------
+        list
+            List tuple (nama_film, skor_bm25), terurut dari skor tertinggi
+        """
+        ids, scores = self.search_ids(query, top_n)
+        return [(self.film_names[i], float(score)) for i, score in zip(ids, scores)]
+    
+    def _save_index(self):
+        """
+        Menyimpan index ke file
+        """
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        
+        index_data = {
+            'fingerprint': FilmSimilarity.catalogue_fingerprint(self.films_data),
+            'k1': self.k1,
+            'b': self.b,
+            'film_names': self.film_names,
+            'vocabulary': self.vocabulary,
+            'term_offsets': self.term_offsets,
+            'doc_ids': self.doc_ids,
+            'impacts': self.impacts
+        }
+        
+        joblib.dump(index_data, self.index_path)
+        print(f"Index full-text film berhasil disimpan ke {self.index_path}")
+    
+    def _load_index(self):
+        """
+        Memuat index dari file jika masih sesuai dengan database film dan parameter BM25
+        """
+        try:
+            index_data = joblib.load(self.index_path)
+            
+            if (index_data['fingerprint'] != FilmSimilarity.catalogue_fingerprint(self.films_data)
+                    or (index_data['k1'], index_data['b']) != (self.k1, self.b)):
+                print("Index full-text film tidak sesuai dengan database film, perlu dibangun ulang")
+                return
+            
+            self.film_names = index_data['film_names']
+            self.vocabulary = index_data['vocabulary']
+            self.term_offsets = index_data['term_offsets']
+            self.doc_ids = index_data['doc_ids']
+            self.impacts = index_data['impacts']
+            
+            print(f"Index full-text film berhasil dimuat dari {self.index_path}")
+        except Exception as e:
+            print(f"Gagal memuat index full-text film: {e}")
+    
+    def is_ready(self):
+        """
+        Mengecek apakah index sudah tersedia
+        
+        Returns
+        -------
+        bool
+            True jika index sudah dimuat atau dibangun
+        """
+        return bool(self.film_names)
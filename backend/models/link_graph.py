@@ -0,0 +1,273 @@
+"""
+Graf tautan rekomendasi film dengan skor random walk with restart
+
+Daftar "recommendations" setiap film menjadi sisi graf tak berarah antara
+film tersebut dan judul yang direkomendasikan (judul di luar database ikut
+menjadi simpul). Untuk setiap simpul dihitung personalized PageRank
+(random walk with restart) secara offline; top-k skor per simpul disimpan
+sebagai matrix sparse (film x simpul). Rekomendasi untuk satu atau beberapa film cukup
+berupa penjumlahan baris matrix tersebut, sehingga film yang terhubung
+lewat beberapa lompatan (misalnya dua film yang merekomendasikan judul
+yang sama) ikut ditemukan.
+"""
+import os
+import numpy as np
+import joblib
+from scipy import sparse
+
+from backend.models.similarity import FilmSimilarity
+
+# Peluang walker kembali ke film awal di setiap langkah; makin besar makin
+# dekat rekomendasinya dengan tautan langsung
+RESTART_PROBABILITY = 0.3
+
+class RecommendationGraph:
+    """
+    Kelas untuk rekomendasi film dari graf tautan rekomendasi.
+    Skor random walk with restart dihitung offline dan disimpan.
+    """
+    
+    def __init__(self, films_data, top_k=50, restart=RESTART_PROBABILITY, model_path=None):
+        """
+        Inisialisasi graf rekomendasi
+        
+        Parameters
+        ----------
+        films_data : dict
+            Dictionary berisi informasi film
+        top_k : int, optional
+            Jumlah skor tertinggi yang disimpan untuk setiap simpul, by default 50
+        restart : float, optional
+            Peluang kembali ke simpul awal, by default RESTART_PROBABILITY
+        model_path : str, optional
+            Path file skor graf, by default 'models/film_link_graph.joblib'
+        """
+        self.films_data = films_data
+        self.top_k = top_k
+        self.restart = restart
+        self.model_path = model_path or os.path.join('models', 'film_link_graph.joblib')
+        
+        # Simpul graf: film di database lebih dulu, lalu judul rekomendasi di luar database
+        self.node_names = []
+        self.node_positions = {}
+        self.n_films = 0
+        self.scores = sparse.csr_matrix((0, 0), dtype=np.float32)
+        
+        # Muat skor jika sudah ada dan masih sesuai dengan database film
+        if os.path.exists(self.model_path):
+            self._load_model()
+    
+    def _build_adjacency(self):
+        """
+        Menyusun simpul dan matrix ketetanggaan tak berarah dari daftar rekomendasi
+        
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Matrix bobot sisi (simpul x simpul), simetris
+        """
+        self.node_names = list(self.films_data.keys())
+        self.n_films = len(self.node_names)
+        
+        # Judul dicocokkan tanpa membedakan huruf besar/kecil
+        positions = {name.lower(): i for i, name in enumerate(self.node_names)}
+        
+        rows, columns = [], []
+        for source, film_name in enumerate(list(self.node_names)):
+            for title in self.films_data[film_name].get('recommendations', []) or []:
+                title = title.strip()
+                key = title.lower()
+                if not title or positions.get(key) == source:
+                    continue
+                if key not in positions:
+                    positions[key] = len(self.node_names)
+                    self.node_names.append(title)
+                rows.append(source)
+                columns.append(positions[key])
+        
+        self.node_positions = {name: i for i, name in enumerate(self.node_names)}
+        
+        n_nodes = len(self.node_names)
+        links = sparse.csr_matrix((np.ones(len(rows)), (rows, columns)), shape=(n_nodes, n_nodes))
+        
+        # Tautan dianggap dua arah; tautan ganda dihitung sekali
+        adjacency = links + links.T
+        adjacency.data = np.minimum(adjacency.data, 1.0)
+        return adjacency.tocsr()
+    
+    def build(self, batch_size=256, tol=1e-6, max_iter=100):
+        """
+        Membangun dan menyimpan skor random walk with restart untuk setiap film
+        di database (judul di luar database hanya menjadi simpul perantara)
+        
+        Parameters
+        ----------
+        batch_size : int, optional
+            Jumlah film awal yang dihitung sekaligus, by default 256
+        tol : float, optional
+            Batas perubahan skor untuk berhenti iterasi, by default 1e-6
+        max_iter : int, optional
+            Jumlah iterasi maksimal, by default 100
+        """
+        adjacency = self._build_adjacency()
+        n_nodes = adjacency.shape[0]
+        
+        # Matrix transisi baris-stokastik; simpul tanpa tautan tidak berpindah
+        degree = np.asarray(adjacency.sum(axis=1)).ravel()
+        inverse_degree = np.divide(1.0, degree, out=np.zeros_like(degree), where=degree > 0)
+        transition_t = (sparse.diags(inverse_degree) @ adjacency).T.tocsr().astype(np.float32)
+        dangling = np.flatnonzero(degree == 0)
+        
+        k = min(self.top_k, n_nodes - 1)
+        blocks = []
+        for start in range(0, self.n_films, batch_size):
+            end = min(start + batch_size, self.n_films)
+            restart = np.zeros((n_nodes, end - start), dtype=np.float32)
+            restart[np.arange(start, end), np.arange(end - start)] = 1.0
+            
+            # Iterasi pangkat: r = a * e + (1 - a) * T^T r, untuk semua film awal di batch
+            scores = restart.copy()
+            for _ in range(max_iter):
+                updated = transition_t @ scores
+                updated *= 1 - self.restart
+                updated += restart * (self.restart + (1 - self.restart) * scores[dangling].sum(axis=0))
+                converged = np.abs(updated - scores).max() < tol
+                scores = updated
+                if converged:
+                    break
+            
+            blocks.append(self._top_k_rows(scores.T, start, k))
+        
+        self.scores = sparse.vstack(blocks, format='csr') if blocks else sparse.csr_matrix((0, n_nodes), dtype=np.float32)
+        self._save_model()
+    
+    @staticmethod
+    def _top_k_rows(scores, start, k):
+        """
+        Menyimpan k skor tertinggi per baris (tanpa simpul awal itu sendiri)
+        
+        Parameters
+        ----------
+        scores : numpy.ndarray
+            Skor (simpul awal x simpul)
+        start : int
+            Indeks simpul awal baris pertama
+        k : int
+            Jumlah skor yang disimpan per baris
+        
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Matrix sparse berisi skor top-k
+        """
+        scores = scores.copy()
+        scores[np.arange(scores.shape[0]), np.arange(start, start + scores.shape[0])] = 0.0
+        if k <= 0:
+            return sparse.csr_matrix(scores.shape, dtype=np.float32)
+        
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        rows = np.repeat(np.arange(scores.shape[0]), k)
+        mask = top_scores.ravel() > 0
+        return sparse.csr_matrix(
+            (top_scores.ravel()[mask].astype(np.float32), (rows[mask], top.ravel()[mask])),
+            shape=scores.shape
+        )
+    
+    def recommend(self, seeds, top_n=5, exclude=None, films_only=False):
+        """
+        Mengambil film dengan skor tertinggi dari satu atau beberapa film awal.
+        Skor beberapa film awal adalah jumlah (berbobot) skor masing-masing.
+        
+        Parameters
+        ----------
+        seeds : list or dict
+            Nama film awal (film di database), atau dictionary nama film -> bobot
+        top_n : int, optional
+            Jumlah rekomendasi, by default 5
+        exclude : iterable, optional
+            Nama film yang tidak boleh direkomendasikan, by default None
+            (film awal selalu dikecualikan)
+        films_only : bool, optional
+            Hanya film yang ada di database, by default False
+        
+        Returns
+        -------
+        list
+            List tuple (nama_film, skor, ada_di_database), terurut dari skor tertinggi
+        """
+        weights = seeds if isinstance(seeds, dict) else {name: 1.0 for name in seeds}
+        rows = [(self.node_positions[name], weight) for name, weight in weights.items()
+                if self.node_positions.get(name, self.n_films) < self.n_films]
+        if not rows or top_n <= 0:
+            return []
+        
+        # Baris CSR dibaca langsung; skor simpul yang sama dijumlahkan
+        indptr, indices, data = self.scores.indptr, self.scores.indices, self.scores.data
+        positions = [position for position, _ in rows]
+        candidates = np.concatenate([indices[indptr[p]:indptr[p + 1]] for p in positions])
+        scores = np.concatenate([data[indptr[p]:indptr[p + 1]] * weight for p, weight in rows])
+        if len(rows) > 1:
+            candidates, inverse = np.unique(candidates, return_inverse=True)
+            scores = np.bincount(inverse, weights=scores, minlength=len(candidates))
+        
+        excluded = list(positions) + [self.node_positions[name] for name in exclude or () if name in self.node_positions]
+        keep = ~np.isin(candidates, excluded)
+        if films_only:
+            keep &= candidates < self.n_films
+        candidates, scores = candidates[keep], scores[keep]
+        
+        # Skor sama diurutkan sesuai urutan simpul (urutan database dan daftar rekomendasi)
+        order = np.lexsort((candidates, -scores))[:top_n]
+        return [(self.node_names[candidates[i]], float(scores[i]), bool(candidates[i] < self.n_films)) for i in order]
+    
+    def _save_model(self):
+        """
+        Menyimpan skor graf ke file
+        """
+        os.makedirs(os.path.dirname(self.model_path), exist_ok=True)
+        
+        model_data = {
+            'fingerprint': FilmSimilarity.catalogue_fingerprint(self.films_data),
+            'top_k': self.top_k,
+            'restart': self.restart,
+            'node_names': self.node_names,
+            'n_films': self.n_films,
+            'scores': self.scores
+        }
+        
+        joblib.dump(model_data, self.model_path)
+        print(f"Graf rekomendasi film berhasil disimpan ke {self.model_path}")
+    
+    def _load_model(self):
+        """
+        Memuat skor graf dari file jika masih sesuai dengan database film
+        """
+        try:
+            model_data = joblib.load(self.model_path)
+            
+            if model_data['fingerprint'] != FilmSimilarity.catalogue_fingerprint(self.films_data):
+                print("Graf rekomendasi film tidak sesuai dengan database film, perlu dibangun ulang")
+                return
+            
+            self.top_k = model_data['top_k']
+            self.restart = model_data['restart']
+            self.node_names = model_data['node_names']
+            self.node_positions = {name: i for i, name in enumerate(self.node_names)}
+            self.n_films = model_data['n_films']
+            self.scores = model_data['scores']
+            
+            print(f"Graf rekomendasi film berhasil dimuat dari {self.model_path}")
+        except Exception as e:
+            print(f"Gagal memuat graf rekomendasi film: {e}")
+    
+    def is_ready(self):
+        """
+        Mengecek apakah skor graf sudah tersedia
+        
+        Returns
+        -------
+        bool
+            True jika skor sudah dimuat atau dibangun
+        """
+        return bool(self.node_names)
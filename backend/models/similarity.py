@@ -0,0 +1,335 @@
+"""
+Mesin kemiripan film berbasis konten (deskripsi, genre, sutradara, aktor)
+"""
+import os
+import numpy as np
+import joblib
+from scipy import sparse
+
+from backend.utils.preprocessor import preprocess_text
+from backend.models.storage import catalogue_fingerprint
+
+# Bobot setiap blok fitur dalam skor kemiripan
+FEATURE_WEIGHTS = {
+    'description': 0.4,
+    'genre': 0.4,
+    'people': 0.2
+}
+
+class FilmSimilarity:
+    """
+    Kelas untuk mencari film yang mirip berdasarkan konten film.
+    Tabel top-k tetangga terdekat dihitung offline dan disimpan,
+    sehingga pencarian "film seperti X" cukup berupa lookup tabel.
+    """
+    
+    def __init__(self, films_data, top_k=20, model_path=None):
+        """
+        Inisialisasi mesin kemiripan film
+        
+        Parameters
+        ----------
+        films_data : dict
+            Dictionary berisi informasi film
+        top_k : int, optional
+            Jumlah tetangga terdekat yang disimpan untuk setiap film, by default 20
+        model_path : str, optional
+            Path file tabel tetangga, by default 'models/film_similarity.joblib'
+        """
+        self.films_data = films_data
+        self.top_k = top_k
+        self.model_path = model_path or os.path.join('models', 'film_similarity.joblib')
+        
+        # Tabel tetangga: baris ke-i berisi indeks film tetangga dan skornya
+        self.film_names = []
+        self.film_positions = {}
+        self.neighbour_ids = np.empty((0, 0), dtype=np.int32)
+        self.neighbour_scores = np.empty((0, 0), dtype=np.float32)
+        
+        # Muat tabel jika sudah ada dan masih sesuai dengan database film
+        if os.path.exists(self.model_path):
+            self._load_model()
+    
+    @staticmethod
+    def catalogue_fingerprint(films_data):
+        """
+        Menghitung sidik jari isi database film
+        
+        Parameters
+        ----------
+        films_data : Mapping
+            Mapping berisi informasi film
+        
+        Returns
+        -------
+        str
+            Hash SHA-1 dari isi database film
+        """
+        # Penyimpanan lazy (SQLite) menyimpan sidik jari saat import
+        if hasattr(films_data, 'fingerprint'):
+            return films_data.fingerprint()
+        return catalogue_fingerprint(films_data)
+    
+    @staticmethod
+    def _feature_token(prefix, value):
+        """
+        Membuat token fitur terstruktur, misalnya "genre_sci_fi"
+        
+        Parameters
+        ----------
+        prefix : str
+            Awalan token ("genre", "director", "actor")
+        value : str
+            Nilai fitur
+        
+        Returns
+        -------
+        str
+            Token fitur tanpa spasi
+        """
+        return prefix + "_" + "_".join(value.lower().replace("-", " ").split())
+    
+    def _film_documents(self, film_name, film_data):
+        """
+        Menyusun dokumen teks untuk setiap blok fitur satu film
+        
+        Parameters
+        ----------
+        film_name : str
+            Nama film
+        film_data : dict
+            Informasi film
+        
+        Returns
+        -------
+        dict
+            Dokumen per blok: 'description' (judul dan deskripsi yang sudah
+            dipreprocessing), 'genre', dan 'people' (sutradara dan aktor)
+        """
+        text = f"{film_data.get('title', film_name)} {film_data.get('description', '')}"
+        
+        genres = [self._feature_token("genre", genre) for genre in film_data.get("genre", [])]
+        
+        people = [self._feature_token("actor", actor) for actor in film_data.get("actors", [])]
+        if film_data.get("director"):
+            people.append(self._feature_token("director", film_data["director"]))
+        
+        return {
+            'description': preprocess_text(text),
+            'genre': " ".join(genres),
+            'people': " ".join(people)
+        }
+    
+    def _build_feature_matrix(self):
+        """
+        Membangun matrix fitur film dari blok deskripsi, genre, dan orang.
+        Setiap blok dinormalisasi lalu diberi bobot sehingga dot product dua
+        baris sama dengan rata-rata berbobot cosine similarity per blok.
+        
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Matrix fitur film dengan norma L2 = 1 (untuk film yang punya fitur)
+        """
+        # scikit-learn hanya dibutuhkan saat membangun tabel; tabel tersimpan dimuat tanpa scikit-learn
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.preprocessing import normalize
+        
+        documents = [self._film_documents(name, self.films_data[name]) for name in self.film_names]
+        
+        blocks = []
+        for block, weight in FEATURE_WEIGHTS.items():
+            block_docs = [doc[block] for doc in documents]
+            if not any(block_docs):
+                continue
+            
+            vectorizer = TfidfVectorizer(token_pattern=r'\S+', sublinear_tf=True)
+            blocks.append(vectorizer.fit_transform(block_docs) * np.sqrt(weight))
+        
+        # Tidak ada blok fitur sama sekali (misalnya film tanpa deskripsi, genre, dan orang)
+        if not blocks:
+            return sparse.csr_matrix((len(self.film_names), 0))
+        
+        return normalize(sparse.hstack(blocks).tocsr())
+    
+    def build(self, batch_size=1024):
+        """
+        Membangun dan menyimpan tabel top-k tetangga terdekat untuk semua film
+        
+        Parameters
+        ----------
+        batch_size : int, optional
+            Jumlah baris yang dihitung kemiripannya sekaligus, by default 1024
+        """
+        self.film_names = list(self.films_data.keys())
+        self.film_positions = {name: i for i, name in enumerate(self.film_names)}
+        
+        if not self.film_names:
+            return
+        
+        matrix = self._build_feature_matrix()
+        self.neighbour_ids, self.neighbour_scores = self._top_k_neighbours(matrix, batch_size)
+        self._save_model()
+    
+    def _top_k_neighbours(self, matrix, batch_size):
+        """
+        Menghitung top-k tetangga per film secara bertahap (per batch baris)
+        agar memori tetap terbatas untuk katalog besar
+        
+        Parameters
+        ----------
+        matrix : scipy.sparse.csr_matrix
+            Matrix fitur film yang sudah dinormalisasi
+        batch_size : int
+            Jumlah baris per batch
+        
+        Returns
+        -------
+        tuple
+            (numpy.ndarray indeks tetangga, numpy.ndarray skor tetangga);
+            slot kosong berisi indeks -1
+        """
+        n_films = matrix.shape[0]
+        k = min(self.top_k, n_films - 1)
+        neighbour_ids = np.full((n_films, k), -1, dtype=np.int32)
+        neighbour_scores = np.zeros((n_films, k), dtype=np.float32)
+        
+        if k <= 0:
+            return neighbour_ids, neighbour_scores
+        
+        matrix_t = matrix.T.tocsc()
+        for start in range(0, n_films, batch_size):
+            end = min(start + batch_size, n_films)
+            sims = (matrix[start:end] @ matrix_t).toarray()
+            
+            # Film tidak boleh menjadi tetangga dirinya sendiri
+            sims[np.arange(end - start), np.arange(start, end)] = -1.0
+            
+            top = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(sims, top, axis=1)
+            order = np.argsort(-top_scores, axis=1)
+            top = np.take_along_axis(top, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+            
+            # Abaikan tetangga tanpa kemiripan sama sekali
+            top[top_scores <= 0] = -1
+            neighbour_ids[start:end] = top
+            neighbour_scores[start:end] = np.maximum(top_scores, 0)
+        
+        return neighbour_ids, neighbour_scores
+    
+    def similar_films(self, film_name, top_n=5):
+        """
+        Mengambil film yang paling mirip dengan film tertentu
+        
+        Parameters
+        ----------
+        film_name : str
+            Nama film
+        top_n : int, optional
+            Jumlah film mirip yang dikembalikan, by default 5
+        
+        Returns
+        -------
+        list
+            List tuple (nama_film, skor_kemiripan), terurut dari yang paling mirip
+        """
+        row = self.film_positions.get(film_name)
+        if row is None:
+            return []
+        
+        similar = []
+        for film_id, score in zip(self.neighbour_ids[row, :top_n], self.neighbour_scores[row, :top_n]):
+            if film_id < 0:
+                break
+            similar.append((self.film_names[film_id], float(score)))
+        
+        return similar
+    
+    def similar_to_films(self, film_names, top_n=5, exclude=None):
+        """
+        Mengambil film yang paling mirip dengan beberapa film sekaligus.
+        Baris tetangga semua film awal dijumlahkan, sehingga film yang mirip
+        dengan lebih banyak film awal mendapat skor lebih tinggi; film yang
+        tidak ada di tabel tetangga sebuah film awal dihitung 0.
+        
+        Parameters
+        ----------
+        film_names : list
+            Nama film awal
+        top_n : int, optional
+            Jumlah film mirip yang dikembalikan, by default 5
+        exclude : iterable, optional
+            Nama film yang tidak boleh dikembalikan, by default None
+            (film awal selalu dikecualikan)
+        
+        Returns
+        -------
+        list
+            List tuple (nama_film, skor_kemiripan rata-rata), terurut dari yang paling mirip
+        """
+        rows = [self.film_positions[name] for name in dict.fromkeys(film_names) if name in self.film_positions]
+        if not rows or top_n <= 0:
+            return []
+        
+        ids = self.neighbour_ids[rows].ravel()
+        scores = self.neighbour_scores[rows].ravel()
+        excluded = rows + [self.film_positions[name] for name in exclude or () if name in self.film_positions]
+        keep = (ids >= 0) & ~np.isin(ids, excluded)
+        ids, scores = ids[keep], scores[keep]
+        
+        # Skor sama diurutkan sesuai posisi pertama di tabel tetangga
+        candidates, first, inverse = np.unique(ids, return_index=True, return_inverse=True)
+        totals = np.bincount(inverse, weights=scores, minlength=len(candidates)) / len(rows)
+        order = np.lexsort((first, -totals))[:top_n]
+        
+        return [(self.film_names[candidates[i]], float(totals[i])) for i in order]
+    
+    def _save_model(self):
+        """
+        Menyimpan tabel tetangga ke file
+        """
+        os.makedirs(os.path.dirname(self.model_path), exist_ok=True)
+        
+        model_data = {
+            'fingerprint': self.catalogue_fingerprint(self.films_data),
+            'top_k': self.top_k,
+            'film_names': self.film_names,
+            'neighbour_ids': self.neighbour_ids,
+            'neighbour_scores': self.neighbour_scores
+        }
+        
+        joblib.dump(model_data, self.model_path)
+        print(f"Tabel kemiripan film berhasil disimpan ke {self.model_path}")
+    
+    def _load_model(self):
+        """
+        Memuat tabel tetangga dari file jika masih sesuai dengan database film
+        """
+        try:
+            model_data = joblib.load(self.model_path)
+            
+            if model_data['fingerprint'] != self.catalogue_fingerprint(self.films_data):
+                print("Tabel kemiripan film tidak sesuai dengan database film, perlu dibangun ulang")
+                return
+            
+            self.top_k = model_data['top_k']
+            self.film_names = model_data['film_names']
+            self.film_positions = {name: i for i, name in enumerate(self.film_names)}
+            self.neighbour_ids = model_data['neighbour_ids']
+            self.neighbour_scores = model_data['neighbour_scores']
+            
+            print(f"Tabel kemiripan film berhasil dimuat dari {self.model_path}")
+        except Exception as e:
+            print(f"Gagal memuat tabel kemiripan film: {e}")
+    
+    def is_ready(self):
+        """
+        Mengecek apakah tabel tetangga sudah tersedia
+        
+        Returns
+        -------
+        bool
+            True jika tabel sudah dimuat atau dibangun
+        """
+        return bool(self.film_names)
@@ -0,0 +1,504 @@
+"""
+Snapshot biner katalog film untuk start server yang cepat
+
+Snapshot menyimpan data film, FAQ, dan indeks turunan dalam satu file
+yang di-memory-map. Data film didekode per record saat dibutuhkan
+sehingga server tidak perlu mem-parsing seluruh films.json saat start.
+
+Format file (little-endian):
+    MAGIC (8 byte) | versi (uint32) | panjang header (uint32) | header JSON
+    | section-section, masing-masing rata 8 byte
+
+Header berisi versi, sidik jari katalog, informasi file sumber (ukuran,
+mtime, SHA-1) untuk cek kesegaran, dan posisi (offset, panjang) setiap section.
+
+Field indeks (INDEX_FIELDS) disimpan per field sebagai tabel offset dan blob
+nilai JSON per film (kosong jika film tidak memiliki field tersebut), dan
+field numerik (NUMERIC_FIELDS) sebagai kolom float64 lebar tetap (NaN jika
+tidak diketahui). Keduanya dibaca langsung dari mmap tanpa mendekode
+seluruh katalog.
+"""
+import os
+import json
+import mmap
+import struct
+import hashlib
+from collections.abc import Mapping
+import numpy as np
+
+from backend.models.storage import (
+    FilmStore, LazyFilms, NUMERIC_FIELDS, catalogue_fingerprint, numeric_values, match_text
+)
+
+SNAPSHOT_MAGIC = b'FFSNAP\x00\x00'
+SNAPSHOT_VERSION = 2
+HEADER_FORMAT = '<8sII'
+
+# Field film yang dibutuhkan untuk membangun indeks (tanpa deskripsi)
+INDEX_FIELDS = ('title', 'genre', 'director', 'actors', 'release_year', 'rating', 'duration', 'recommendations')
+
+def file_signature(path, with_hash=True):
+    """
+    Mengambil ukuran, waktu modifikasi, dan hash SHA-1 sebuah file
+    
+    Parameters
+    ----------
+    path : str
+        Path file
+    with_hash : bool, optional
+        True untuk menghitung SHA-1 isi file, by default True
+    
+    Returns
+    -------
+    dict or None
+        Dictionary dengan key 'size', 'mtime_ns', dan 'sha1'; None jika file tidak ada
+    """
+    if not os.path.exists(path):
+        return None
+    
+    stat = os.stat(path)
+    signature = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    
+    if with_hash:
+        digest = hashlib.sha1()
+        with open(path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1 << 20), b''):
+                digest.update(chunk)
+        signature['sha1'] = digest.hexdigest()
+    
+    return signature
+
+def _offsets_and_blob(chunks):
+    """
+    Menggabungkan potongan bytes menjadi blob dan tabel offset (n + 1 entri)
+    
+    Parameters
+    ----------
+    chunks : list
+        List bytes
+    
+    Returns
+    -------
+    tuple
+        (numpy.ndarray offset uint64, bytes blob)
+    """
+    offsets = np.zeros(len(chunks) + 1, dtype='<u8')
+    np.cumsum([len(chunk) for chunk in chunks], out=offsets[1:])
+    return offsets, b''.join(chunks)
+
+def write_snapshot(path, films_data, faq_data, derived, sources):
+    """
+    Menulis snapshot katalog ke file (menimpa file lama secara atomik)
+    
+    Parameters
+    ----------
+    path : str
+        Path file snapshot
+    films_data : dict
+        Dictionary berisi informasi film
+    faq_data : dict
+        Data FAQ chatbot
+    derived : dict
+        Indeks turunan: 'genre_index' (genre -> list nama film),
+        'film_synonyms' (nama film -> list sinonim), 'all_genres' (list)
+    sources : dict
+        Informasi file sumber dari `file_signature`, misalnya {'films': ..., 'faq': ...}
+    """
+    film_names = list(films_data)
+    positions = {name: i for i, name in enumerate(film_names)}
+    
+    name_offsets, names_blob = _offsets_and_blob([name.encode('utf-8') for name in film_names])
+    record_offsets, records_blob = _offsets_and_blob([
+        json.dumps(films_data[name], ensure_ascii=False).encode('utf-8') for name in film_names
+    ])
+    
+    # Indeks genre dalam bentuk CSR: genre ke-i memiliki film genre_films[indptr[i]:indptr[i+1]]
+    genre_names = list(derived['genre_index'])
+    genre_indptr = np.zeros(len(genre_names) + 1, dtype='<u4')
+    np.cumsum([len(derived['genre_index'][genre]) for genre in genre_names], out=genre_indptr[1:])
+    genre_films = np.array(
+        [positions[name] for genre in genre_names for name in derived['genre_index'][genre]], dtype='<i4'
+    )
+    
+    sections = {
+        'name_offsets': name_offsets.tobytes(),
+        'names': names_blob,
+        'record_offsets': record_offsets.tobytes(),
+        'records': records_blob,
+        'genre_indptr': genre_indptr.tobytes(),
+        'genre_films': genre_films.tobytes(),
+        'faq': json.dumps(faq_data, ensure_ascii=False).encode('utf-8'),
+        'film_synonyms': json.dumps(derived['film_synonyms'], ensure_ascii=False).encode('utf-8')
+    }
+    
+    # Field indeks: tabel offset + blob nilai JSON per film (bytes kosong jika field tidak ada)
+    for field in INDEX_FIELDS:
+        value_offsets, values_blob = _offsets_and_blob([
+            json.dumps(films_data[name][field], ensure_ascii=False).encode('utf-8')
+            if field in films_data[name] else b''
+            for name in film_names
+        ])
+        sections[f'index_{field}_offsets'] = value_offsets.tobytes()
+        sections[f'index_{field}'] = values_blob
+    
+    # Field numerik sebagai kolom lebar tetap
+    for field in NUMERIC_FIELDS:
+        column = numeric_values(films_data[name].get(field) for name in film_names)
+        sections[f'numeric_{field}'] = column.astype('<f8').tobytes()
+    
+    header = {
+        'version': SNAPSHOT_VERSION,
+        'fingerprint': catalogue_fingerprint(films_data),
+        'sources': sources,
+        'n_films': len(film_names),
+        'genres': genre_names,
+        'all_genres': derived['all_genres'],
+        'sections': {}
+    }
+    
+    # Offset section bergantung pada panjang header, jadi dihitung ulang sampai stabil
+    while True:
+        header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+        position = struct.calcsize(HEADER_FORMAT) + len(header_bytes)
+        layout = {}
+        for name, data in sections.items():
+            position += -position % 8
+            layout[name] = [position, len(data)]
+            position += len(data)
+        
+        if layout == header['sections']:
+            break
+        header['sections'] = layout
+    
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as file:
+        file.write(struct.pack(HEADER_FORMAT, SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(header_bytes)))
+        file.write(header_bytes)
+        for name, data in sections.items():
+            file.write(b'\x00' * (header['sections'][name][0] - file.tell()))
+            file.write(data)
+    
+    os.replace(temp_path, path)
+
+def read_header(path):
+    """
+    Membaca header snapshot tanpa memuat section
+    
+    Parameters
+    ----------
+    path : str
+        Path file snapshot
+    
+    Returns
+    -------
+    dict
+        Header snapshot
+    
+    Raises
+    ------
+    ValueError
+        Jika file bukan snapshot atau versinya tidak didukung
+    """
+    with open(path, 'rb') as file:
+        prefix = file.read(struct.calcsize(HEADER_FORMAT))
+        if len(prefix) < struct.calcsize(HEADER_FORMAT):
+            raise ValueError("File snapshot tidak lengkap")
+        
+        magic, version, header_length = struct.unpack(HEADER_FORMAT, prefix)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("File bukan snapshot katalog film")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Versi snapshot {version} tidak didukung (versi saat ini {SNAPSHOT_VERSION})")
+        
+        return json.loads(file.read(header_length))
+
+def is_snapshot_fresh(header, sources):
+    """
+    Mengecek apakah snapshot dibuat dari versi file sumber yang sekarang.
+    Ukuran dan mtime dibandingkan lebih dulu; hash SHA-1 hanya dihitung
+    jika mtime berubah (misalnya setelah git checkout).
+    
+    Parameters
+    ----------
+    header : dict
+        Header snapshot
+    sources : dict
+        Path file sumber, misalnya {'films': 'data/films.json', 'faq': ...}
+    
+    Returns
+    -------
+    bool
+        True jika semua file sumber tidak berubah
+    """
+    recorded = header.get('sources', {})
+    
+    for key, path in sources.items():
+        expected = recorded.get(key)
+        current = file_signature(path, with_hash=False)
+        
+        if expected is None or current is None:
+            if expected != current:
+                return False
+            continue
+        
+        if current['size'] != expected['size']:
+            return False
+        if current['mtime_ns'] != expected['mtime_ns'] and file_signature(path)['sha1'] != expected['sha1']:
+            return False
+    
+    return True
+
+class LazyIndexRecords(Mapping):
+    """
+    Mapping nama film -> record indeks (INDEX_FIELDS) yang didekode dari
+    snapshot setiap kali diakses. Tidak ada record yang disimpan di memori.
+    """
+    
+    def __init__(self, store):
+        """
+        Inisialisasi mapping lazy
+        
+        Parameters
+        ----------
+        store : SnapshotFilmStore
+            Snapshot katalog
+        """
+        self._store = store
+    
+    def __getitem__(self, film_name):
+        record = self._store.index_record(film_name)
+        if record is None:
+            raise KeyError(film_name)
+        return record
+    
+    def __contains__(self, film_name):
+        return film_name in self._store._positions
+    
+    def __iter__(self):
+        return iter(self._store._names)
+    
+    def __len__(self):
+        return len(self._store._names)
+
+class SnapshotFilmStore(FilmStore):
+    """
+    Penyimpanan film dari snapshot biner yang di-memory-map. Tabel offset
+    dan kolom numerik dibaca langsung dari mmap (tanpa salinan); setiap
+    record film dan nilai field indeks didekode saat diakses.
+    """
+    
+    def __init__(self, path, header=None, cache_size=1024):
+        """
+        Membuka snapshot katalog
+        
+        Parameters
+        ----------
+        path : str
+            Path file snapshot
+        header : dict, optional
+            Header yang sudah dibaca, by default None (dibaca dari file)
+        cache_size : int, optional
+            Jumlah data film yang disimpan di cache LRU, by default 1024
+        """
+        self.path = path
+        self.header = header or read_header(path)
+        
+        with open(path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        self._name_offsets = self._array('name_offsets', '<u8')
+        self._record_offsets = self._array('record_offsets', '<u8')
+        self._records_start = self.header['sections']['records'][0]
+        
+        names = self._section('names')
+        bounds = self._name_offsets.tolist()
+        self._names = [names[bounds[i]:bounds[i + 1]].decode('utf-8') for i in range(self.header['n_films'])]
+        self._positions = {name: i for i, name in enumerate(self._names)}
+        
+        # Tabel offset field indeks: field -> (offset, posisi awal blob)
+        self._field_offsets = {
+            field: (self._array(f'index_{field}_offsets', '<u8'), self.header['sections'][f'index_{field}'][0])
+            for field in INDEX_FIELDS
+        }
+        
+        self._films = LazyFilms(self, cache_size=cache_size)
+        self._index_records = LazyIndexRecords(self)
+        self._genre_index = None
+        self._faq = None
+        self._synonyms = None
+    
+    @classmethod
+    def open_if_fresh(cls, path, sources):
+        """
+        Membuka snapshot jika masih sesuai dengan file sumber
+        
+        Parameters
+        ----------
+        path : str
+            Path file snapshot
+        sources : dict
+            Path file sumber, misalnya {'films': 'data/films.json', 'faq': ...}
+        
+        Returns
+        -------
+        SnapshotFilmStore or None
+            Snapshot, atau None jika tidak ada, usang, atau tidak valid
+        """
+        if not os.path.exists(path):
+            return None
+        
+        try:
+            header = read_header(path)
+        except (OSError, ValueError) as e:
+            print(f"Snapshot katalog tidak dapat dibaca: {e}")
+            return None
+        
+        if not is_snapshot_fresh(header, sources):
+            print("Snapshot katalog sudah usang, memuat katalog dari JSON")
+            return None
+        
+        return cls(path, header)
+    
+    def _section(self, name):
+        """Mengambil isi section sebagai bytes"""
+        start, length = self.header['sections'][name]
+        return self._mmap[start:start + length]
+    
+    def _array(self, name, dtype):
+        """Mengambil section sebagai array NumPy tanpa salinan"""
+        start, length = self.header['sections'][name]
+        return np.frombuffer(self._mmap, dtype=dtype, count=length // np.dtype(dtype).itemsize, offset=start)
+    
+    @property
+    def films(self):
+        return self._films
+    
+    def fingerprint(self):
+        return self.header['fingerprint']
+    
+    def film_names(self):
+        return list(self._names)
+    
+    def get(self, film_name):
+        position = self._positions.get(film_name)
+        if position is None:
+            return None
+        
+        start = self._records_start + int(self._record_offsets[position])
+        end = self._records_start + int(self._record_offsets[position + 1])
+        return json.loads(self._mmap[start:end])
+    
+    def iter_films(self):
+        for film_name in self._names:
+            yield film_name, self.get(film_name)
+    
+    def _field_value(self, field, position, default=None):
+        """Mendekode nilai field indeks satu film, default jika film tidak memiliki field tersebut"""
+        offsets, blob_start = self._field_offsets[field]
+        start = blob_start + int(offsets[position])
+        end = blob_start + int(offsets[position + 1])
+        return json.loads(self._mmap[start:end]) if end > start else default
+    
+    def index_record(self, film_name):
+        """
+        Mendekode record indeks (INDEX_FIELDS) satu film
+        
+        Parameters
+        ----------
+        film_name : str
+            Nama film
+        
+        Returns
+        -------
+        dict or None
+            Record indeks, None jika film tidak ditemukan
+        """
+        position = self._positions.get(film_name)
+        if position is None:
+            return None
+        
+        missing = object()
+        record = {}
+        for field in INDEX_FIELDS:
+            value = self._field_value(field, position, missing)
+            if value is not missing:
+                record[field] = value
+        return record
+    
+    def index_records(self):
+        return self._index_records
+    
+    def field_values(self, field):
+        if field not in INDEX_FIELDS:
+            return [film_data.get(field) for _, film_data in self.iter_films()]
+        return [self._field_value(field, position) for position in range(len(self._names))]
+    
+    def numeric_column(self, field):
+        if field not in NUMERIC_FIELDS:
+            return super().numeric_column(field)
+        return self._array(f'numeric_{field}', '<f8')
+    
+    def _genre_positions(self, genre):
+        """Posisi film (array) dengan genre tersebut sesuai urutan database"""
+        indptr = self._array('genre_indptr', '<u4')
+        films = self._array('genre_films', '<i4')
+        g = self.header['genres'].index(genre)
+        return films[indptr[g]:indptr[g + 1]]
+    
+    def genre_index(self):
+        # Dibangun sekali dari CSR lalu dipakai bersama translator dan katalog
+        if self._genre_index is None:
+            self._genre_index = {
+                genre: [self._names[i] for i in self._genre_positions(genre)]
+                for genre in self.header['genres']
+            }
+        return self._genre_index
+    
+    def faq_data(self):
+        if self._faq is None:
+            self._faq = json.loads(self._section('faq'))
+        return self._faq
+    
+    def film_synonyms(self):
+        if self._synonyms is None:
+            synonyms = json.loads(self._section('film_synonyms'))
+            self._synonyms = {name: set(values) for name, values in synonyms.items()}
+        return self._synonyms
+    
+    def all_genres(self):
+        return list(self.header['all_genres'])
+    
+    def query(self, genre=None, director=None, year=None, rating_min=None, limit=None):
+        # Genre, tahun, dan rating disaring sebagai mask vektor; sutradara
+        # hanya didekode untuk film yang lolos
+        mask = np.ones(len(self._names), dtype=bool)
+        if genre:
+            genre = genre.lower()
+            mask[:] = False
+            for name in self.header['genres']:
+                if name.lower() == genre:
+                    mask[self._genre_positions(name)] = True
+        if year is not None:
+            mask &= self.numeric_column('release_year') == year
+        if rating_min is not None:
+            ratings = self.numeric_column('rating')
+            mask &= np.where(np.isnan(ratings), 0.0, ratings) >= rating_min
+        
+        director = director.lower() if director else None
+        results = []
+        for position in np.flatnonzero(mask):
+            if director and str(self._field_value('director', position, '')).lower() != director:
+                continue
+            
+            results.append(self._names[position])
+            if limit is not None and len(results) >= limit:
+                break
+        
+        return results
+    
+    def search_text(self, text, limit=10):
+        return match_text(self.iter_films(), text, limit)
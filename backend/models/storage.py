@@ -0,0 +1,817 @@
+"""
+Penyimpanan database film: file JSON (default) atau SQLite dengan FTS5
+"""
+import os
+import re
+import copy
+import json
+import sqlite3
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping, ItemsView, ValuesView
+import numpy as np
+
+# Data contoh jika database film belum ada
+DEFAULT_FILMS_DATA = {
+    "Dune": {
+        "title": "Dune",
+        "release_year": 2021,
+        "director": "Denis Villeneuve",
+        "genre": ["Sci-Fi", "Action", "Adventure", "Drama"],
+        "description": "Film yang mengadaptasi novel fiksi ilmiah terkenal karya Frank Herbert.",
+        "rating": 8.0,
+        "recommendations": ["Blade Runner 2049", "Arrival", "Interstellar"]
+    }
+}
+
+# Data FAQ contoh jika file FAQ chatbot belum ada
+DEFAULT_FAQ_DATA = {
+    "umum": {
+        "rekomendasi film action terbaru": "Beberapa film action terbaru yang direkomendasikan termasuk 'John Wick: Chapter 4', 'The Equalizer 3', dan 'Fast X'."
+    },
+    "genre_info": {
+        "Action": "Genre film dengan penekanan pada adegan kekerasan atau fisik seperti perkelahian, adegan kejar-kejaran, atau aksi ketangkasan."
+    },
+    "film_detail": {
+        "Dune": [
+            "film tentang planet gurun",
+            "film adaptasi novel",
+            "film denis villeneuve"
+        ]
+    }
+}
+
+# Pilihan backend penyimpanan (environment variable FILM_STORAGE)
+STORAGE_BACKENDS = ('json', 'sqlite')
+
+# Field film yang tersedia sebagai kolom numerik (lihat FilmStore.numeric_column)
+NUMERIC_FIELDS = ('release_year', 'rating', 'duration')
+
+def catalogue_fingerprint(films_data):
+    """
+    Menghitung sidik jari isi database film
+    
+    Parameters
+    ----------
+    films_data : dict
+        Dictionary berisi informasi film
+    
+    Returns
+    -------
+    str
+        Hash SHA-1 dari isi database film
+    """
+    payload = json.dumps(films_data, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+def load_faq_data(path):
+    """
+    Memuat data FAQ chatbot dari JSON. Jika file tidak ada, akan dibuat data contoh.
+    
+    Parameters
+    ----------
+    path : str
+        Path file JSON FAQ
+    
+    Returns
+    -------
+    dict
+        Dictionary berisi pertanyaan dan jawaban umum
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        # Buat contoh data default jika file tidak ditemukan
+        default_data = copy.deepcopy(DEFAULT_FAQ_DATA)
+        
+        # Simpan data default
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(default_data, file, ensure_ascii=False, indent=4)
+        
+        return default_data
+
+def numeric_values(values):
+    """
+    Mengubah nilai field film menjadi kolom float, NaN jika tidak valid
+    
+    Parameters
+    ----------
+    values : iterable
+        Nilai field sesuai urutan database (None jika tidak ada)
+    
+    Returns
+    -------
+    numpy.ndarray
+        Array float64
+    """
+    column = []
+    for value in values:
+        try:
+            column.append(float(value))
+        except (TypeError, ValueError):
+            column.append(np.nan)
+    return np.array(column, dtype=np.float64)
+
+def filter_films(film_items, genre=None, director=None, year=None, rating_min=None, limit=None):
+    """
+    Menyaring film dengan memindai (nama, data) satu per satu
+    
+    Parameters
+    ----------
+    film_items : iterable
+        Pasangan (nama film, data film) sesuai urutan database
+    genre, director, year, rating_min, limit
+        Lihat `FilmStore.query`
+    
+    Returns
+    -------
+    list
+        Nama film sesuai urutan database
+    """
+    genre = genre.lower() if genre else None
+    director = director.lower() if director else None
+    
+    results = []
+    for film_name, film_data in film_items:
+        if genre and genre not in [g.lower() for g in film_data.get('genre', [])]:
+            continue
+        if director and str(film_data.get('director', '')).lower() != director:
+            continue
+        if year is not None and film_data.get('release_year') != year:
+            continue
+        if rating_min is not None and not (film_data.get('rating') or 0) >= rating_min:
+            continue
+        
+        results.append(film_name)
+        if limit is not None and len(results) >= limit:
+            break
+    
+    return results
+
+def match_text(film_items, text, limit=10):
+    """
+    Mengurutkan film berdasarkan jumlah kata teks yang muncul di judul,
+    deskripsi, atau daftar aktor
+    
+    Parameters
+    ----------
+    film_items : iterable
+        Pasangan (nama film, data film) sesuai urutan database
+    text : str
+        Teks pencarian
+    limit : int, optional
+        Jumlah maksimum film, by default 10
+    
+    Returns
+    -------
+    list
+        Nama film, yang paling relevan lebih dulu
+    """
+    words = set(re.findall(r'\w+', text.lower()))
+    if not words:
+        return []
+    
+    scored = []
+    for film_name, film_data in film_items:
+        document = " ".join([
+            film_data.get('title', film_name),
+            film_data.get('description', ''),
+            " ".join(film_data.get('actors', []))
+        ]).lower()
+        hits = len(words & set(re.findall(r'\w+', document)))
+        if hits:
+            scored.append((-hits, len(scored), film_name))
+    
+    return [film_name for _, _, film_name in sorted(scored)[:limit]]
+
+class FilmStore(ABC):
+    """
+    Antarmuka penyimpanan database film. Translator dan chatbot mengakses
+    film melalui `films` (Mapping nama film -> data film) dan query berindeks.
+    
+    Backend SQLite dan snapshot hanya membaca data film lengkap (deskripsi
+    dan seterusnya) saat dibutuhkan, dengan cache LRU. Yang tetap berada di
+    memori untuk semua backend adalah daftar nama film, indeks genre, dan
+    indeks yang dibangun translator dan chatbot saat start (sutradara,
+    aktor, tahun, rating, peringkat genre, sinonim film, pola nama film).
+    """
+    
+    @property
+    @abstractmethod
+    def films(self):
+        """Mapping nama film -> dictionary data film"""
+    
+    @abstractmethod
+    def fingerprint(self):
+        """Sidik jari isi database film (sama untuk semua backend)"""
+    
+    @abstractmethod
+    def film_names(self):
+        """
+        Mengambil semua nama film sesuai urutan database
+        
+        Returns
+        -------
+        list
+            Daftar nama film
+        """
+    
+    @abstractmethod
+    def query(self, genre=None, director=None, year=None, rating_min=None, limit=None):
+        """
+        Mencari nama film berdasarkan kolom berindeks
+        
+        Parameters
+        ----------
+        genre : str, optional
+            Genre film (tidak peka huruf besar/kecil), by default None
+        director : str, optional
+            Nama sutradara (tidak peka huruf besar/kecil), by default None
+        year : int, optional
+            Tahun rilis, by default None
+        rating_min : float, optional
+            Rating minimal, by default None
+        limit : int, optional
+            Jumlah maksimum film, by default None (semua)
+        
+        Returns
+        -------
+        list
+            Nama film sesuai urutan database
+        """
+    
+    @abstractmethod
+    def search_text(self, text, limit=10):
+        """
+        Mencari nama film yang judul, deskripsi, atau aktornya memuat kata-kata teks
+        
+        Parameters
+        ----------
+        text : str
+            Teks pencarian
+        limit : int, optional
+            Jumlah maksimum film, by default 10
+        
+        Returns
+        -------
+        list
+            Nama film, yang paling relevan lebih dulu
+        """
+    
+    def index_records(self):
+        """
+        Mapping nama film -> data film untuk membangun indeks saat start.
+        Snapshot mengembalikan record ringkas tanpa deskripsi.
+        """
+        return self.films
+    
+    def field_values(self, field):
+        """
+        Mengambil nilai satu field untuk semua film
+        
+        Parameters
+        ----------
+        field : str
+            Nama field film (misalnya 'director' atau 'recommendations')
+        
+        Returns
+        -------
+        list
+            Nilai field sesuai urutan database, None jika film tidak memiliki field tersebut
+        """
+        return [film_data.get(field) for film_data in self.index_records().values()]
+    
+    def numeric_column(self, field):
+        """
+        Mengambil field numerik semua film sebagai kolom
+        
+        Parameters
+        ----------
+        field : str
+            Salah satu NUMERIC_FIELDS
+        
+        Returns
+        -------
+        numpy.ndarray
+            Array float64 sesuai urutan database, NaN jika nilai tidak diketahui
+        """
+        return numeric_values(self.field_values(field))
+    
+    def genre_index(self):
+        """Indeks genre -> list nama film yang sudah jadi, atau None jika harus dibangun"""
+        return None
+    
+    def faq_data(self):
+        """Data FAQ chatbot yang ikut tersimpan, atau None jika dibaca dari file FAQ"""
+        return None
+    
+    def film_synonyms(self):
+        """Kamus sinonim film chatbot yang sudah jadi, atau None jika harus dibangun"""
+        return None
+    
+    def all_genres(self):
+        """Daftar genre chatbot (huruf kecil) yang sudah jadi, atau None jika harus dibangun"""
+        return None
+    
+    def text_index(self):
+        """Index teks milik penyimpanan (API seperti FullTextIndex), atau None jika harus dibangun"""
+        return None
+
+class JSONFilmStore(FilmStore):
+    """
+    Penyimpanan film dari file JSON yang dimuat seluruhnya ke memori
+    """
+    
+    def __init__(self, path):
+        """
+        Memuat data film dari JSON. Jika file tidak ada, akan dibuat data contoh.
+        
+        Parameters
+        ----------
+        path : str
+            Path file JSON database film
+        """
+        self.path = path
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                self._films = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            # Buat contoh data default jika file tidak ditemukan
+            self._films = copy.deepcopy(DEFAULT_FILMS_DATA)
+            
+            # Simpan data default
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(self._films, file, ensure_ascii=False, indent=4)
+        
+        # Sidik jari dihitung sekali; isi file sudah dimuat seluruhnya
+        self._fingerprint = catalogue_fingerprint(self._films)
+    
+    @property
+    def films(self):
+        return self._films
+    
+    def fingerprint(self):
+        return self._fingerprint
+    
+    def film_names(self):
+        return list(self._films)
+    
+    def query(self, genre=None, director=None, year=None, rating_min=None, limit=None):
+        return filter_films(self._films.items(), genre, director, year, rating_min, limit)
+    
+    def search_text(self, text, limit=10):
+        return match_text(self._films.items(), text, limit)
+
+class LazyFilms(Mapping):
+    """
+    Mapping nama film -> data film yang dibaca dari SQLite atau snapshot saat dibutuhkan.
+    Hanya daftar nama film yang disimpan di memori; data film yang baru
+    diakses disimpan di cache LRU.
+    """
+    
+    def __init__(self, store, cache_size=1024):
+        """
+        Inisialisasi mapping lazy
+        
+        Parameters
+        ----------
+        store : FilmStore
+            Penyimpanan film dengan method film_names(), get(), dan iter_films()
+        cache_size : int, optional
+            Jumlah data film yang disimpan di cache, by default 1024
+        """
+        self._store = store
+        self._names = store.film_names()
+        self._name_set = set(self._names)
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+    
+    def __getitem__(self, film_name):
+        with self._lock:
+            if film_name in self._cache:
+                self._cache.move_to_end(film_name)
+                return self._cache[film_name]
+        
+        film_data = self._store.get(film_name)
+        if film_data is None:
+            raise KeyError(film_name)
+        
+        with self._lock:
+            self._cache[film_name] = film_data
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        
+        return film_data
+    
+    def __contains__(self, film_name):
+        return film_name in self._name_set
+    
+    def __iter__(self):
+        return iter(self._names)
+    
+    def __len__(self):
+        return len(self._names)
+    
+    def items(self):
+        # Iterasi semua film dibaca per batch dari database tanpa mengisi cache
+        return _StreamingItems(self)
+    
+    def values(self):
+        return _StreamingValues(self)
+    
+    def fingerprint(self):
+        return self._store.fingerprint()
+
+class _StreamingItems(ItemsView):
+    """Iterasi (nama, data) film langsung dari database"""
+    
+    def __iter__(self):
+        yield from self._mapping._store.iter_films()
+
+class _StreamingValues(ValuesView):
+    """Iterasi data film langsung dari database"""
+    
+    def __iter__(self):
+        for _, film_data in self._mapping._store.iter_films():
+            yield film_data
+
+class SQLiteFilmStore(FilmStore):
+    """
+    Penyimpanan film di SQLite dengan kolom berindeks (genre, tahun, rating,
+    sutradara) dan index FTS5 untuk pencarian teks. Setiap thread dan proses
+    worker memakai koneksi read-only sendiri.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE films (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE,
+            title TEXT,
+            release_year INTEGER,
+            director TEXT COLLATE NOCASE,
+            rating REAL,
+            duration INTEGER,
+            data TEXT NOT NULL
+        );
+        CREATE TABLE film_genres (
+            film_id INTEGER NOT NULL REFERENCES films(id),
+            genre TEXT NOT NULL COLLATE NOCASE
+        );
+        CREATE TABLE meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+        CREATE INDEX idx_films_year ON films(release_year);
+        CREATE INDEX idx_films_rating ON films(rating);
+        CREATE INDEX idx_films_director ON films(director);
+        CREATE INDEX idx_film_genres_genre ON film_genres(genre, film_id);
+        CREATE VIRTUAL TABLE films_fts USING fts5(
+            title, description, actors,
+            tokenize = 'unicode61 remove_diacritics 2'
+        );
+    """
+    
+    def __init__(self, path, cache_size=1024):
+        """
+        Membuka database SQLite film
+        
+        Parameters
+        ----------
+        path : str
+            Path file database SQLite (dibuat dengan `SQLiteFilmStore.create`)
+        cache_size : int, optional
+            Jumlah data film yang disimpan di cache LRU, by default 1024
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(
+                f"Database film {path} tidak ditemukan. Jalankan scripts/import_films_sqlite.py terlebih dahulu"
+            )
+        
+        self.path = path
+        self._local = threading.local()
+        self._fingerprint = None
+        self._films = LazyFilms(self, cache_size=cache_size)
+    
+    def _connection(self):
+        """
+        Mengambil koneksi milik thread dan proses saat ini
+        
+        Returns
+        -------
+        sqlite3.Connection
+            Koneksi read-only ke database
+        """
+        connection = getattr(self._local, 'connection', None)
+        
+        # Koneksi tidak boleh dipakai bersama setelah fork (misalnya worker gunicorn)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+            connection.execute("PRAGMA query_only = ON")
+            connection.execute("PRAGMA mmap_size = 268435456")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        
+        return connection
+    
+    @classmethod
+    def create(cls, path, films_data):
+        """
+        Membuat database SQLite dari data film (menimpa database lama secara atomik)
+        
+        Parameters
+        ----------
+        path : str
+            Path file database SQLite
+        films_data : dict
+            Dictionary berisi informasi film
+        
+        Returns
+        -------
+        SQLiteFilmStore
+            Penyimpanan film yang sudah dibuka
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        temp_path = path + '.tmp'
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        
+        connection = sqlite3.connect(temp_path)
+        try:
+            connection.executescript(cls.SCHEMA)
+            
+            with connection:
+                for film_id, (film_name, film_data) in enumerate(films_data.items(), 1):
+                    connection.execute(
+                        "INSERT INTO films (id, name, title, release_year, director, rating, duration, data) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            film_id, film_name, film_data.get('title', film_name),
+                            film_data.get('release_year'), film_data.get('director'),
+                            film_data.get('rating'), film_data.get('duration'),
+                            json.dumps(film_data, ensure_ascii=False)
+                        )
+                    )
+                    connection.executemany(
+                        "INSERT INTO film_genres (film_id, genre) VALUES (?, ?)",
+                        [(film_id, genre) for genre in film_data.get('genre', [])]
+                    )
+                    connection.execute(
+                        "INSERT INTO films_fts (rowid, title, description, actors) VALUES (?, ?, ?, ?)",
+                        (
+                            film_id, film_data.get('title', film_name),
+                            film_data.get('description', ''), " ".join(film_data.get('actors', []))
+                        )
+                    )
+                
+                connection.execute(
+                    "INSERT INTO meta (key, value) VALUES ('fingerprint', ?)",
+                    (catalogue_fingerprint(films_data),)
+                )
+            
+            connection.execute("ANALYZE")
+        finally:
+            connection.close()
+        
+        os.replace(temp_path, path)
+        return cls(path)
+    
+    @property
+    def films(self):
+        return self._films
+    
+    def fingerprint(self):
+        if self._fingerprint is None:
+            row = self._connection().execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+            self._fingerprint = row[0] if row else ''
+        return self._fingerprint
+    
+    def film_names(self):
+        return [row[0] for row in self._connection().execute("SELECT name FROM films ORDER BY id")]
+    
+    def numeric_column(self, field):
+        # Field numerik dibaca dari kolom tabel tanpa mendekode data film
+        if field not in NUMERIC_FIELDS:
+            return super().numeric_column(field)
+        return numeric_values(row[0] for row in self._connection().execute(f"SELECT {field} FROM films ORDER BY id"))
+    
+    def get(self, film_name):
+        """
+        Mengambil data satu film
+        
+        Parameters
+        ----------
+        film_name : str
+            Nama film
+        
+        Returns
+        -------
+        dict or None
+            Data film, None jika tidak ditemukan
+        """
+        row = self._connection().execute("SELECT data FROM films WHERE name = ?", (film_name,)).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def iter_films(self, batch_size=512):
+        """
+        Membaca semua film per batch sesuai urutan database
+        
+        Parameters
+        ----------
+        batch_size : int, optional
+            Jumlah baris per batch, by default 512
+        
+        Yields
+        ------
+        tuple
+            (nama film, data film)
+        """
+        cursor = self._connection().execute("SELECT name, data FROM films ORDER BY id")
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for film_name, data in rows:
+                yield film_name, json.loads(data)
+    
+    def query(self, genre=None, director=None, year=None, rating_min=None, limit=None):
+        conditions, params = [], []
+        if genre:
+            conditions.append("films.id IN (SELECT film_id FROM film_genres WHERE genre = ?)")
+            params.append(genre)
+        if director:
+            conditions.append("films.director = ?")
+            params.append(director)
+        if year is not None:
+            conditions.append("films.release_year = ?")
+            params.append(year)
+        if rating_min is not None:
+            conditions.append("films.rating >= ?")
+            params.append(rating_min)
+        
+        sql = "SELECT name FROM films"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY films.id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        
+        return [row[0] for row in self._connection().execute(sql, params)]
+    
+    def ranked_text_matches(self, text, limit=None):
+        """
+        Mencari film dengan index FTS5, terurut dari skor BM25 tertinggi
+        
+        Parameters
+        ----------
+        text : str
+            Teks pencarian
+        limit : int, optional
+            Jumlah maksimum film, by default None (semua film yang cocok)
+        
+        Returns
+        -------
+        iterable
+            Pasangan (posisi film sesuai urutan database, skor BM25)
+        """
+        # Setiap kata dikutip agar karakter khusus FTS5 tidak dianggap operator
+        words = re.findall(r'\w+', text.lower())
+        if not words:
+            return []
+        
+        # bm25() FTS5 bernilai negatif (makin kecil makin relevan); id film dimulai dari 1
+        sql = ("SELECT films_fts.rowid - 1, -bm25(films_fts, 2.0, 1.0, 1.0) AS score FROM films_fts "
+               "WHERE films_fts MATCH ? ORDER BY score DESC, films_fts.rowid")
+        params = [" OR ".join(f'"{word}"' for word in words)]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        
+        return self._connection().execute(sql, params)
+    
+    def search_text(self, text, limit=10):
+        names = self._films._names
+        return [names[position] for position, _ in self.ranked_text_matches(text, limit)]
+    
+    def text_index(self):
+        return FTSTextIndex(self)
+
+class FTSTextIndex:
+    """
+    Index teks di atas FTS5 SQLiteFilmStore dengan API yang dipakai chatbot
+    dan FilmCatalogue dari FullTextIndex (id film = posisi film di database).
+    Query dijalankan langsung di SQLite sehingga tidak ada index teks di memori.
+    """
+    
+    def __init__(self, store):
+        """
+        Inisialisasi index teks
+        
+        Parameters
+        ----------
+        store : SQLiteFilmStore
+            Penyimpanan film SQLite
+        """
+        self._store = store
+        self.film_names = store.films._names
+    
+    def is_ready(self):
+        return True
+    
+    def match_ids(self, query):
+        """Id film yang memuat minimal satu kata query (urut naik)"""
+        ids = [position for position, _ in self._store.ranked_text_matches(query)]
+        return np.unique(np.array(ids, dtype=np.int64))
+    
+    def search_ids(self, query, k=10, allowed=None):
+        """
+        Mencari top-k film dengan skor BM25 tertinggi
+        
+        Parameters
+        ----------
+        query : str
+            Teks query
+        k : int, optional
+            Jumlah film yang dikembalikan, by default 10
+        allowed : numpy.ndarray, optional
+            Mask boolean film yang boleh masuk hasil, by default None (semua)
+        
+        Returns
+        -------
+        tuple
+            (numpy.ndarray id film, numpy.ndarray skor), terurut dari skor tertinggi
+        """
+        ids, scores = [], []
+        if k > 0:
+            # Tanpa mask cukup k baris teratas; dengan mask baris dibaca sampai k film lolos
+            for position, score in self._store.ranked_text_matches(query, k if allowed is None else None):
+                if allowed is not None and not allowed[position]:
+                    continue
+                ids.append(position)
+                scores.append(score)
+                if len(ids) >= k:
+                    break
+        return np.array(ids, dtype=np.int64), np.array(scores, dtype=np.float32)
+    
+    def search(self, query, top_n=5):
+        """List tuple (nama_film, skor_bm25), terurut dari skor tertinggi"""
+        ids, scores = self.search_ids(query, top_n)
+        return [(self.film_names[i], float(score)) for i, score in zip(ids, scores)]
+
+def open_film_store(json_path=None, backend=None, db_path=None, faq_path=None, snapshot_path=None):
+    """
+    Membuka penyimpanan film sesuai konfigurasi.
+    
+    Backend dipilih dari argumen atau environment variable FILM_STORAGE
+    ('json' atau 'sqlite', default 'json'); path database SQLite dari
+    FILM_DB_PATH (default data/films.db). Untuk backend JSON, snapshot
+    biner dari FILM_SNAPSHOT_PATH (default data/catalogue.snapshot)
+    dipakai jika masih sesuai dengan file JSON film dan FAQ.
+    
+    Parameters
+    ----------
+    json_path : str, optional
+        Path file JSON database film, by default 'data/films.json'
+    backend : str, optional
+        'json' atau 'sqlite', by default None (dari environment)
+    db_path : str, optional
+        Path database SQLite, by default None (dari environment)
+    faq_path : str, optional
+        Path file JSON FAQ chatbot, by default 'data/faq_films.json'
+    snapshot_path : str, optional
+        Path snapshot katalog, by default None (dari environment)
+    
+    Returns
+    -------
+    FilmStore
+        Penyimpanan film
+    """
+    backend = (backend or os.environ.get('FILM_STORAGE', 'json')).lower()
+    if backend not in STORAGE_BACKENDS:
+        raise ValueError(f"Backend penyimpanan '{backend}' tidak dikenal. Pilihan: {', '.join(STORAGE_BACKENDS)}")
+    
+    if backend == 'sqlite':
+        return SQLiteFilmStore(db_path or os.environ.get('FILM_DB_PATH', os.path.join('data', 'films.db')))
+    
+    json_path = json_path or os.path.join('data', 'films.json')
+    faq_path = faq_path or os.path.join('data', 'faq_films.json')
+    snapshot_path = snapshot_path or os.environ.get('FILM_SNAPSHOT_PATH', os.path.join('data', 'catalogue.snapshot'))
+    
+    # Import lokal karena modul snapshot memakai kelas dari modul ini
+    from backend.models.snapshot import SnapshotFilmStore
+    
+    store = SnapshotFilmStore.open_if_fresh(snapshot_path, {'films': json_path, 'faq': faq_path})
+    if store is not None:
+        return store
+    
+    return JSONFilmStore(json_path)
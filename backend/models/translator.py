@@ -2,65 +2,159 @@
 Output translator untuk menghasilkan rekomendasi film berdasarkan hasil prediksi genre
 """
 import os
+import re
 import json
 import random
+import bisect
+import base64
+import zlib
+import unicodedata
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
 from difflib import get_close_matches
+import numpy as np
+from scipy import sparse
+
+from backend.utils.json_encoder import dumps_bytes, join_array, extend_object
+from backend.models.storage import open_film_store
+
+# Batas minimal rating untuk pola "film dengan rating tinggi"
+HIGH_RATING_THRESHOLD = 8.0
+
+# Pilihan urutan daftar film per genre
+GENRE_SORT_OPTIONS = ('default', 'rating', 'year', 'popularity')
+
+# Jumlah fragmen JSON film (ringkasan/detail) yang disimpan di cache LRU
+FRAGMENT_CACHE_SIZE = int(os.environ.get('FRAGMENT_CACHE_SIZE', 4096))
+
+class FilmView(Mapping):
+    """
+    Tampilan read-only atas data film beserta field tambahan (misalnya
+    name dan score) tanpa menyalin dictionary film aslinya.
+    """
+    
+    __slots__ = ('_film', '_extra')
+    
+    def __init__(self, film_data, **extra):
+        """
+        Inisialisasi tampilan film
+        
+        Parameters
+        ----------
+        film_data : dict
+            Data film asli dari database
+        **extra
+            Field tambahan yang menimpa atau melengkapi data film
+        """
+        self._film = film_data
+        self._extra = extra
+    
+    def __getitem__(self, key):
+        if key in self._extra:
+            return self._extra[key]
+        return self._film[key]
+    
+    def __iter__(self):
+        yield from self._film
+        for key in self._extra:
+            if key not in self._film:
+                yield key
+    
+    def __len__(self):
+        return len(self._film) + sum(1 for key in self._extra if key not in self._film)
+    
+    def __repr__(self):
+        return f"FilmView({dict(self)!r})"
 
 class FilmTranslator:
     """
     Kelas untuk menghasilkan rekomendasi film berdasarkan hasil prediksi genre.
+    Indeks sutradara, aktor, tahun, rating, dan peringkat genre dibangun
+    sekali dari kolom penyimpanan film dan tetap berada di memori.
     """
     
-    def __init__(self):
+    def __init__(self, film_store=None):
         """
         Inisialisasi translator dengan data film dan rekomendasi
+        
+        Parameters
+        ----------
+        film_store : FilmStore, optional
+            Penyimpanan film yang dipakai bersama komponen lain, by default None
+            (dibuka sesuai konfigurasi)
         """
         self.films_data_path = os.path.join('data', 'films.json')
         
         # Muat data film jika ada
+        self.film_store = film_store
         self.films_data = self._load_films_data()
         
         # Membuat indeks film berdasarkan genre untuk pencarian yang lebih cepat
-        self.genre_index = self._build_genre_index()
+        self.genre_index = self.film_store.genre_index()
+        if self.genre_index is None:
+            self.genre_index = self.build_genre_index(self.film_store.index_records())
+        
+        # Posisi setiap film dalam database untuk menjaga urutan yang stabil
+        self.film_names = list(self.films_data.keys())
+        self.film_positions = {film_name: i for i, film_name in enumerate(self.film_names)}
+        
+        # Rating setiap film sesuai urutan database (0 jika tidak diketahui),
+        # dibaca dari kolom numerik penyimpanan
+        ratings = self.film_store.numeric_column("rating")
+        self.film_ratings = np.where(np.isnan(ratings), 0.0, ratings).tolist()
+        
+        # Matrix insidensi film x genre untuk scoring rekomendasi secara vektor
+        self.genre_names = list(self.genre_index.keys())
+        self.genre_positions = {genre: i for i, genre in enumerate(self.genre_names)}
+        self.film_genre_matrix = self._build_film_genre_matrix()
+        
+        # Cache hasil normalisasi nama genre
+        self._normalized_genres = {}
+        
+        # Cache LRU fragmen JSON per film, dikosongkan jika isi katalog berubah
+        self._fragments = OrderedDict()
+        self._fragments_fingerprint = self.film_store.fingerprint()
+        self._fragments_lock = threading.Lock()
+        
+        # Indeks untuk menyaring kandidat berdasarkan pola film (sutradara, aktor, tahun, rating)
+        self.director_index, self.director_tokens = self._build_person_index("director")
+        self.actor_index, self.actor_tokens = self._build_person_index("actors")
+        self.year_index = self._build_year_index()
+        self.rating_values, self.rating_films = self._build_rating_index()
+        
+        # Daftar film per genre yang sudah diurutkan untuk setiap pilihan urutan
+        self.genre_rankings = self._build_genre_rankings()
+        
+        # Versi katalog untuk memvalidasi cursor pagination
+        self.catalogue_version = zlib.crc32("\n".join(self.film_names).encode('utf-8'))
     
     def _load_films_data(self):
         """
-        Memuat data film dari JSON.
-        Jika file tidak ada, akan dibuat data contoh.
+        Memuat data film dari penyimpanan yang dikonfigurasi (FILM_STORAGE:
+        file JSON, snapshot katalog, atau SQLite). Jika file JSON tidak ada,
+        akan dibuat data contoh.
         
         Returns
         -------
-        dict
-            Dictionary berisi informasi film
+        Mapping
+            Mapping nama film -> informasi film; untuk SQLite dan snapshot
+            data film dibaca saat dibutuhkan
         """
-        try:
-            with open(self.films_data_path, 'r', encoding='utf-8') as file:
-                return json.load(file)
-        except (FileNotFoundError, json.JSONDecodeError):
-            # Buat contoh data default jika file tidak ditemukan
-            default_data = {
-                "Dune": {
-                    "title": "Dune",
-                    "release_year": 2021,
-                    "director": "Denis Villeneuve",
-                    "genre": ["Sci-Fi", "Action", "Adventure", "Drama"],
-                    "description": "Film yang mengadaptasi novel fiksi ilmiah terkenal karya Frank Herbert.",
-                    "rating": 8.0,
-                    "recommendations": ["Blade Runner 2049", "Arrival", "Interstellar"]
-                }
-            }
-            
-            # Simpan data default
-            os.makedirs(os.path.dirname(self.films_data_path), exist_ok=True)
-            with open(self.films_data_path, 'w', encoding='utf-8') as file:
-                json.dump(default_data, file, ensure_ascii=False, indent=4)
-            
-            return default_data
+        if self.film_store is None:
+            self.film_store = open_film_store(json_path=self.films_data_path)
+        return self.film_store.films
     
-    def _build_genre_index(self):
+    @staticmethod
+    def build_genre_index(films_data):
         """
         Membuat indeks film berdasarkan genre untuk pencarian yang lebih cepat
         
+        Parameters
+        ----------
+        films_data : Mapping
+            Mapping nama film -> data film
+        
         Returns
         -------
         dict
@@ -68,7 +162,7 @@ class FilmTranslator:
         """
         genre_index = {}
         
-        for film_name, film_data in self.films_data.items():
+        for film_name, film_data in films_data.items():
             genres = film_data.get("genre", [])
             
             for genre in genres:
@@ -79,6 +173,328 @@ class FilmTranslator:
         
         return genre_index
     
+    def _build_popularity(self):
+        """
+        Menghitung popularitas film berdasarkan berapa kali film tersebut
+        direkomendasikan oleh film lain di database
+        
+        Returns
+        -------
+        dict
+            Dictionary nama film -> jumlah rujukan
+        """
+        popularity = dict.fromkeys(self.film_names, 0)
+        
+        for recommendations in self.film_store.field_values("recommendations"):
+            for rec_name in recommendations or []:
+                if rec_name in popularity:
+                    popularity[rec_name] += 1
+        
+        return popularity
+    
+    def _build_genre_rankings(self):
+        """
+        Mengurutkan daftar film setiap genre sekali saat load untuk
+        setiap pilihan urutan (rating, tahun, popularitas)
+        
+        Returns
+        -------
+        dict
+            Dictionary genre -> {urutan: list nama film}
+        """
+        popularity = self._build_popularity()
+        years = self.film_store.numeric_column("release_year")
+        years = np.where(np.isnan(years), 0.0, years).tolist()
+        
+        sort_keys = {
+            'rating': lambda name: self.film_ratings[self.film_positions[name]],
+            'year': lambda name: years[self.film_positions[name]],
+            'popularity': lambda name: (popularity[name], self.film_ratings[self.film_positions[name]])
+        }
+        
+        rankings = {}
+        for genre, film_names in self.genre_index.items():
+            rankings[genre] = {'default': film_names}
+            for sort, key in sort_keys.items():
+                # sorted() stabil, sehingga nilai yang sama tetap mengikuti urutan database
+                rankings[genre][sort] = sorted(film_names, key=key, reverse=True)
+        
+        return rankings
+    
+    def _encode_cursor(self, genre, sort, offset):
+        """
+        Membuat cursor pagination yang opaque
+        
+        Parameters
+        ----------
+        genre : str
+            Nama genre yang sudah dinormalisasi
+        sort : str
+            Pilihan urutan
+        offset : int
+            Posisi awal halaman berikutnya
+        
+        Returns
+        -------
+        str
+            Cursor dalam bentuk base64 yang aman untuk URL
+        """
+        payload = json.dumps({"g": genre, "s": sort, "o": offset, "v": self.catalogue_version})
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+    
+    def _decode_cursor(self, cursor):
+        """
+        Membaca cursor pagination
+        
+        Parameters
+        ----------
+        cursor : str
+            Cursor dari respons sebelumnya
+        
+        Returns
+        -------
+        tuple
+            (genre, urutan, offset)
+        
+        Raises
+        ------
+        ValueError
+            Jika cursor tidak valid atau dibuat untuk versi katalog lain
+        """
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+            genre, sort, offset, version = payload["g"], payload["s"], int(payload["o"]), payload["v"]
+        except (ValueError, TypeError, KeyError, UnicodeError):
+            raise ValueError("Cursor tidak valid")
+        
+        if version != self.catalogue_version or genre not in self.genre_rankings \
+                or sort not in GENRE_SORT_OPTIONS or offset < 0:
+            raise ValueError("Cursor tidak valid atau sudah kedaluwarsa")
+        
+        return genre, sort, offset
+    
+    def _build_film_genre_matrix(self):
+        """
+        Membuat matrix insidensi sparse film x genre
+        
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Matrix (jumlah film, jumlah genre) bernilai 1 jika film memiliki genre tersebut
+        """
+        rows = []
+        cols = []
+        
+        for genre, film_names in self.genre_index.items():
+            genre_position = self.genre_positions[genre]
+            for film_name in film_names:
+                rows.append(self.film_positions[film_name])
+                cols.append(genre_position)
+        
+        matrix = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)),
+            shape=(len(self.film_names), len(self.genre_names))
+        )
+        # Genre yang tercatat dua kali pada satu film tetap dihitung sekali
+        matrix.data[:] = 1.0
+        return matrix
+    
+    @staticmethod
+    def _name_tokens(text):
+        """
+        Memecah nama orang atau teks query menjadi token huruf kecil tanpa aksen
+        
+        Parameters
+        ----------
+        text : str
+            Teks yang akan dipecah
+        
+        Returns
+        -------
+        list
+            List token (hanya token dengan panjang minimal 3 huruf)
+        """
+        text = unicodedata.normalize('NFKD', text.lower()).encode('ascii', 'ignore').decode('ascii')
+        return [token for token in re.findall(r'[a-z]+', text) if len(token) >= 3]
+    
+    def _build_person_index(self, field):
+        """
+        Membuat indeks film berdasarkan nama orang (sutradara atau aktor)
+        
+        Parameters
+        ----------
+        field : str
+            Nama field film ("director" berupa string, "actors" berupa list)
+        
+        Returns
+        -------
+        tuple
+            (indeks nama -> list nama film, indeks token -> set nama)
+        """
+        person_index = {}
+        token_index = {}
+        
+        for film_name, people in zip(self.film_names, self.film_store.field_values(field)):
+            people = people or []
+            if isinstance(people, str):
+                people = [people]
+            
+            for person in people:
+                person_key = person.lower()
+                person_index.setdefault(person_key, []).append(film_name)
+                
+                for token in self._name_tokens(person):
+                    token_index.setdefault(token, set()).add(person_key)
+        
+        return person_index, token_index
+    
+    def _build_year_index(self):
+        """
+        Membuat indeks film berdasarkan tahun rilis
+        
+        Returns
+        -------
+        dict
+            Dictionary dengan key tahun (int) dan value list nama film
+        """
+        year_index = {}
+        years = self.film_store.numeric_column("release_year")
+        
+        for position in np.flatnonzero(np.isfinite(years)):
+            year_index.setdefault(int(years[position]), []).append(self.film_names[position])
+        
+        return year_index
+    
+    def _build_rating_index(self):
+        """
+        Membuat indeks film yang diurutkan berdasarkan rating (menaik)
+        
+        Returns
+        -------
+        tuple
+            (list rating terurut, list nama film dengan urutan yang sama)
+        """
+        ratings = self.film_store.numeric_column("rating")
+        rated = np.flatnonzero(~np.isnan(ratings))
+        
+        # Urutan stabil agar rating yang sama tetap mengikuti urutan database
+        order = rated[np.argsort(ratings[rated], kind='stable')]
+        return ratings[order].tolist(), [self.film_names[position] for position in order]
+    
+    def _match_people(self, query, person_index, token_index):
+        """
+        Mencari film dari orang yang namanya disebut dalam teks query
+        
+        Parameters
+        ----------
+        query : str
+            Teks hasil ekstraksi pola (misalnya "christopher nolan yang seru")
+        person_index : dict
+            Indeks nama orang -> list nama film
+        token_index : dict
+            Indeks token nama -> set nama orang
+        
+        Returns
+        -------
+        list or None
+            List nama film, atau None jika tidak ada nama yang cocok
+        """
+        # Hitung jumlah token nama yang muncul di query untuk setiap orang
+        hits = {}
+        for token in set(self._name_tokens(query)):
+            for person_key in token_index.get(token, ()):
+                hits[person_key] = hits.get(person_key, 0) + 1
+        
+        if not hits:
+            return None
+        
+        # Ambil orang dengan token yang paling banyak cocok
+        best_hits = max(hits.values())
+        films = []
+        for person_key, count in hits.items():
+            if count == best_hits:
+                films.extend(person_index[person_key])
+        
+        return films
+    
+    def known_person(self, text, field):
+        """
+        Memeriksa apakah teks memuat token nama orang yang ada di database
+        
+        Parameters
+        ----------
+        text : str
+            Teks hasil ekstraksi pola (misalnya "christopher nolan yang seru")
+        field : str
+            'director' untuk sutradara, 'actors' untuk aktor
+        
+        Returns
+        -------
+        bool
+            True jika minimal satu token nama cocok
+        """
+        token_index = self.director_tokens if field == 'director' else self.actor_tokens
+        return any(token in token_index for token in self._name_tokens(text))
+    
+    def _filter_candidates(self, constraints):
+        """
+        Menyaring kandidat film menggunakan pola dari `extract_film_patterns`
+        
+        Parameters
+        ----------
+        constraints : dict
+            Pola film (kunci yang didukung: director, actor, year, rating)
+        
+        Returns
+        -------
+        list or None
+            List nama film kandidat sesuai urutan database, atau None jika
+            tidak ada pola yang bisa diterapkan. Pola yang tidak cocok dengan
+            film mana pun (misalnya tahun tanpa film) diabaikan, dan jika
+            irisan semua pola kosong dikembalikan None (tanpa penyaringan)
+        """
+        candidate_lists = []
+        
+        if constraints.get("director"):
+            films = self._match_people(constraints["director"], self.director_index, self.director_tokens)
+            if films is not None:
+                candidate_lists.append(films)
+        
+        if constraints.get("actor"):
+            films = self._match_people(constraints["actor"], self.actor_index, self.actor_tokens)
+            if films is not None:
+                candidate_lists.append(films)
+        
+        if constraints.get("year"):
+            try:
+                candidate_lists.append(self.year_index.get(int(constraints["year"]), []))
+            except (TypeError, ValueError):
+                pass
+        
+        if constraints.get("rating") == "high":
+            start = bisect.bisect_left(self.rating_values, HIGH_RATING_THRESHOLD)
+            candidate_lists.append(self.rating_films[start:])
+        
+        # Pola tanpa film yang cocok tidak dipakai agar rekomendasi tidak kosong
+        candidate_lists = [films for films in candidate_lists if films]
+        if not candidate_lists:
+            return None
+        
+        # Mulai dari daftar terkecil lalu irisan dengan daftar lainnya
+        candidate_lists.sort(key=len)
+        other_sets = [set(films) for films in candidate_lists[1:]]
+        candidates = dict.fromkeys(
+            film_name for film_name in candidate_lists[0]
+            if all(film_name in films for films in other_sets)
+        )
+        
+        if not candidates:
+            return None
+        
+        # Kembalikan sesuai urutan database agar hasil stabil
+        return sorted(candidates, key=self.film_positions.__getitem__)
+    
     def _normalize_genre(self, genre):
         """
         Menormalkan nama genre agar sesuai dengan yang ada di database
@@ -93,23 +509,29 @@ class FilmTranslator:
         str
             Nama genre yang sudah dinormalkan
         """
+        if genre in self._normalized_genres:
+            return self._normalized_genres[genre]
+        
         # Konversi ke title case untuk standarisasi
         normalized = genre.title()
         
-        # Daftar genre yang tersedia dalam database
-        available_genres = list(self.genre_index.keys())
+        # Cari genre yang paling mirip, kembalikan yang asli jika tidak ada yang cocok
+        if normalized not in self.genre_positions:
+            matches = get_close_matches(normalized, self.genre_names, n=1, cutoff=0.7)
+            if matches:
+                normalized = matches[0]
         
-        # Cari genre yang paling mirip
-        matches = get_close_matches(normalized, available_genres, n=1, cutoff=0.7)
+        # Batasi ukuran cache karena nama genre juga bisa berasal dari input pengguna
+        if len(self._normalized_genres) < 1024:
+            self._normalized_genres[genre] = normalized
         
-        if matches:
-            return matches[0]
-        else:
-            return normalized  # Kembalikan yang asli jika tidak ada yang cocok
+        return normalized
     
-    def get_recommendations(self, predicted_genres, top_n=5):
+    def get_recommendations(self, predicted_genres, top_n=5, constraints=None):
         """
-        Menghasilkan rekomendasi film berdasarkan genre yang diprediksi
+        Menghasilkan rekomendasi film berdasarkan genre yang diprediksi.
+        Skor semua film dihitung sekaligus dengan perkalian vektor confidence
+        genre dan matrix insidensi film-genre.
         
         Parameters
         ----------
@@ -117,55 +539,113 @@ class FilmTranslator:
             List dari dictionary berisi genre dan confidence score
         top_n : int, optional
             Jumlah rekomendasi film yang dihasilkan, by default 5
+        constraints : dict, optional
+            Pola film dari `extract_film_patterns` (director, actor, year, rating)
+            untuk menyaring kandidat sebelum scoring, by default None
             
         Returns
         -------
         list
-            List dari dictionary berisi informasi film yang direkomendasikan
+            List dari FilmView (read-only) berisi informasi film yang direkomendasikan
         """
-        # List untuk menyimpan film yang direkomendasikan dan skornya
-        film_scores = {}
-        
-        # Iterasi melalui genre yang diprediksi
+        # Vektor confidence per genre (genre yang sama dijumlahkan)
+        confidence = np.zeros(len(self.genre_names))
         for genre_data in predicted_genres:
-            genre = genre_data["genre"]
-            confidence = genre_data["confidence"]
-            
-            # Normalisasi nama genre
-            normalized_genre = self._normalize_genre(genre)
-            
-            # Ambil film dengan genre tersebut
-            films_with_genre = self.genre_index.get(normalized_genre, [])
-            
-            # Hitung skor untuk setiap film berdasarkan confidence score
-            for film_name in films_with_genre:
-                if film_name not in film_scores:
-                    film_scores[film_name] = 0
-                
-                # Tambahkan confidence sebagai skor
-                film_scores[film_name] += confidence
+            position = self.genre_positions.get(self._normalize_genre(genre_data["genre"]))
+            if position is not None:
+                confidence[position] += genre_data["confidence"]
+        
+        # Saring kandidat berdasarkan pola film sebelum scoring
+        candidates = self._filter_candidates(constraints) if constraints else None
+        
+        if candidates is None:
+            film_ids = None
+            scores = self.film_genre_matrix @ confidence
+        else:
+            film_ids = np.fromiter((self.film_positions[name] for name in candidates),
+                                   dtype=np.int64, count=len(candidates))
+            scores = self.film_genre_matrix[film_ids] @ confidence
+        
+        # Ambil top_n film dengan skor positif tertinggi
+        hits = np.flatnonzero(scores > 0)
+        if hits.size > top_n:
+            hits = hits[np.argpartition(-scores[hits], top_n - 1)[:top_n]]
         
-        # Urutkan film berdasarkan skor tertinggi
-        sorted_films = sorted(film_scores.items(), key=lambda x: x[1], reverse=True)
+        # Urutkan berdasarkan skor tertinggi, skor sama diurutkan sesuai urutan database
+        hits = hits[np.lexsort((hits, -scores[hits]))]
+        top_films = [(int(i) if film_ids is None else int(film_ids[i]), float(scores[i])) for i in hits]
         
-        # Ambil top_n film
-        top_films = [film_name for film_name, _ in sorted_films[:top_n]]
+        # Jika kandidat tersaring tidak cocok dengan genre, ambil kandidat dengan rating tertinggi
+        if not top_films and candidates:
+            top_films = [
+                (self.film_positions[name], 0)
+                for name in sorted(candidates, key=lambda name: self.film_ratings[self.film_positions[name]],
+                                   reverse=True)[:top_n]
+            ]
         
         # Jika tidak ada film yang sesuai, ambil film random
-        if not top_films and self.films_data:
-            top_films = random.sample(list(self.films_data.keys()), min(top_n, len(self.films_data)))
+        if not top_films and candidates is None and self.film_names:
+            top_films = [
+                (position, 0)
+                for position in random.sample(range(len(self.film_names)), min(top_n, len(self.film_names)))
+            ]
         
-        # Susun informasi lengkap untuk film yang direkomendasikan
+        # Susun tampilan read-only untuk film yang direkomendasikan tanpa menyalin data film
         recommendations = []
-        for film_name in top_films:
-            if film_name in self.films_data:
-                film_info = self.films_data[film_name].copy()
-                film_info["name"] = film_name  # Tambahkan nama film ke informasi
-                film_info["score"] = film_scores.get(film_name, 0)  # Tambahkan skor
-                recommendations.append(film_info)
+        for position, score in top_films:
+            film_name = self.film_names[position]
+            recommendations.append(FilmView(self.films_data[film_name], name=film_name, score=score))
         
         return recommendations
     
+    def _format_message(self, recommendations, input_text=""):
+        """
+        Membuat pesan pengantar untuk respons rekomendasi
+        
+        Parameters
+        ----------
+        recommendations : list
+            List film yang direkomendasikan
+        input_text : str, optional
+            Teks input dari pengguna, by default ""
+        
+        Returns
+        -------
+        str
+            Pesan untuk pengguna
+        """
+        if not recommendations:
+            return "Maaf, kami tidak dapat menemukan film yang sesuai dengan preferensi Anda."
+        
+        # Buat pesan berdasarkan input pengguna
+        if input_text:
+            return f"Berdasarkan preferensi Anda \"{input_text}\", berikut adalah rekomendasi film yang mungkin Anda sukai:"
+        return "Berikut adalah rekomendasi film yang mungkin Anda sukai:"
+    
+    @staticmethod
+    def _format_film_summary(film):
+        """
+        Memformat field statis satu film untuk respons rekomendasi
+        
+        Parameters
+        ----------
+        film : Mapping
+            Informasi film
+        
+        Returns
+        -------
+        dict
+            Field film tanpa confidence
+        """
+        return {
+            "title": film.get("title", ""),
+            "description": film.get("description", ""),
+            "genre": ", ".join(film.get("genre", [])),
+            "director": film.get("director", ""),
+            "release_year": film.get("release_year", ""),
+            "rating": film.get("rating", 0)
+        }
+    
     def format_response(self, recommendations, input_text=""):
         """
         Memformat respons untuk ditampilkan ke pengguna
@@ -182,36 +662,125 @@ class FilmTranslator:
         dict
             Dictionary berisi respons yang diformat
         """
-        if not recommendations:
-            return {
-                "message": "Maaf, kami tidak dapat menemukan film yang sesuai dengan preferensi Anda.",
-                "recommendations": []
-            }
+        # Diturunkan dari respons JSON agar hanya ada satu jalur format
+        return json.loads(self.render_response_json(recommendations, input_text))
+    
+    def _film_fragment(self, film_name, kind):
+        """
+        Mengambil fragmen JSON (bytes) sebuah film dari cache LRU
+        (paling banyak FRAGMENT_CACHE_SIZE fragmen). Cache dikosongkan
+        jika sidik jari katalog berubah.
         
-        # Buat pesan berdasarkan input pengguna
-        if input_text:
-            message = f"Berdasarkan preferensi Anda \"{input_text}\", berikut adalah rekomendasi film yang mungkin Anda sukai:"
+        Parameters
+        ----------
+        film_name : str
+            Nama film yang ada di database
+        kind : str
+            'summary' untuk field respons rekomendasi (tanpa confidence),
+            'details' untuk data film lengkap beserta name
+        
+        Returns
+        -------
+        bytes
+            Objek JSON film
+        """
+        key = (film_name, kind)
+        fingerprint = self.film_store.fingerprint()
+        
+        with self._fragments_lock:
+            if fingerprint != self._fragments_fingerprint:
+                self._fragments.clear()
+                self._fragments_fingerprint = fingerprint
+            fragment = self._fragments.get(key)
+            if fragment is not None:
+                self._fragments.move_to_end(key)
+                return fragment
+        
+        film_data = self.films_data[film_name]
+        if kind == 'summary':
+            fragment = dumps_bytes(self._format_film_summary(film_data))
         else:
-            message = "Berikut adalah rekomendasi film yang mungkin Anda sukai:"
-        
-        # Format output untuk setiap film
-        formatted_recs = []
-        for film in recommendations:
-            formatted_film = {
-                "title": film.get("title", ""),
-                "description": film.get("description", ""),
-                "genre": ", ".join(film.get("genre", [])),
-                "director": film.get("director", ""),
-                "release_year": film.get("release_year", ""),
-                "rating": film.get("rating", 0),
-                "confidence": round(film.get("score", 0) * 100, 1)  # Konversi ke persentase
-            }
-            formatted_recs.append(formatted_film)
+            film_info = dict(film_data)
+            film_info["name"] = film_name  # Tambahkan nama film ke informasi
+            fragment = dumps_bytes(film_info)
         
-        return {
-            "message": message,
-            "recommendations": formatted_recs
-        }
+        with self._fragments_lock:
+            if fingerprint == self._fragments_fingerprint:
+                self._fragments[key] = fragment
+                if len(self._fragments) > FRAGMENT_CACHE_SIZE:
+                    self._fragments.popitem(last=False)
+        
+        return fragment
+    
+    def render_response_json(self, recommendations, input_text=""):
+        """
+        Memformat respons rekomendasi langsung menjadi bytes JSON
+        dari fragmen film yang sudah di-cache
+        
+        Parameters
+        ----------
+        recommendations : list
+            List FilmView hasil `get_recommendations`
+        input_text : str, optional
+            Teks input dari pengguna, by default ""
+        
+        Returns
+        -------
+        bytes
+            Respons JSON
+        """
+        fragments = [
+            extend_object(
+                self._film_fragment(film["name"], 'summary'),
+                confidence=round(film.get("score", 0) * 100, 1)  # Konversi ke persentase
+            )
+            for film in recommendations
+        ]
+        
+        return (b'{"message":' + dumps_bytes(self._format_message(recommendations, input_text))
+                + b',"recommendations":' + join_array(fragments) + b'}')
+    
+    def render_films_json(self, film_names):
+        """
+        Menghasilkan array JSON berisi data lengkap beberapa film
+        dari fragmen yang sudah di-cache
+        
+        Parameters
+        ----------
+        film_names : list
+            Daftar nama film yang ada di database
+        
+        Returns
+        -------
+        bytes
+            Array JSON data film
+        """
+        return join_array([self._film_fragment(film_name, 'details') for film_name in film_names])
+    
+    def _match_film_name(self, film_name):
+        """
+        Mencari nama film di database, persis atau yang paling mirip
+        
+        Parameters
+        ----------
+        film_name : str
+            Nama film
+        
+        Returns
+        -------
+        tuple
+            (nama film di database atau None, True jika cocok persis)
+        """
+        # Cek apakah film ada dalam database
+        if film_name in self.films_data:
+            return film_name, True
+        
+        # Jika tidak ada yang cocok persis, cari yang paling mirip
+        matches = get_close_matches(film_name, self.film_names, n=1, cutoff=0.7)
+        if matches:
+            return matches[0], False
+        
+        return None, False
     
     def get_film_details(self, film_name):
         """
@@ -227,24 +796,98 @@ class FilmTranslator:
         dict
             Dictionary berisi informasi film
         """
-        # Cek apakah film ada dalam database
-        if film_name in self.films_data:
-            film_info = self.films_data[film_name].copy()
-            film_info["name"] = film_name  # Tambahkan nama film ke informasi
-            return film_info
+        fragment, _ = self.get_film_details_json(film_name)
         
-        # Jika tidak ada yang cocok persis, cari yang paling mirip
-        matches = get_close_matches(film_name, list(self.films_data.keys()), n=1, cutoff=0.7)
-        if matches:
-            matched_name = matches[0]
-            film_info = self.films_data[matched_name].copy()
-            film_info["name"] = matched_name
-            film_info["message"] = f"Film \"{film_name}\" tidak ditemukan. Berikut adalah film yang paling mirip:"
-            return film_info
+        if fragment is None:
+            return {"message": f"Maaf, kami tidak dapat menemukan informasi tentang film \"{film_name}\"."}
+        
+        return json.loads(fragment)
+    
+    def get_film_details_json(self, film_name):
+        """
+        Mengambil detail film berdasarkan nama langsung sebagai bytes JSON
+        dari fragmen yang di-cache
+        
+        Parameters
+        ----------
+        film_name : str
+            Nama film
+        
+        Returns
+        -------
+        tuple
+            (bytes JSON atau None jika tidak ditemukan, True jika cocok persis)
+        """
+        matched_name, exact = self._match_film_name(film_name)
+        
+        if matched_name is None:
+            return None, False
         
-        return {"message": f"Maaf, kami tidak dapat menemukan informasi tentang film \"{film_name}\"."}
+        fragment = self._film_fragment(matched_name, 'details')
+        if not exact:
+            fragment = extend_object(
+                fragment,
+                message=f"Film \"{film_name}\" tidak ditemukan. Berikut adalah film yang paling mirip:"
+            )
+        return fragment, exact
     
-    def get_films_by_genre(self, genre_name, limit=5):
+    def _select_genre_films(self, genre_name, limit, sort='default', cursor=None):
+        """
+        Memilih satu halaman film untuk sebuah genre dari daftar yang sudah diurutkan
+        
+        Parameters
+        ----------
+        genre_name : str
+            Nama genre
+        limit : int
+            Jumlah maksimum film per halaman
+        sort : str, optional
+            Pilihan urutan ('default', 'rating', 'year', 'popularity'), by default 'default'
+        cursor : str, optional
+            Cursor halaman berikutnya dari respons sebelumnya, by default None
+        
+        Returns
+        -------
+        tuple
+            (nama genre yang dinormalisasi, list nama film terpilih, cursor berikutnya atau None, total film)
+        
+        Raises
+        ------
+        ValueError
+            Jika pilihan urutan atau cursor tidak valid
+        """
+        if sort not in GENRE_SORT_OPTIONS:
+            raise ValueError(f"Urutan '{sort}' tidak dikenal. Pilihan: {', '.join(GENRE_SORT_OPTIONS)}")
+        
+        if cursor:
+            # Cursor menyimpan genre dan urutan agar halaman berikutnya konsisten
+            normalized_genre, sort, offset = self._decode_cursor(cursor)
+        else:
+            offset = 0
+            
+            # Normalisasi nama genre
+            normalized_genre = self._normalize_genre(genre_name)
+            
+            if normalized_genre not in self.genre_rankings:
+                # Jika tidak ada yang cocok persis, cari genre yang paling mirip
+                matches = get_close_matches(normalized_genre, self.genre_names, n=1, cutoff=0.6)
+                
+                if matches:
+                    normalized_genre = matches[0]
+        
+        # Ambil daftar film yang sudah diurutkan, lalu potong satu halaman saja
+        ranked_films = self.genre_rankings.get(normalized_genre, {}).get(sort, [])
+        limit = max(limit, 0)
+        selected_films = ranked_films[offset:offset + limit]
+        
+        next_offset = offset + len(selected_films)
+        next_cursor = None
+        if selected_films and next_offset < len(ranked_films):
+            next_cursor = self._encode_cursor(normalized_genre, sort, next_offset)
+        
+        return normalized_genre, selected_films, next_cursor, len(ranked_films)
+    
+    def get_films_by_genre(self, genre_name, limit=5, sort='default', cursor=None):
         """
         Mengambil daftar film berdasarkan genre
         
@@ -254,40 +897,48 @@ class FilmTranslator:
             Nama genre
         limit : int, optional
             Jumlah maksimum film yang dikembalikan, by default 5
+        sort : str, optional
+            Pilihan urutan ('default', 'rating', 'year', 'popularity'), by default 'default'
+        cursor : str, optional
+            Cursor halaman berikutnya dari respons sebelumnya, by default None
             
         Returns
         -------
-        list
-            List dari dictionary berisi informasi film
+        dict
+            Dictionary berisi genre, list informasi film, jumlah film, dan cursor halaman berikutnya
         """
-        # Normalisasi nama genre
-        normalized_genre = self._normalize_genre(genre_name)
-        
-        # Ambil film dengan genre tersebut
-        films_with_genre = self.genre_index.get(normalized_genre, [])
-        
-        if not films_with_genre:
-            # Jika tidak ada yang cocok persis, cari genre yang paling mirip
-            all_genres = list(self.genre_index.keys())
-            matches = get_close_matches(normalized_genre, all_genres, n=1, cutoff=0.6)
-            
-            if matches:
-                normalized_genre = matches[0]
-                films_with_genre = self.genre_index.get(normalized_genre, [])
+        body, _ = self.get_films_by_genre_json(genre_name, limit, sort, cursor)
+        return json.loads(body)
+    
+    def get_films_by_genre_json(self, genre_name, limit=5, sort='default', cursor=None):
+        """
+        Mengambil daftar film berdasarkan genre langsung sebagai bytes JSON
+        dari fragmen film yang di-cache
         
-        # Batasi jumlah film
-        selected_films = films_with_genre[:limit]
+        Parameters
+        ----------
+        genre_name : str
+            Nama genre
+        limit : int, optional
+            Jumlah maksimum film yang dikembalikan, by default 5
+        sort : str, optional
+            Pilihan urutan ('default', 'rating', 'year', 'popularity'), by default 'default'
+        cursor : str, optional
+            Cursor halaman berikutnya dari respons sebelumnya, by default None
         
-        # Susun informasi lengkap untuk film yang dipilih
-        film_info_list = []
-        for film_name in selected_films:
-            if film_name in self.films_data:
-                film_info = self.films_data[film_name].copy()
-                film_info["name"] = film_name  # Tambahkan nama film ke informasi
-                film_info_list.append(film_info)
+        Returns
+        -------
+        tuple
+            (bytes JSON, jumlah film)
+        """
+        normalized_genre, selected_films, next_cursor, total = self._select_genre_films(
+            genre_name, limit, sort, cursor
+        )
+        fragments = [self._film_fragment(film_name, 'details') for film_name in selected_films]
         
-        return {
-            "genre": normalized_genre,
-            "films": film_info_list,
-            "count": len(film_info_list)
-        }
+        body = (b'{"genre":' + dumps_bytes(normalized_genre)
+                + b',"films":' + join_array(fragments)
+                + b',"count":' + dumps_bytes(len(fragments))
+                + b',"total":' + dumps_bytes(total)
+                + b',"next_cursor":' + dumps_bytes(next_cursor) + b'}')
+        return body, len(fragments)
@@ -0,0 +1,227 @@
+"""
+Scoring batch offline: rekomendasi film untuk banyak teks preferensi
+
+Input CSV atau JSONL dibaca secara streaming dan dibagi menjadi potongan.
+Setiap potongan diproses di process pool (preprocess_text -> prediksi
+genre -> FilmTranslator.get_recommendations); model dan katalog dimuat
+sekali per proses worker. Jumlah potongan yang sedang diproses dibatasi,
+sehingga memori tetap kecil berapa pun ukuran input.
+
+Output JSONL ditulis bertahap dengan urutan sama dengan input, satu baris
+per teks:
+    {"row": 0, "id": ..., "top_genres": [...], "recommendations": [{"title": ..., "score": ...}]}
+Baris yang gagal berisi "error". Dengan --resume, baris output yang sudah
+lengkap dilewati sehingga proses yang terhenti dapat dilanjutkan.
+
+Jalankan dari direktori backend:
+    python scripts/batch_score.py data/training_films.csv --output hasil.jsonl --workers 4
+    python scripts/batch_score.py preferensi.jsonl --text-col text --id-col user_id --output hasil.jsonl --resume
+"""
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+from itertools import islice
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# Menambahkan path untuk import
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.utils.preprocessor import extract_film_patterns
+
+# Model dan katalog milik proses worker (dimuat sekali oleh init_worker)
+_worker = {}
+
+def read_rows(path, text_col, id_col=None, input_format=None):
+    """
+    Membaca input baris demi baris
+    
+    Parameters
+    ----------
+    path : str
+        Path file CSV atau JSONL
+    text_col : str
+        Nama kolom/field teks preferensi
+    id_col : str, optional
+        Nama kolom/field id, by default None (nomor baris)
+    input_format : str, optional
+        'csv' atau 'jsonl', by default None (dari ekstensi file)
+    
+    Yields
+    ------
+    tuple
+        (nomor baris, id, teks)
+    """
+    input_format = input_format or ('jsonl' if path.endswith(('.jsonl', '.ndjson', '.json')) else 'csv')
+    
+    with open(path, 'r', encoding='utf-8', newline='') as file:
+        if input_format == 'csv':
+            records = csv.DictReader(file)
+        else:
+            records = (json.loads(line) for line in file if line.strip())
+        
+        for row, record in enumerate(records):
+            yield row, record.get(id_col, row) if id_col else row, record.get(text_col)
+
+def init_worker(runtime, top_n):
+    """Memuat model rekomendasi dan katalog film sekali per proses worker"""
+    # Import di worker agar proses utama tidak perlu memuat model
+    from backend.models.compact import open_recommender
+    from backend.models.storage import open_film_store
+    from backend.models.translator import FilmTranslator
+    
+    _worker['recommender'] = open_recommender(runtime)
+    _worker['translator'] = FilmTranslator(open_film_store())
+    _worker['top_n'] = top_n
+
+def score_chunk(rows):
+    """
+    Menghitung rekomendasi untuk satu potongan baris
+    
+    Parameters
+    ----------
+    rows : list
+        List (nomor baris, id, teks)
+    
+    Returns
+    -------
+    list
+        String JSON satu baris output untuk setiap input
+    """
+    recommender = _worker['recommender']
+    translator = _worker['translator']
+    
+    valid = [(row, row_id, text) for row, row_id, text in rows if isinstance(text, str) and text.strip()]
+    predictions = recommender.predict_batch([text for _, _, text in valid], workers=1, report=False) if valid else []
+    results = {row: prediction for (row, _, _), prediction in zip(valid, predictions)}
+    
+    lines = []
+    for row, row_id, text in rows:
+        output = {'row': row, 'id': row_id}
+        try:
+            if row not in results:
+                raise ValueError("Teks preferensi kosong")
+            top_genres = [
+                {'genre': genre['genre'], 'confidence': float(genre['confidence'])}
+                for genre in results[row].get('top_genres', [])
+            ]
+            films = translator.get_recommendations(top_genres, top_n=_worker['top_n'],
+                                                   constraints=extract_film_patterns(text, translator.known_person))
+            output['top_genres'] = top_genres
+            output['recommendations'] = [{'title': film['name'], 'score': float(film['score'])} for film in films]
+        except Exception as e:
+            output['error'] = str(e)
+        lines.append(json.dumps(output, ensure_ascii=False))
+    
+    return lines
+
+def completed_rows(output_path):
+    """
+    Menghitung baris output yang sudah lengkap dan membuang baris terakhir
+    yang terpotong (proses terhenti di tengah penulisan)
+    
+    Parameters
+    ----------
+    output_path : str
+        Path file output JSONL
+    
+    Returns
+    -------
+    int
+        Jumlah baris output yang lengkap
+    """
+    if not os.path.exists(output_path):
+        return 0
+    
+    count = 0
+    valid_bytes = 0
+    with open(output_path, 'rb') as file:
+        for line in file:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                json.loads(line)
+            except ValueError:
+                break
+            count += 1
+            valid_bytes += len(line)
+    
+    with open(output_path, 'r+b') as file:
+        file.truncate(valid_bytes)
+    
+    return count
+
+def chunked(rows, chunk_size):
+    """Membagi iterator baris menjadi list berukuran chunk_size"""
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def main():
+    """Menjalankan scoring batch"""
+    parser = argparse.ArgumentParser(description="Rekomendasi film untuk banyak teks preferensi (CSV/JSONL)")
+    parser.add_argument('input', help="Path file input CSV atau JSONL")
+    parser.add_argument('--output', required=True, help="Path file output JSONL")
+    parser.add_argument('--format', choices=['csv', 'jsonl'], default=None,
+                        help="Format input (default: dari ekstensi file)")
+    parser.add_argument('--text-col', default='preferences', help="Kolom teks preferensi (default: preferences)")
+    parser.add_argument('--id-col', default=None, help="Kolom id yang disalin ke output (default: nomor baris)")
+    parser.add_argument('--workers', type=int, default=None, help="Jumlah proses worker (default: jumlah CPU)")
+    parser.add_argument('--chunk-size', type=int, default=256, help="Jumlah teks per potongan (default: 256)")
+    parser.add_argument('--top-n', type=int, default=5, help="Jumlah rekomendasi per teks (default: 5)")
+    parser.add_argument('--runtime', default=None, help="'sklearn' atau 'compact' (default: RECOMMENDER_RUNTIME)")
+    parser.add_argument('--resume', action='store_true', help="Lanjutkan output yang sudah ada")
+    parser.add_argument('--progress', type=int, default=10000, help="Cetak progres setiap N teks (default: 10000)")
+    parser.add_argument('--limit', type=int, default=None, help="Jumlah teks maksimal yang diproses pada run ini")
+    args = parser.parse_args()
+    
+    workers = args.workers or os.cpu_count() or 1
+    skip = completed_rows(args.output) if args.resume else 0
+    if skip:
+        print(f"Melanjutkan setelah {skip} baris output yang sudah ada")
+    
+    rows = islice(read_rows(args.input, args.text_col, args.id_col, args.format), skip,
+                  None if args.limit is None else skip + args.limit)
+    chunks = chunked(rows, args.chunk_size)
+    
+    start = time.perf_counter()
+    written = 0
+    with open(args.output, 'a' if args.resume else 'w', encoding='utf-8') as output:
+        def write(lines):
+            nonlocal written
+            output.write('\n'.join(lines) + '\n')
+            output.flush()
+            if args.progress and (written + len(lines)) // args.progress > written // args.progress:
+                print(f"{skip + written + len(lines)} teks selesai ({time.perf_counter() - start:.1f} detik)")
+            written += len(lines)
+        
+        if workers == 1:
+            init_worker(args.runtime, args.top_n)
+            for chunk in chunks:
+                write(score_chunk(chunk))
+        else:
+            # Potongan yang sedang diproses dibatasi agar input tidak dibaca seluruhnya ke memori;
+            # hasil ditulis sesuai urutan input
+            max_pending = workers * 2
+            with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                     initargs=(args.runtime, args.top_n)) as executor:
+                pending = deque()
+                for chunk in chunks:
+                    pending.append(executor.submit(score_chunk, chunk))
+                    if len(pending) >= max_pending:
+                        write(pending.popleft().result())
+                while pending:
+                    write(pending.popleft().result())
+    
+    elapsed = time.perf_counter() - start
+    rate = written / elapsed if elapsed > 0 else float('inf')
+    print(f"{written} teks diproses dengan {workers} proses dalam {elapsed:.2f} detik ({rate:.0f} teks/detik), "
+          f"total {skip + written} baris di {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""
+Benchmark kontrol penerimaan (admission control) saat kelebihan beban
+
+Beberapa thread klien membanjiri endpoint berat (/api/chat atau /api/analyze)
+sementara satu klien mengukur latensi /api/film. Dijalankan dua kali: tanpa
+batas (semua request berat diproses bersamaan, seperti sebelumnya) dan dengan
+batas AdmissionController aplikasi. Dengan batas, request berat yang
+berlebih ditolak cepat dengan 503 + Retry-After dan /api/film tetap cepat.
+
+Jalankan dari direktori backend:
+    python scripts/benchmark_admission.py --endpoint chat --clients 16 --seconds 5
+"""
+import os
+import sys
+import time
+import argparse
+import threading
+import numpy as np
+import pandas as pd
+from collections import Counter
+
+# Menambahkan path untuk import
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import backend.app as app_module
+from backend.utils.admission import AdmissionController
+
+# Path endpoint berat dan nama field teksnya
+HEAVY_ENDPOINTS = {
+    'chat': ('/api/chat', 'message'),
+    'analyze': ('/api/analyze', 'text'),
+}
+
+def run_overload(endpoint, texts, clients, seconds, film_title):
+    """
+    Membanjiri endpoint berat sambil mengukur latensi /api/film
+    
+    Parameters
+    ----------
+    endpoint : str
+        'chat' atau 'analyze'
+    texts : list
+        Teks request berat yang dipakai bergiliran
+    clients : int
+        Jumlah klien berat bersamaan
+    seconds : float
+        Lama pengukuran (detik)
+    film_title : str
+        Judul film untuk /api/film
+    
+    Returns
+    -------
+    tuple
+        (latensi /api/film ms, latensi request berat yang diterima ms,
+        Counter status HTTP request berat, jumlah respons 503 tanpa Retry-After)
+    """
+    path, field = HEAVY_ENDPOINTS[endpoint]
+    stop = threading.Event()
+    lock = threading.Lock()
+    statuses = Counter()
+    heavy_latencies = []
+    missing_retry_after = [0]
+    
+    def heavy_client(index):
+        client = app_module.app.test_client()
+        while not stop.is_set():
+            start = time.perf_counter()
+            response = client.post(path, json={field: texts[index % len(texts)]})
+            index += clients
+            elapsed = (time.perf_counter() - start) * 1000
+            with lock:
+                statuses[response.status_code] += 1
+                if response.status_code == 200:
+                    heavy_latencies.append(elapsed)
+                elif response.status_code == 503 and 'Retry-After' not in response.headers:
+                    missing_retry_after[0] += 1
+            if response.status_code == 503:
+                # Klien mengikuti saran Retry-After sebelum mencoba lagi
+                stop.wait(float(response.headers.get('Retry-After', 1)))
+    
+    threads = [threading.Thread(target=heavy_client, args=(index,), daemon=True) for index in range(clients)]
+    for thread in threads:
+        thread.start()
+    
+    client = app_module.app.test_client()
+    film_latencies = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        client.get('/api/film', query_string={'title': film_title})
+        film_latencies.append((time.perf_counter() - start) * 1000)
+        time.sleep(0.005)
+    
+    stop.set()
+    for thread in threads:
+        thread.join()
+    
+    return np.array(film_latencies), np.array(heavy_latencies or [0.0]), statuses, missing_retry_after[0]
+
+def main():
+    """Menjalankan benchmark admission control"""
+    parser = argparse.ArgumentParser(description="Latensi /api/film saat endpoint berat kelebihan beban")
+    parser.add_argument('--endpoint', choices=sorted(HEAVY_ENDPOINTS), default='chat',
+                        help="Endpoint berat yang dibanjiri (default: chat)")
+    parser.add_argument('--csv', default=os.path.join('data', 'training_films.csv'),
+                        help="Path file CSV teks preferensi (default: data/training_films.csv)")
+    parser.add_argument('--clients', type=int, default=16, help="Jumlah klien berat bersamaan (default: 16)")
+    parser.add_argument('--seconds', type=float, default=5.0, help="Lama setiap pengukuran (default: 5)")
+    args = parser.parse_args()
+    
+    texts = pd.read_csv(args.csv)['preferences'].astype(str).tolist()
+    film_title = next(iter(app_module.film_translator.films_data), '')
+    
+    # Pemanasan agar inisialisasi model tidak ikut terukur
+    path, field = HEAVY_ENDPOINTS[args.endpoint]
+    warmup = AdmissionController({name: (1, 0, 0.0) for name in app_module.admission.limiters})
+    app_module.admission, limited = warmup, app_module.admission
+    client = app_module.app.test_client()
+    client.post(path, json={field: texts[0]})
+    client.get('/api/film', query_string={'title': film_title})
+    unlimited = AdmissionController({name: (10 ** 6, 0, 0.0) for name in limited.limiters})
+    
+    print(f"{'mode':<12} {'film p50':>9} {'film p99':>9} {'berat p50':>10} {'200':>6} {'503':>6}")
+    for label, controller in (('tanpa batas', unlimited), ('dengan batas', limited)):
+        # Decorator endpoint membaca app_module.admission saat request diproses
+        app_module.admission = controller
+        film, heavy, statuses, missing = run_overload(args.endpoint, texts, args.clients, args.seconds, film_title)
+        print(f"{label:<12} {np.percentile(film, 50):>9.2f} {np.percentile(film, 99):>9.2f} "
+              f"{np.percentile(heavy, 50):>10.2f} {statuses[200]:>6} {statuses[503]:>6}")
+        if missing:
+            print(f"Respons 503 tanpa header Retry-After: {missing}")
+            sys.exit(1)
+    
+    app_module.admission = limited
+    metrics = limited.metrics()[args.endpoint]
+    print(f"Metrik {args.endpoint}: batas {metrics['max_concurrent']}, antrean maksimum {metrics['max_queue_depth']}, "
+          f"diterima {metrics['admitted']}, ditolak {metrics['rejected']}, "
+          f"rata-rata proses {metrics['average_service_ms']:.1f} ms")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark beban ringan untuk endpoint API: waktu CPU per request.
+
+Mode --compare juga membandingkan serialisasi lama (dict disusun dari data film
+lalu jsonify) dengan fragmen JSON yang sudah di-cache untuk /api/film,
+/api/genre, dan /api/analyze.
+
+Jalankan dari direktori backend:
+    python scripts/benchmark_api.py --requests 2000 --compare
+"""
+import os
+import sys
+import time
+import argparse
+
+# Menambahkan path untuk import
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from flask import jsonify
+
+from backend.app import app, film_translator, film_recommender, json_bytes_response
+
+def measure(func, n_requests):
+    """
+    Mengukur waktu CPU dan waktu nyata rata-rata sebuah fungsi
+    
+    Returns
+    -------
+    tuple
+        (mikrodetik CPU per panggilan, mikrodetik nyata per panggilan)
+    """
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    for _ in range(n_requests):
+        func()
+    cpu = (time.process_time() - cpu_start) / n_requests * 1e6
+    wall = (time.perf_counter() - wall_start) / n_requests * 1e6
+    return cpu, wall
+
+def film_info_dict(film_name):
+    """Data film lengkap beserta name, disusun tanpa cache fragmen"""
+    film_info = dict(film_translator.films_data[film_name])
+    film_info["name"] = film_name
+    return film_info
+
+def genre_dict(genre_name, limit):
+    """Respons /api/genre sebagai dict, disusun tanpa cache fragmen"""
+    normalized_genre, selected_films, next_cursor, total = film_translator._select_genre_films(genre_name, limit)
+    films = [film_info_dict(film_name) for film_name in selected_films]
+    return {"genre": normalized_genre, "films": films, "count": len(films), "total": total, "next_cursor": next_cursor}
+
+def recommendations_dict(recommendations, input_text):
+    """Respons /api/analyze sebagai dict, disusun tanpa cache fragmen"""
+    formatted_recs = []
+    for film in recommendations:
+        formatted_film = film_translator._format_film_summary(film)
+        formatted_film["confidence"] = round(film.get("score", 0) * 100, 1)
+        formatted_recs.append(formatted_film)
+    return {"message": film_translator._format_message(recommendations, input_text), "recommendations": formatted_recs}
+
+def main():
+    """Menjalankan benchmark endpoint"""
+    parser = argparse.ArgumentParser(description="Benchmark waktu CPU per request endpoint API")
+    parser.add_argument('--requests', type=int, default=1000, help="Jumlah request per endpoint (default: 1000)")
+    parser.add_argument('--compare', action='store_true',
+                        help="Bandingkan serialisasi dict + jsonify dengan fragmen JSON")
+    args = parser.parse_args()
+    
+    client = app.test_client()
+    film_title = next(iter(film_translator.films_data), '')
+    genre_name = next(iter(film_translator.genre_index), '')
+    preference = "saya suka film action dengan superhero yang seru"
+    
+    endpoints = {
+        'GET /api/film': lambda: client.get('/api/film', query_string={'title': film_title}),
+        'GET /api/genre': lambda: client.get('/api/genre', query_string={'name': genre_name, 'limit': 20}),
+        'POST /api/analyze': lambda: client.post('/api/analyze', json={'text': preference}),
+    }
+    
+    print(f"{'endpoint':<20} {'cpu us/req':>11} {'wall us/req':>12}")
+    for name, func in endpoints.items():
+        cpu, wall = measure(func, args.requests)
+        print(f"{name:<20} {cpu:>11.1f} {wall:>12.1f}")
+    
+    if not args.compare:
+        return
+    
+    top_genres = film_recommender.predict(preference).get('top_genres', [])
+    recommendations = film_translator.get_recommendations(top_genres)
+    
+    serializers = {
+        'film': (
+            lambda: jsonify(film_info_dict(film_title)),
+            lambda: json_bytes_response(film_translator.get_film_details_json(film_title)[0]),
+        ),
+        'genre': (
+            lambda: jsonify(genre_dict(genre_name, 20)),
+            lambda: json_bytes_response(film_translator.get_films_by_genre_json(genre_name, 20)[0]),
+        ),
+        'analyze': (
+            lambda: jsonify(recommendations_dict(recommendations, preference)),
+            lambda: json_bytes_response(film_translator.render_response_json(recommendations, preference)),
+        ),
+    }
+    
+    print()
+    print(f"{'respons':<10} {'jsonify us':>11} {'fragmen us':>11} {'speedup':>8}")
+    with app.app_context():
+        for name, (old, new) in serializers.items():
+            old_cpu, _ = measure(old, args.requests)
+            new_cpu, _ = measure(new, args.requests)
+            print(f"{name:<10} {old_cpu:>11.1f} {new_cpu:>11.1f} {old_cpu / new_cpu:>7.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark penggabungan request /api/analyze (RequestCoalescer)
+
+Beberapa thread klien memanggil prediksi genre secara bersamaan, langsung
+(FilmRecommender.predict per request, seperti sebelumnya) atau lewat
+RequestCoalescer (satu predict_batch per kelompok request). Hasil setiap
+request lewat coalescer harus sama dengan predict. Mode lalu lintas sepi
+(satu klien) mengukur tambahan latensi ketika tidak ada request lain.
+
+Jalankan dari direktori backend:
+    python scripts/benchmark_coalescer.py --clients 16 --requests 40
+"""
+import os
+import sys
+import time
+import argparse
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+
+# Menambahkan path untuk import
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.models.compact import open_recommender
+from backend.utils.batching import RequestCoalescer
+
+def run_clients(call, texts, clients, requests_per_client):
+    """
+    Menjalankan beberapa klien bersamaan dan mengukur latensi setiap request
+    
+    Parameters
+    ----------
+    call : callable
+        Fungsi yang dipanggil klien dengan satu teks
+    texts : list
+        Teks yang dipakai bergiliran
+    clients : int
+        Jumlah klien (thread) bersamaan
+    requests_per_client : int
+        Jumlah request per klien
+    
+    Returns
+    -------
+    tuple
+        (request per detik, latensi ms per request, dictionary teks -> hasil)
+    """
+    def client(index):
+        latencies = []
+        results = {}
+        for i in range(requests_per_client):
+            text = texts[(index * requests_per_client + i) % len(texts)]
+            start = time.perf_counter()
+            results[text] = call(text)
+            latencies.append((time.perf_counter() - start) * 1000)
+        return latencies, results
+    
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as executor:
+        outputs = list(executor.map(client, range(clients)))
+    elapsed = time.perf_counter() - start
+    
+    latencies = np.array([latency for output, _ in outputs for latency in output])
+    results = {text: result for _, output in outputs for text, result in output.items()}
+    return len(latencies) / elapsed, latencies, results
+
+def main():
+    """Menjalankan benchmark coalescer"""
+    parser = argparse.ArgumentParser(description="Bandingkan prediksi per request dengan request yang digabung")
+    parser.add_argument('--csv', default=os.path.join('data', 'training_films.csv'),
+                        help="Path file CSV teks preferensi (default: data/training_films.csv)")
+    parser.add_argument('--clients', type=int, default=16, help="Jumlah klien bersamaan (default: 16)")
+    parser.add_argument('--requests', type=int, default=40, help="Jumlah request per klien (default: 40)")
+    parser.add_argument('--batch-size', type=int, default=32, help="Ukuran batch maksimal (default: 32)")
+    parser.add_argument('--wait-ms', type=float, default=2.0, help="Jendela tunggu maksimal ms (default: 2)")
+    parser.add_argument('--runtime', default=None, help="'sklearn' atau 'compact' (default: RECOMMENDER_RUNTIME)")
+    args = parser.parse_args()
+    
+    recommender = open_recommender(args.runtime)
+    texts = pd.read_csv(args.csv)['preferences'].astype(str).tolist()
+    
+    coalescer = RequestCoalescer(
+        lambda batch: recommender.predict_batch(batch, workers=1, report=False),
+        max_batch_size=args.batch_size, max_wait=args.wait_ms / 1000
+    )
+    
+    expected = {text: recommender.predict(text) for text in texts}
+    
+    print(f"{'mode':<18} {'klien':>5} {'req/detik':>10} {'p50 ms':>8} {'p99 ms':>8}")
+    mismatches = 0
+    for label, clients in (('sepi', 1), ('bersamaan', args.clients)):
+        for mode, call in (('langsung', recommender.predict), ('digabung', coalescer.submit)):
+            throughput, latencies, results = run_clients(call, texts, clients, args.requests)
+            print(f"{mode + ' ' + label:<18} {clients:>5} {throughput:>10.1f} "
+                  f"{np.percentile(latencies, 50):>8.2f} {np.percentile(latencies, 99):>8.2f}")
+            mismatches += sum(1 for text, result in results.items() if result != expected[text])
+    
+    stats = coalescer.stats()
+    print(f"Batch: {stats['batches']}, rata-rata ukuran {stats['average_batch_size']:.1f}, "
+          f"maksimum {stats['max_batch_size']}, rata-rata tunggu {stats['average_wait_ms']:.2f} ms")
+    print(f"Hasil berbeda dari predict: {mismatches}")
+    
+    if mismatches:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark evaluasi model rekomendasi: cara lama (pipeline.predict dan
+classification_report per genre) dibandingkan evaluasi dengan satu matrix
+prediksi (FilmRecommender._evaluate_model)
+
+Prediksi kedua cara harus sama persis, dan metrik per genre, mikro, makro,
+serta hamming loss harus sama dengan fungsi sklearn.metrics. Teks CSV
+training diulang --repeat kali untuk meniru data pengujian yang besar.
+Opsi --folds juga mengukur evaluasi k-fold serial dan paralel.
+
+Jalankan dari direktori backend:
+    python scripts/benchmark_evaluation.py --repeat 20 --folds 5
+"""
+import os
+import sys
+import time
+import argparse
+import warnings
+import numpy as np
+import pandas as pd
+from sklearn.metrics import accuracy_score, classification_report, precision_recall_fscore_support, hamming_loss
+
+# Menambahkan path untuk import
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.models.classifier import FilmRecommender
+
+def legacy_evaluate(recommender, X_test, y_test):
+    """
+    Evaluasi cara lama: vektorisasi dan prediksi ulang untuk setiap genre
+    
+    Returns
+    -------
+    tuple
+        (matrix prediksi dokumen x genre, akurasi rata-rata)
+    """
+    predicted = []
+    accuracies = []
+    for i, genre in enumerate(recommender.multilabel_binarizer.classes_):
+        y_pred = getattr(recommender, f'pipeline_{genre}').predict(X_test)
+        accuracies.append(accuracy_score(y_test[:, i], y_pred))
+        classification_report(y_test[:, i], y_pred, output_dict=True)
+        predicted.append(y_pred)
+    return np.column_stack(predicted), sum(accuracies) / len(accuracies)
+
+def main():
+    """Menjalankan benchmark evaluasi"""
+    parser = argparse.ArgumentParser(description="Bandingkan evaluasi per genre dengan evaluasi satu matrix")
+    parser.add_argument('--csv', default=os.path.join('data', 'training_films.csv'),
+                        help="Path file CSV training (default: data/training_films.csv)")
+    parser.add_argument('--repeat', type=int, default=20, help="Jumlah pengulangan teks CSV (default: 20)")
+    parser.add_argument('--folds', type=int, default=0, help="Jumlah fold untuk mode k-fold, 0 untuk melewati (default: 0)")
+    args = parser.parse_args()
+    
+    recommender = FilmRecommender()
+    if recommender.multilabel_binarizer is None:
+        print("Model belum dilatih. Latih model terlebih dahulu.")
+        sys.exit(1)
+    
+    data = pd.read_csv(args.csv)
+    texts = data['preferences'].tolist()
+    labels = data['film_genre'].tolist()
+    X_test = recommender._preprocess_data(texts, cached=True, report=False) * args.repeat
+    y_test = recommender.multilabel_binarizer.transform([genres.split('|') for genres in labels] * args.repeat)
+    
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        start = time.perf_counter()
+        legacy_predicted, legacy_accuracy = legacy_evaluate(recommender, X_test, y_test)
+        legacy_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    evaluation = recommender._evaluate_model(X_test, y_test)
+    seconds = time.perf_counter() - start
+    predicted, _, _ = recommender._predict_matrix(X_test)
+    
+    mismatches = int(np.sum(predicted != legacy_predicted.astype(bool)))
+    precision, recall, f1, _ = precision_recall_fscore_support(y_test, predicted, average=None, zero_division=0)
+    micro = precision_recall_fscore_support(y_test, predicted, average='micro', zero_division=0)[:3]
+    macro = precision_recall_fscore_support(y_test, predicted, average='macro', zero_division=0)[:3]
+    genres = recommender.multilabel_binarizer.classes_
+    metric_error = max(
+        np.max(np.abs(precision - [evaluation[genre]['precision'] for genre in genres])),
+        np.max(np.abs(recall - [evaluation[genre]['recall'] for genre in genres])),
+        np.max(np.abs(f1 - [evaluation[genre]['f1'] for genre in genres])),
+        np.max(np.abs(np.array(micro) - [evaluation['micro'][name] for name in ('precision', 'recall', 'f1')])),
+        np.max(np.abs(np.array(macro) - [evaluation['macro'][name] for name in ('precision', 'recall', 'f1')])),
+        abs(hamming_loss(y_test, predicted) - evaluation['hamming_loss']),
+        abs(legacy_accuracy - evaluation['average_accuracy'])
+    )
+    
+    timing = evaluation['timing']
+    throughput = f"{timing['texts_per_second']:.0f}" if timing['texts_per_second'] is not None else '-'
+    print(f"{len(X_test)} teks x {len(genres)} genre")
+    print(f"Cara lama : {legacy_seconds:.3f} detik")
+    print(f"Satu matrix: {seconds:.3f} detik (vektorisasi {timing['vectorize_ms']:.1f} ms, "
+          f"prediksi {timing['predict_ms']:.1f} ms, metrik {timing['metrics_ms']:.1f} ms, "
+          f"{throughput} teks/detik), {legacy_seconds / seconds:.1f}x lebih cepat")
+    print(f"Akurasi rata-rata {evaluation['average_accuracy']:.4f}, F1 mikro {evaluation['micro']['f1']:.4f}, "
+          f"F1 makro {evaluation['macro']['f1']:.4f}, hamming loss {evaluation['hamming_loss']:.4f}")
+    print(f"Prediksi berbeda: {mismatches}, selisih metrik maksimum dengan sklearn: {metric_error:.2e}")
+    
+    if args.folds:
+        for workers in (1, None):
+            result = recommender.cross_validate(texts, labels, n_splits=args.folds, workers=workers)
+            label = 'serial' if workers == 1 else 'paralel'
+            print(f"K-fold {args.folds} {label}: {result['seconds']:.2f} detik, "
+                  f"akurasi {result['mean']['average_accuracy']:.4f} +- {result['std']['average_accuracy']:.4f}, "
+                  f"F1 mikro {result['mean']['micro_f1']:.4f} +- {result['std']['micro_f1']:.4f}")
+    
+    if mismatches or metric_error > 1e-12:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
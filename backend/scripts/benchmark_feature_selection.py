@@ -0,0 +1,169 @@
+"""
+Benchmark seleksi fitur model rekomendasi film: akurasi vs latensi vs memori
+
+Model dilatih ulang untuk setiap metode seleksi fitur (chi2, nb_log_ratio)
+dan setiap target jumlah fitur per genre, lalu dibandingkan dengan model
+tanpa seleksi fitur. Model hasil benchmark disimpan di direktori sementara,
+sehingga models/film_recommender.joblib tidak berubah. Dengan --verify,
+skor fitur dibandingkan dengan chi2 dan MultinomialNB scikit-learn.
+
+Jalankan dari direktori backend:
+    python scripts/benchmark_feature_selection.py --sizes 5 10 20 --verify
+
+Model dengan seleksi fitur untuk server dilatih lewat environment variable:
+    FEATURE_SELECTION=chi2 SELECTED_FEATURES=20 python app.py
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+from sklearn.feature_selection import chi2
+from sklearn.naive_bayes import MultinomialNB
+from sklearn.model_selection import train_test_split
+
+# Menambahkan path untuk import
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.models.classifier import FilmRecommender, FEATURE_SELECTION_METHODS, feature_scores
+
+def make_recommender(params, model_path):
+    """
+    Membuat model baru dengan parameter tertentu dan path model sementara
+    
+    Parameters
+    ----------
+    params : dict
+        Parameter yang menimpa parameter model
+    model_path : str
+        Path file model
+    
+    Returns
+    -------
+    FilmRecommender
+        Model yang belum dilatih ulang
+    """
+    recommender = FilmRecommender()
+    recommender.model_path = model_path
+    recommender.multilabel_binarizer = None
+    recommender.params = dict(recommender.params, **params)
+    return recommender
+
+def single_text_latency(recommender, texts):
+    """
+    Mengukur waktu prediksi semua genre untuk satu teks (seperti predict, tanpa preprocessing)
+    
+    Parameters
+    ----------
+    recommender : FilmRecommender
+        Model yang sudah dilatih
+    texts : list
+        Teks hasil preprocessing
+    
+    Returns
+    -------
+    float
+        Rata-rata milidetik per teks
+    """
+    pipelines = [getattr(recommender, f'pipeline_{genre}') for genre in recommender.multilabel_binarizer.classes_]
+    start = time.perf_counter()
+    for text in texts:
+        for pipeline in pipelines:
+            pipeline.predict_proba([text])
+    return (time.perf_counter() - start) / len(texts) * 1000
+
+def verify(recommender, X_prep, y):
+    """
+    Memastikan skor fitur sama dengan chi2 dan log rasio MultinomialNB scikit-learn per genre
+    
+    Parameters
+    ----------
+    recommender : FilmRecommender
+        Model dengan parameter dasar
+    X_prep : list
+        Teks hasil preprocessing
+    y : list
+        List string genre (dipisah '|')
+    
+    Returns
+    -------
+    bool
+        True jika semua skor sama
+    """
+    Y = recommender.prepare_multilabel_data(y)
+    X = recommender._build_pipeline().named_steps['tfidf'].fit_transform(X_prep)
+    alpha = recommender.params['alpha']
+    
+    chi2_scores = feature_scores(X, Y, 'chi2')
+    ratio_scores = feature_scores(X, Y, 'nb_log_ratio', alpha=alpha)
+    
+    ok = True
+    for g, genre in enumerate(recommender.multilabel_binarizer.classes_):
+        reference_chi2 = np.nan_to_num(chi2(X, Y[:, g])[0])
+        feature_log_prob = MultinomialNB(alpha=alpha).fit(X, Y[:, g]).feature_log_prob_
+        reference_ratio = np.abs(feature_log_prob[-1] - feature_log_prob[0])
+        
+        if not np.allclose(chi2_scores[g], reference_chi2):
+            print(f"Skor chi2 genre {genre} berbeda")
+            ok = False
+        if not np.allclose(ratio_scores[g], reference_ratio):
+            print(f"Skor nb_log_ratio genre {genre} berbeda")
+            ok = False
+    
+    return ok
+
+def main():
+    """Menjalankan benchmark seleksi fitur"""
+    parser = argparse.ArgumentParser(description="Bandingkan akurasi, latensi, dan ukuran model dengan seleksi fitur")
+    parser.add_argument('--csv', default=os.path.join('data', 'training_films.csv'),
+                        help="Path file CSV data training (default: data/training_films.csv)")
+    parser.add_argument('--preferences-col', default='preferences', help="Kolom teks preferensi")
+    parser.add_argument('--genre-col', default='film_genre', help="Kolom genre (dipisah '|')")
+    parser.add_argument('--methods', nargs='+', default=list(FEATURE_SELECTION_METHODS),
+                        choices=FEATURE_SELECTION_METHODS, help="Metode seleksi fitur")
+    parser.add_argument('--sizes', nargs='+', type=int, default=[5, 10, 20, 50, 100],
+                        help="Target jumlah fitur per genre (default: 5 10 20 50 100)")
+    parser.add_argument('--scope', default='genre', choices=('genre', 'shared'),
+                        help="Kosakata per genre atau satu kosakata bersama (default: genre)")
+    parser.add_argument('--verify', action='store_true',
+                        help="Bandingkan skor fitur dengan chi2 dan MultinomialNB scikit-learn")
+    args = parser.parse_args()
+    
+    data = pd.read_csv(args.csv)
+    y = data[args.genre_col].tolist()
+    
+    with tempfile.TemporaryDirectory() as directory:
+        model_path = os.path.join(directory, 'film_recommender.joblib')
+        baseline = make_recommender({'feature_selection': None}, model_path)
+        X_prep = baseline._preprocess_data(data[args.preferences_col].tolist())
+        X_test = train_test_split(X_prep, test_size=0.2, random_state=42)[1]
+        
+        configurations = [(None, None)] + [(method, size) for method in args.methods for size in args.sizes]
+        rows = []
+        for method, size in configurations:
+            recommender = baseline if method is None else make_recommender(
+                {'feature_selection': method, 'selected_features': size, 'selection_scope': args.scope}, model_path
+            )
+            evaluation = recommender._train_prepared(X_prep, y)
+            rows.append((method or '-', size or '-', evaluation['model_size']['features_per_genre'],
+                         evaluation['average_accuracy'], evaluation['latency_ms'],
+                         single_text_latency(recommender, X_test), evaluation['model_size']['file_bytes']))
+        
+        base_bytes = rows[0][-1]
+        print(f"\n{'metode':<13} {'target':>6} {'fitur/genre':>11} {'akurasi':>8} {'batch ms/teks':>13} "
+              f"{'ms/teks':>8} {'KB':>8} {'ukuran':>7}")
+        for method, size, n_features, accuracy, batch_ms, single_ms, file_bytes in rows:
+            print(f"{method:<13} {size:>6} {n_features:>11.1f} {accuracy:>8.4f} {batch_ms:>13.3f} "
+                  f"{single_ms:>8.2f} {file_bytes / 1024:>8.1f} {file_bytes / base_bytes:>6.2f}x")
+        
+        if args.verify:
+            if verify(baseline, X_prep, y):
+                print("Verifikasi berhasil: skor fitur sama dengan chi2 dan MultinomialNB scikit-learn")
+            else:
+                print("Verifikasi gagal")
+                sys.exit(1)
+
+if __name__ == '__main__':
+    main()
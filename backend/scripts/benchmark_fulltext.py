@@ -0,0 +1,104 @@
+"""
+Benchmark pencarian BM25 FullTextIndex pada korpus sintetis besar.
+
+Setiap kueri dijalankan dua kali: dengan penghentian dini top-k dan secara
+menyeluruh (exhaustive). Hasil keduanya harus sama (film dan skor).
+
+Jalankan dari direktori backend:
+    python scripts/benchmark_fulltext.py --films 100000 --queries 200 -k 10
+"""
+import os
+import sys
+import time
+import tempfile
+import argparse
+import numpy as np
+
+# Menambahkan path untuk import
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.models.fulltext import FullTextIndex
+
+def build_synthetic_documents(n_films, vocabulary_size, seed=42):
+    """
+    Membuat dokumen sintetis dengan distribusi term Zipf
+    
+    Parameters
+    ----------
+    n_films : int
+        Jumlah film
+    vocabulary_size : int
+        Jumlah term unik
+    seed : int, optional
+        Seed random, by default 42
+    
+    Returns
+    -------
+    tuple
+        (list nama film, list dictionary field -> daftar term)
+    """
+    rng = np.random.default_rng(seed)
+    vocabulary = np.array([f"t{i}" for i in range(vocabulary_size)])
+    
+    def sample(size):
+        ids = np.minimum(rng.zipf(1.3, size) - 1, vocabulary_size - 1)
+        return vocabulary[ids].tolist()
+    
+    film_names = [f"Film {i}" for i in range(n_films)]
+    documents = [
+        {
+            'title': sample(rng.integers(1, 4)),
+            'description': sample(rng.integers(15, 60)),
+            'actors': sample(rng.integers(2, 6))
+        }
+        for _ in range(n_films)
+    ]
+    return film_names, documents
+
+def main():
+    """Menjalankan benchmark pencarian BM25"""
+    parser = argparse.ArgumentParser(description="Benchmark pencarian BM25 dengan penghentian dini top-k")
+    parser.add_argument('--films', type=int, default=100000, help="Jumlah film sintetis (default: 100000)")
+    parser.add_argument('--vocabulary', type=int, default=50000, help="Jumlah term unik (default: 50000)")
+    parser.add_argument('--queries', type=int, default=200, help="Jumlah kueri (default: 200)")
+    parser.add_argument('-k', type=int, default=10, help="Jumlah hasil per kueri (default: 10)")
+    args = parser.parse_args()
+    
+    film_names, documents = build_synthetic_documents(args.films, args.vocabulary)
+    
+    start = time.perf_counter()
+    index = FullTextIndex({}, index_path=os.path.join(tempfile.mkdtemp(), 'fulltext.joblib'))
+    index.build_from_fields(film_names, documents)
+    print(f"Index {args.films} film, {len(index.vocabulary)} term, {len(index.doc_ids)} posting "
+          f"dibangun dalam {time.perf_counter() - start:.2f} detik")
+    
+    # Kueri berisi 2-4 term dari dokumen acak, agar ada campuran term umum dan jarang
+    rng = np.random.default_rng(7)
+    queries = []
+    for _ in range(args.queries):
+        terms = documents[rng.integers(len(documents))]['description']
+        queries.append(" ".join(rng.choice(terms, size=min(len(terms), rng.integers(2, 5)), replace=False)))
+    
+    # Kueri sintetis sudah berupa term, jadi analisis teks dilewati
+    index.analyze = str.split
+    
+    timings = {}
+    results = {}
+    for mode, exhaustive in (('exhaustive', True), ('early', False)):
+        start = time.perf_counter()
+        results[mode] = [index.search_ids(query, args.k, exhaustive=exhaustive) for query in queries]
+        timings[mode] = (time.perf_counter() - start) / len(queries) * 1e6
+    
+    mismatches = 0
+    for (early_ids, early_scores), (full_ids, full_scores) in zip(results['early'], results['exhaustive']):
+        if not (np.allclose(early_scores, full_scores, rtol=1e-5)
+                and set(early_ids.tolist()) == set(full_ids.tolist())):
+            mismatches += 1
+    
+    print(f"{'mode':<12} {'us/kueri':>10}")
+    for mode, elapsed in timings.items():
+        print(f"{mode:<12} {elapsed:>10.1f}")
+    print(f"Hasil berbeda: {mismatches} dari {len(queries)} kueri")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark graf rekomendasi film pada katalog sintetis
+
+Katalog berisi --films film; setiap film merekomendasikan --links judul
+acak (sebagian judul di luar katalog). Skor random walk with restart hasil
+iterasi dibandingkan dengan iterasi float64 yang panjang untuk beberapa
+film, lalu waktu lookup rekomendasi satu film dan beberapa film diukur.
+
+Jalankan dari direktori backend:
+    python scripts/benchmark_link_graph.py --films 20000 --links 8
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import numpy as np
+from scipy import sparse
+
+# Menambahkan path untuk import
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.models.link_graph import RecommendationGraph
+
+def synthetic_catalogue(n_films, n_links, seed=0):
+    """
+    Membuat katalog film sintetis dengan daftar rekomendasi acak
+    
+    Returns
+    -------
+    dict
+        Dictionary nama film -> data film
+    """
+    rng = np.random.default_rng(seed)
+    # Judul di luar katalog sekitar seperlima dari semua judul
+    n_titles = n_films + n_films // 5
+    return {
+        f"Film {i}": {'title': f"Film {i}", 'recommendations': [f"Film {j}" for j in rng.choice(n_titles, n_links)]}
+        for i in range(n_films)
+    }
+
+def reference_scores(graph, adjacency, node, iterations=200):
+    """Skor random walk with restart satu simpul dengan float64 dan iterasi tetap yang panjang"""
+    degree = np.asarray(adjacency.sum(axis=1)).ravel()
+    transition_t = (sparse.diags(1.0 / np.maximum(degree, 1)) @ adjacency).T.tocsr()
+    restart = np.zeros(adjacency.shape[0])
+    restart[node] = 1.0
+    scores = restart.copy()
+    for _ in range(iterations):
+        dangling = scores[degree == 0].sum()
+        scores = graph.restart * restart + (1 - graph.restart) * (transition_t @ scores + dangling * restart)
+    return scores
+
+def main():
+    """Menjalankan benchmark graf rekomendasi"""
+    parser = argparse.ArgumentParser(description="Waktu build dan lookup graf rekomendasi film")
+    parser.add_argument('--films', type=int, default=20000, help="Jumlah film sintetis (default: 20000)")
+    parser.add_argument('--links', type=int, default=8, help="Jumlah rekomendasi per film (default: 8)")
+    parser.add_argument('--lookups', type=int, default=2000, help="Jumlah lookup yang diukur (default: 2000)")
+    args = parser.parse_args()
+    
+    films_data = synthetic_catalogue(args.films, args.links)
+    model_path = os.path.join(tempfile.mkdtemp(prefix='filmfinder-graph-'), 'film_link_graph.joblib')
+    
+    start = time.perf_counter()
+    graph = RecommendationGraph(films_data, model_path=model_path)
+    graph.build()
+    build_seconds = time.perf_counter() - start
+    
+    # Bandingkan skor top-k yang tersimpan dengan skor acuan
+    adjacency = graph._build_adjacency()
+    max_error = 0.0
+    for node in range(0, graph.n_films, max(graph.n_films // 5, 1)):
+        exact = reference_scores(graph, adjacency, node)
+        row = graph.scores[node]
+        max_error = max(max_error, float(np.max(np.abs(row.data - exact[row.indices]))))
+    
+    names = list(films_data)
+    rng = np.random.default_rng(1)
+    for label, n_seeds in (('1 film', 1), ('3 film', 3)):
+        seeds = [[names[i] for i in rng.choice(len(names), n_seeds, replace=False)] for _ in range(args.lookups)]
+        start = time.perf_counter()
+        for seed in seeds:
+            graph.recommend(seed, top_n=10)
+        elapsed = time.perf_counter() - start
+        print(f"Lookup {label}: {elapsed / args.lookups * 1e6:.0f} us per query")
+    
+    print(f"{args.films} film, {len(graph.node_names)} simpul, {graph.scores.nnz} skor tersimpan")
+    print(f"Build: {build_seconds:.2f} detik, {os.path.getsize(model_path) / 1e6:.1f} MB")
+    print(f"Selisih skor maksimum dengan acuan: {max_error:.2e}")
+    os.remove(model_path)
+    
+    if max_error > 1e-4:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
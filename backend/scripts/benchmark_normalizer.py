@@ -0,0 +1,108 @@
+"""
+Benchmark dan uji kesamaan normalize_text berbasis trie terhadap implementasi lama
+
+Implementasi lama (empat lintasan dan lookup per kata) disalin di script ini
+sebagai pembanding. Hasil keduanya harus sama, kecuali untuk teks yang
+memuat frasa beberapa kata (misalnya "science fiction") yang sebelumnya
+tidak pernah cocok.
+
+Jalankan dari direktori backend:
+    python scripts/benchmark_normalizer.py --repeat 20
+"""
+import os
+import re
+import sys
+import time
+import argparse
+import unicodedata
+
+# Menambahkan path untuk import
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.utils.preprocessor import normalize_text, word_normalization, film_keywords, _split_words
+from backend.scripts.build_stem_lexicon import collect_texts
+from backend.scripts.benchmark_tokenizer import random_texts
+
+def legacy_normalize_text(text):
+    """Implementasi normalize_text sebelum memakai trie (per kata, tanpa frasa)"""
+    text = text.lower()
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('utf-8', 'ignore')
+    text = re.sub(r'[^\w\s]', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    
+    normalized_words = []
+    for word in text.split():
+        if word in word_normalization:
+            normalized_words.append(word_normalization[word])
+        elif word in film_keywords:
+            normalized_words.append(film_keywords[word])
+        else:
+            normalized_words.append(word)
+    
+    return ' '.join(normalized_words)
+
+def contains_phrase(text, phrases):
+    """
+    Mengecek apakah teks memuat salah satu frasa beberapa kata
+    
+    Parameters
+    ----------
+    text : str
+        Teks mentah
+    phrases : list
+        List frasa dalam bentuk list kata
+    
+    Returns
+    -------
+    bool
+        True jika ada frasa yang muncul berurutan di teks
+    """
+    words = _split_words(text)
+    return any(
+        words[i:i + len(phrase)] == phrase
+        for phrase in phrases for i in range(len(words) - len(phrase) + 1)
+    )
+
+def main():
+    """Menjalankan uji kesamaan dan benchmark normalisasi"""
+    parser = argparse.ArgumentParser(description="Bandingkan normalize_text berbasis trie dengan implementasi lama")
+    parser.add_argument('--random-texts', type=int, default=5000, help="Jumlah teks acak (default: 5000)")
+    parser.add_argument('--repeat', type=int, default=20, help="Pengulangan korpus untuk pengukuran (default: 20)")
+    args = parser.parse_args()
+    
+    _, corpus_texts = collect_texts(
+        [os.path.join('data', 'training_films.csv')], 'preferences',
+        [os.path.join('data', name) for name in ('films.json', 'faq_films.json', 'faq.json')], []
+    )
+    texts = corpus_texts + random_texts(args.random_texts)
+    
+    phrases = [words for words in map(_split_words, list(word_normalization) + list(film_keywords)) if len(words) > 1]
+    
+    unexpected = 0
+    phrase_changes = 0
+    for text in texts:
+        if normalize_text(text) == legacy_normalize_text(text):
+            continue
+        if contains_phrase(text, phrases):
+            phrase_changes += 1
+        else:
+            unexpected += 1
+            if unexpected <= 10:
+                print(f"Berbeda: {text!r}\n  baru: {normalize_text(text)!r}\n  lama: {legacy_normalize_text(text)!r}")
+    
+    print(f"{len(texts)} teks: {phrase_changes} berubah karena frasa beberapa kata, {unexpected} berbeda tanpa frasa")
+    
+    print(f"{'versi':<6} {'us/teks':>10}")
+    for name, function in (('lama', legacy_normalize_text), ('trie', normalize_text)):
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for text in texts:
+                function(text)
+        elapsed = (time.perf_counter() - start) / (args.repeat * len(texts)) * 1e6
+        print(f"{name:<6} {elapsed:>10.2f}")
+    
+    if unexpected:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
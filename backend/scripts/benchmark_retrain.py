@@ -0,0 +1,79 @@
+"""
+Benchmark training ulang dengan sidik jari artifact dan cache preprocessing
+
+Training dijalankan di direktori sementara (models/ kosong) dengan salinan
+CSV training:
+    awal          cache dan artifact kosong
+    tidak berubah sidik jari sama, training dilewati
+    verifikasi    training dilewati, model dievaluasi ulang
+    1 baris baru  satu baris diubah, hanya baris itu yang di-preprocessing
+    paksa         force=True, semua baris dari cache
+
+Jalankan dari direktori backend:
+    python scripts/benchmark_retrain.py
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import pandas as pd
+
+# Menambahkan path untuk import
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+def main():
+    """Menjalankan benchmark training ulang"""
+    parser = argparse.ArgumentParser(description="Waktu training ulang dengan sidik jari dan cache preprocessing")
+    parser.add_argument('--csv', default=os.path.join('data', 'training_films.csv'),
+                        help="Path file CSV training (default: data/training_films.csv)")
+    parser.add_argument('--workers', type=int, default=None, help="Jumlah proses preprocessing (default: jumlah CPU)")
+    args = parser.parse_args()
+    
+    csv_path = os.path.abspath(args.csv)
+    workdir = tempfile.mkdtemp(prefix='filmfinder-retrain-')
+    os.makedirs(os.path.join(workdir, 'models'))
+    work_csv = os.path.join(workdir, 'training_films.csv')
+    shutil.copy(csv_path, work_csv)
+    
+    # Semua path model (artifact, cache, leksikon) relatif terhadap direktori kerja
+    original_cwd = os.getcwd()
+    os.chdir(workdir)
+    from backend.models.classifier import FilmRecommender
+    
+    def run(label, **kwargs):
+        start = time.perf_counter()
+        evaluation = FilmRecommender().train_from_csv(work_csv, workers=args.workers, **kwargs)
+        elapsed = time.perf_counter() - start
+        results.append((label, elapsed, evaluation['retrained'], evaluation['average_accuracy']))
+    
+    results = []
+    try:
+        run('awal')
+        run('tidak berubah')
+        run('verifikasi', verify=True)
+        
+        data = pd.read_csv(work_csv)
+        data.loc[0, 'preferences'] = str(data.loc[0, 'preferences']) + ' dengan alur cerita yang menegangkan'
+        data.to_csv(work_csv, index=False)
+        run('1 baris baru')
+        run('paksa', force=True)
+    finally:
+        # Entri leksikon stem baru ditulis sekarang, bukan saat exit di direktori asal
+        from backend.utils.preprocessor import get_stem_lexicon
+        get_stem_lexicon().flush()
+        os.chdir(original_cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+    
+    print(f"{'skenario':<14} {'detik':>8} {'dilatih':>8} {'akurasi':>8}")
+    for label, elapsed, retrained, accuracy in results:
+        print(f"{label:<14} {elapsed:>8.2f} {str(retrained):>8} {accuracy:>8.4f}")
+    
+    expected = {'awal': True, 'tidak berubah': False, 'verifikasi': False, '1 baris baru': True, 'paksa': True}
+    if any(retrained != expected[label] for label, _, retrained, _ in results):
+        print("Keputusan training ulang tidak sesuai harapan")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark pencarian berfaset FilmCatalogue pada katalog sintetis besar.
+
+Hasil setiap kueri juga dicocokkan dengan penelusuran dictionary film biasa
+untuk memastikan mask vektor memberikan jumlah film dan faset genre yang sama.
+
+Jalankan dari direktori backend:
+    python scripts/benchmark_search.py --films 100000 --repeat 200
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+# Menambahkan path untuk import
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.models.catalogue import FilmCatalogue
+
+GENRES = [
+    "Action", "Adventure", "Animation", "Comedy", "Crime", "Documentary", "Drama",
+    "Family", "Fantasy", "History", "Horror", "Music", "Mystery", "Romance",
+    "Sci-Fi", "Thriller", "War", "Western", "Biography", "Sport"
+]
+
+QUERIES = [
+    {'genres': ["Action", "Sci-Fi"], 'year_min': 2015, 'year_max': 2022, 'rating_min': 7.5, 'duration_max': 150},
+    {'genres': ["Drama"], 'rating_min': 8.0},
+    {'genres': ["Comedy", "Romance"], 'genre_mode': 'any', 'year_min': 2000},
+    {'year_min': 1990, 'year_max': 1999, 'duration_min': 120},
+    {},
+]
+
+def build_synthetic_catalogue(n_films, seed=42):
+    """
+    Membuat katalog film sintetis
+    
+    Parameters
+    ----------
+    n_films : int
+        Jumlah film
+    seed : int, optional
+        Seed random, by default 42
+    
+    Returns
+    -------
+    dict
+        Dictionary berisi informasi film
+    """
+    rng = random.Random(seed)
+    films_data = {}
+    for i in range(n_films):
+        films_data[f"Film {i}"] = {
+            "title": f"Film {i}",
+            "release_year": rng.randint(1950, 2024),
+            "genre": rng.sample(GENRES, rng.randint(1, 4)),
+            "rating": round(rng.uniform(3.0, 9.5), 1),
+            "duration": rng.randint(70, 200)
+        }
+    return films_data
+
+def naive_search(films_data, genres=(), genre_mode='all', year_min=None, year_max=None,
+                 rating_min=None, duration_min=None, duration_max=None):
+    """
+    Pencarian dengan menelusuri dictionary film satu per satu (pembanding)
+    
+    Returns
+    -------
+    tuple
+        (jumlah film yang cocok, dictionary faset genre)
+    """
+    total = 0
+    genre_counts = {}
+    for film_data in films_data.values():
+        film_genres = film_data["genre"]
+        check = all if genre_mode == 'all' else any
+        if genres and not check(genre in film_genres for genre in genres):
+            continue
+        if year_min is not None and film_data["release_year"] < year_min:
+            continue
+        if year_max is not None and film_data["release_year"] > year_max:
+            continue
+        if rating_min is not None and film_data["rating"] < rating_min:
+            continue
+        if duration_min is not None and film_data["duration"] < duration_min:
+            continue
+        if duration_max is not None and film_data["duration"] >= duration_max:
+            continue
+        
+        total += 1
+        for genre in film_genres:
+            genre_counts[genre] = genre_counts.get(genre, 0) + 1
+    return total, genre_counts
+
+def main():
+    """Menjalankan benchmark pencarian berfaset"""
+    parser = argparse.ArgumentParser(description="Benchmark pencarian berfaset pada katalog sintetis")
+    parser.add_argument('--films', type=int, default=100000, help="Jumlah film sintetis (default: 100000)")
+    parser.add_argument('--repeat', type=int, default=200, help="Jumlah pengulangan per kueri (default: 200)")
+    parser.add_argument('--limit', type=int, default=20, help="Jumlah film per halaman (default: 20)")
+    args = parser.parse_args()
+    
+    films_data = build_synthetic_catalogue(args.films)
+    
+    start = time.perf_counter()
+    catalogue = FilmCatalogue(films_data)
+    print(f"Katalog {len(catalogue)} film dibangun dalam {time.perf_counter() - start:.2f} detik")
+    
+    print(f"{'kueri':<6} {'total':>7} {'us/kueri':>10} {'naif us':>10} {'cocok':>6}")
+    for i, query in enumerate(QUERIES):
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            result = catalogue.search(limit=args.limit, **query)
+        elapsed = (time.perf_counter() - start) / args.repeat * 1e6
+        
+        start = time.perf_counter()
+        expected_total, expected_genres = naive_search(films_data, **query)
+        naive = (time.perf_counter() - start) * 1e6
+        
+        matches = (result['total'] == expected_total and result['facets']['genre'] == expected_genres)
+        print(f"{i:<6} {result['total']:>7} {elapsed:>10.1f} {naive:>10.1f} {'ya' if matches else 'TIDAK':>6}")
+
+if __name__ == "__main__":
+    main()
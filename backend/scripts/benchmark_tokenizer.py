@@ -0,0 +1,114 @@
+"""
+Benchmark dan uji kesamaan tokenizer cepat terhadap word_tokenize NLTK
+
+Korpus berisi teks training, teks katalog film dan FAQ, teks untuk setiap
+pengganti frasa yang memuat tanda baca (misalnya 'sci-fi', 'tidak apa-apa'),
+serta teks acak yang memuat kata-kata sulit (kontraksi Treebank, kata
+berhubung, angka, garis bawah). Semua teks dinormalisasi dengan
+normalize_text terlebih dahulu, sama seperti di preprocess_text dan tokenize_only.
+
+Jalankan dari direktori backend:
+    python scripts/benchmark_tokenizer.py --repeat 20
+"""
+import os
+import re
+import sys
+import time
+import random
+import argparse
+
+# Menambahkan path untuk import
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.utils.preprocessor import normalize_text, tokenize, word_normalization, film_keywords
+from backend.scripts.build_stem_lexicon import collect_texts
+
+# Kata yang diperlakukan khusus oleh tokenizer Treebank atau normalize_text
+TRICKY_WORDS = [
+    'cannot', 'gimme', 'gonna', 'gotta', 'lemme', 'wanna', 'wannabe', 'cannotx', 'whaddya', 'whatcha',
+    'apa-apa', 'sci-fi', 'x--y', "don't", "it's", "'tis", 'a.b', 'tahun 2023.', '3.88', 'snake_case',
+    '"kutipan"', '(kurung)', '...', 'Café', 'naïve', 'ÉCOLE', '¿qué?', 'gpp', 'science fiction'
+]
+
+def replacement_texts():
+    """
+    Membuat teks untuk setiap frasa yang penggantinya memuat karakter selain
+    huruf, angka, garis bawah, dan spasi (tanda hubung pada 'sci-fi' atau
+    'tidak apa-apa'), di awal, tengah, dan akhir teks serta di samping kontraksi
+    
+    Returns
+    -------
+    list
+        List teks
+    """
+    phrases = [
+        phrase
+        for mapping in (word_normalization, film_keywords)
+        for phrase, replacement in mapping.items()
+        if re.search(r'[^\w\s]', replacement)
+    ]
+    templates = ["{}", "saya suka {} banget", "film {}", "{} cannot {}", "gonna {} {}"]
+    return [template.format(phrase, phrase) for phrase in phrases for template in templates]
+
+def random_texts(n_texts, seed=42):
+    """
+    Membuat teks acak dari kata-kata sulit dan kosakata normalisasi
+    
+    Parameters
+    ----------
+    n_texts : int
+        Jumlah teks
+    seed : int, optional
+        Seed random, by default 42
+    
+    Returns
+    -------
+    list
+        List teks
+    """
+    rng = random.Random(seed)
+    vocabulary = TRICKY_WORDS + list(word_normalization) + list(film_keywords) + list(film_keywords.values())
+    return [" ".join(rng.choice(vocabulary) for _ in range(rng.randint(1, 15))) for _ in range(n_texts)]
+
+def main():
+    """Menjalankan uji kesamaan dan benchmark tokenizer"""
+    parser = argparse.ArgumentParser(description="Bandingkan tokenizer cepat dengan word_tokenize NLTK")
+    parser.add_argument('--random-texts', type=int, default=5000, help="Jumlah teks acak (default: 5000)")
+    parser.add_argument('--repeat', type=int, default=20, help="Pengulangan korpus untuk pengukuran (default: 20)")
+    args = parser.parse_args()
+    
+    training_texts, corpus_texts = collect_texts(
+        [os.path.join('data', 'training_films.csv')], 'preferences',
+        [os.path.join('data', name) for name in ('films.json', 'faq_films.json', 'faq.json')], []
+    )
+    hyphen_texts = [normalize_text(text) for text in replacement_texts()]
+    if not any('-' in text for text in hyphen_texts):
+        print("Tidak ada pengganti frasa berhubung yang teruji")
+        sys.exit(1)
+    texts = hyphen_texts + [normalize_text(text) for text in corpus_texts + random_texts(args.random_texts)]
+    
+    mismatches = 0
+    for text in texts:
+        fast_tokens, nltk_tokens = tokenize(text, mode='fast'), tokenize(text, mode='nltk')
+        if fast_tokens != nltk_tokens:
+            mismatches += 1
+            if mismatches <= 10:
+                print(f"Berbeda: {text!r}\n  fast: {fast_tokens}\n  nltk: {nltk_tokens}")
+    
+    print(f"{len(texts)} teks ({len(training_texts)} teks training, {len(hyphen_texts)} teks pengganti frasa "
+          f"berhubung), token berbeda: {mismatches}")
+    
+    print(f"{'mode':<6} {'us/teks':>10}")
+    for mode in ('nltk', 'fast'):
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for text in texts:
+                tokenize(text, mode=mode)
+        elapsed = (time.perf_counter() - start) / (args.repeat * len(texts)) * 1e6
+        print(f"{mode:<6} {elapsed:>10.2f}")
+    
+    if mismatches:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
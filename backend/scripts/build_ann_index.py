@@ -0,0 +1,56 @@
+"""
+Script untuk membangun atau memperbarui indeks ANN deskripsi film.
+Jika indeks sudah ada, hanya film baru yang ditambahkan.
+
+Jalankan dari direktori backend:
+    python scripts/build_ann_index.py
+    python scripts/build_ann_index.py --rebuild --tables 16 --bits 10 --probes 2
+"""
+import os
+import sys
+import json
+import time
+import argparse
+
+# Menambahkan path untuk import
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.models.ann_index import FilmDescriptionIndex
+
+def main():
+    """Membangun atau memperbarui indeks ANN dari file JSON database film"""
+    parser = argparse.ArgumentParser(description="Bangun atau perbarui indeks ANN deskripsi film")
+    parser.add_argument('--films', default=os.path.join('data', 'films.json'),
+                        help="Path file database film (default: data/films.json)")
+    parser.add_argument('--output', default=os.path.join('models', 'film_ann_index.joblib'),
+                        help="Path file indeks (default: models/film_ann_index.joblib)")
+    parser.add_argument('--rebuild', action='store_true', help="Bangun ulang indeks dari awal")
+    parser.add_argument('--tables', type=int, default=16, help="Jumlah tabel LSH (default: 16)")
+    parser.add_argument('--bits', type=int, default=10, help="Jumlah bit per tabel (default: 10)")
+    parser.add_argument('--probes', type=int, default=2, help="Jumlah bucket tambahan per tabel (default: 2)")
+    args = parser.parse_args()
+    
+    with open(args.films, 'r', encoding='utf-8') as file:
+        films_data = json.load(file)
+    
+    film_index = None
+    if not args.rebuild and os.path.exists(args.output):
+        film_index = FilmDescriptionIndex.load(args.output)
+    
+    if film_index is None:
+        film_index = FilmDescriptionIndex(
+            n_tables=args.tables, n_bits=args.bits, n_probes=args.probes, index_path=args.output
+        )
+    else:
+        # Parameter query dapat diubah tanpa membangun ulang indeks
+        film_index.index.n_probes = args.probes
+    
+    start = time.perf_counter()
+    added = film_index.add_films(films_data)
+    elapsed = time.perf_counter() - start
+    
+    film_index.save()
+    print(f"{added} film baru ditambahkan dalam {elapsed:.2f} detik (total {len(film_index.index)} film)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+Script untuk membangun graf tautan rekomendasi film secara offline
+
+Jalankan dari direktori backend:
+    python scripts/build_link_graph.py --top-k 50 --restart 0.3
+"""
+import os
+import sys
+import json
+import time
+import argparse
+
+# Menambahkan path untuk import
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.models.link_graph import RecommendationGraph, RESTART_PROBABILITY
+
+def main():
+    """Membangun graf rekomendasi film dari file JSON database film"""
+    parser = argparse.ArgumentParser(description="Bangun skor random walk with restart dari tautan rekomendasi")
+    parser.add_argument('--films', default=os.path.join('data', 'films.json'),
+                        help="Path file database film (default: data/films.json)")
+    parser.add_argument('--output', default=os.path.join('models', 'film_link_graph.joblib'),
+                        help="Path file graf rekomendasi (default: models/film_link_graph.joblib)")
+    parser.add_argument('--top-k', type=int, default=50,
+                        help="Jumlah skor tertinggi per film (default: 50)")
+    parser.add_argument('--restart', type=float, default=RESTART_PROBABILITY,
+                        help=f"Peluang kembali ke film awal (default: {RESTART_PROBABILITY})")
+    parser.add_argument('--batch-size', type=int, default=256,
+                        help="Jumlah film awal per batch perhitungan (default: 256)")
+    args = parser.parse_args()
+    
+    with open(args.films, 'r', encoding='utf-8') as file:
+        films_data = json.load(file)
+    
+    start = time.perf_counter()
+    graph = RecommendationGraph(films_data, top_k=args.top_k, restart=args.restart, model_path=args.output)
+    graph.build(batch_size=args.batch_size)
+    elapsed = time.perf_counter() - start
+    
+    print(f"{len(films_data)} film ({len(graph.node_names)} simpul) diproses dalam {elapsed:.2f} detik")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+Script untuk membangun tabel top-k film yang mirip secara offline
+
+Jalankan dari direktori backend:
+    python scripts/build_similarity.py --top-k 20
+"""
+import os
+import sys
+import json
+import time
+import argparse
+
+# Menambahkan path untuk import
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.models.similarity import FilmSimilarity
+
+def main():
+    """Membangun tabel kemiripan film dari file JSON database film"""
+    parser = argparse.ArgumentParser(description="Bangun tabel top-k film yang mirip")
+    parser.add_argument('--films', default=os.path.join('data', 'films.json'),
+                        help="Path file database film (default: data/films.json)")
+    parser.add_argument('--output', default=os.path.join('models', 'film_similarity.joblib'),
+                        help="Path file tabel kemiripan (default: models/film_similarity.joblib)")
+    parser.add_argument('--top-k', type=int, default=20,
+                        help="Jumlah tetangga terdekat per film (default: 20)")
+    parser.add_argument('--batch-size', type=int, default=1024,
+                        help="Jumlah baris per batch perhitungan (default: 1024)")
+    args = parser.parse_args()
+    
+    with open(args.films, 'r', encoding='utf-8') as file:
+        films_data = json.load(file)
+    
+    start = time.perf_counter()
+    similarity = FilmSimilarity(films_data, top_k=args.top_k, model_path=args.output)
+    similarity.build(batch_size=args.batch_size)
+    elapsed = time.perf_counter() - start
+    
+    print(f"{len(films_data)} film diproses dalam {elapsed:.2f} detik")
+
+if __name__ == '__main__':
+    main()
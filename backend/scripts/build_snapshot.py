@@ -0,0 +1,188 @@
+"""
+Script untuk membangun snapshot biner katalog film (films.json + faq_films.json)
+
+Snapshot berisi data film, FAQ, indeks turunan (indeks genre, sinonim
+film, daftar genre), serta kolom field indeks dan field numerik film
+sehingga server tidak perlu mem-parsing JSON dan membangun indeks
+tersebut saat start. Server memakai snapshot secara
+otomatis selama file JSON sumber tidak berubah; jika berubah, server
+kembali memuat JSON sampai script ini dijalankan ulang.
+
+Jalankan dari direktori backend:
+    python scripts/build_snapshot.py --verify
+"""
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+# Menambahkan path untuk import
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.models.storage import JSONFilmStore, NUMERIC_FIELDS, load_faq_data
+from backend.models.snapshot import SnapshotFilmStore, write_snapshot, file_signature, INDEX_FIELDS
+from backend.models.translator import FilmTranslator
+from backend.models.chatbot import FilmChatbot
+
+def build_derived(films_data, faq_data):
+    """
+    Membangun indeks turunan yang disimpan di snapshot
+    
+    Parameters
+    ----------
+    films_data : dict
+        Dictionary berisi informasi film
+    faq_data : dict
+        Data FAQ chatbot
+    
+    Returns
+    -------
+    dict
+        Dictionary 'genre_index', 'film_synonyms', dan 'all_genres'
+    """
+    synonyms = FilmChatbot.prepare_film_synonyms(films_data, faq_data)
+    return {
+        'genre_index': FilmTranslator.build_genre_index(films_data),
+        'film_synonyms': {name: sorted(values) for name, values in synonyms.items()},
+        'all_genres': FilmChatbot.collect_genres(films_data, faq_data)
+    }
+
+def verify(json_store, faq_data, snapshot_store):
+    """
+    Memastikan isi snapshot sama dengan file JSON
+    
+    Parameters
+    ----------
+    json_store : JSONFilmStore
+        Penyimpanan film dari file JSON
+    faq_data : dict
+        Data FAQ dari file JSON
+    snapshot_store : SnapshotFilmStore
+        Penyimpanan film dari snapshot
+    
+    Returns
+    -------
+    bool
+        True jika data film, FAQ, sidik jari, dan indeks turunan sama
+    """
+    ok = True
+    films_data = json_store.films
+    
+    if list(films_data) != list(snapshot_store.films):
+        print("Daftar atau urutan nama film berbeda")
+        ok = False
+    
+    for film_name, film_data in films_data.items():
+        if snapshot_store.films.get(film_name) != film_data:
+            print(f"Data film '{film_name}' berbeda")
+            ok = False
+        
+        index_record = {field: film_data[field] for field in INDEX_FIELDS if field in film_data}
+        if snapshot_store.index_records().get(film_name) != index_record:
+            print(f"Record indeks film '{film_name}' berbeda")
+            ok = False
+    
+    for field in NUMERIC_FIELDS:
+        if not np.array_equal(json_store.numeric_column(field), snapshot_store.numeric_column(field), equal_nan=True):
+            print(f"Kolom numerik '{field}' berbeda")
+            ok = False
+    
+    if json_store.fingerprint() != snapshot_store.fingerprint():
+        print("Sidik jari database berbeda")
+        ok = False
+    
+    if faq_data != snapshot_store.faq_data():
+        print("Data FAQ berbeda")
+        ok = False
+    
+    if FilmTranslator.build_genre_index(films_data) != snapshot_store.genre_index():
+        print("Indeks genre berbeda")
+        ok = False
+    
+    if FilmChatbot.prepare_film_synonyms(films_data, faq_data) != snapshot_store.film_synonyms():
+        print("Kamus sinonim film berbeda")
+        ok = False
+    
+    if FilmChatbot.collect_genres(films_data, faq_data) != snapshot_store.all_genres():
+        print("Daftar genre chatbot berbeda")
+        ok = False
+    
+    return ok
+
+def time_cold_load(films_path, faq_path, snapshot_path):
+    """
+    Membandingkan waktu memuat katalog dan indeks turunan dari JSON dan dari snapshot
+    
+    Parameters
+    ----------
+    films_path : str
+        Path file JSON database film
+    faq_path : str
+        Path file JSON FAQ
+    snapshot_path : str
+        Path file snapshot
+    
+    Returns
+    -------
+    tuple
+        (detik untuk JSON, detik untuk snapshot)
+    """
+    start = time.perf_counter()
+    json_store = JSONFilmStore(films_path)
+    faq_data = load_faq_data(faq_path)
+    build_derived(json_store.films, faq_data)
+    for field in NUMERIC_FIELDS:
+        json_store.numeric_column(field)
+    json_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    snapshot_store = SnapshotFilmStore.open_if_fresh(snapshot_path, {'films': films_path, 'faq': faq_path})
+    snapshot_store.faq_data()
+    snapshot_store.genre_index()
+    snapshot_store.film_synonyms()
+    for field in NUMERIC_FIELDS:
+        snapshot_store.numeric_column(field)
+    snapshot_seconds = time.perf_counter() - start
+    
+    return json_seconds, snapshot_seconds
+
+def main():
+    """Membangun snapshot katalog film"""
+    parser = argparse.ArgumentParser(description="Bangun snapshot biner katalog film")
+    parser.add_argument('--films', default=os.path.join('data', 'films.json'),
+                        help="Path file database film JSON (default: data/films.json)")
+    parser.add_argument('--faq', default=os.path.join('data', 'faq_films.json'),
+                        help="Path file FAQ chatbot JSON (default: data/faq_films.json)")
+    parser.add_argument('--output', default=os.path.join('data', 'catalogue.snapshot'),
+                        help="Path file snapshot (default: data/catalogue.snapshot)")
+    parser.add_argument('--verify', action='store_true',
+                        help="Bandingkan isi snapshot dengan file JSON dan ukur waktu muat")
+    args = parser.parse_args()
+    
+    if not os.path.exists(args.films):
+        print(f"File {args.films} tidak ditemukan")
+        sys.exit(1)
+    
+    json_store = JSONFilmStore(args.films)
+    faq_data = load_faq_data(args.faq)
+    
+    start = time.perf_counter()
+    sources = {'films': file_signature(args.films), 'faq': file_signature(args.faq)}
+    write_snapshot(args.output, json_store.films, faq_data, build_derived(json_store.films, faq_data), sources)
+    elapsed = time.perf_counter() - start
+    print(f"Snapshot {len(json_store.films)} film ditulis ke {args.output} "
+          f"({os.path.getsize(args.output) / 1024:.1f} KB) dalam {elapsed:.2f} detik")
+    
+    if args.verify:
+        snapshot_store = SnapshotFilmStore.open_if_fresh(args.output, {'films': args.films, 'faq': args.faq})
+        if snapshot_store is None or not verify(json_store, faq_data, snapshot_store):
+            print("Verifikasi gagal")
+            sys.exit(1)
+        print("Verifikasi berhasil: isi snapshot sama dengan file JSON")
+        
+        json_seconds, snapshot_seconds = time_cold_load(args.films, args.faq, args.output)
+        print(f"Waktu muat katalog: JSON {json_seconds * 1000:.1f} ms, snapshot {snapshot_seconds * 1000:.1f} ms")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+"""
+Script untuk membangun leksikon stem (bentuk kata -> kata dasar Sastrawi)
+
+Token dikumpulkan dari data training, teks katalog film (judul, deskripsi,
+sutradara, aktor), data FAQ chatbot, dan daftar kata tambahan, lalu
+masing-masing di-stem dengan Sastrawi. Dengan --verify, hasil
+preprocess_text mode leksikon dibandingkan dengan Sastrawi biasa.
+
+Jalankan dari direktori backend:
+    python scripts/build_stem_lexicon.py --verify
+    python scripts/build_stem_lexicon.py --wordlist kata_dasar.txt
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import pandas as pd
+
+# Menambahkan path untuk import
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
+from backend.utils.preprocessor import tokenize_only, preprocess_text, STEM_LEXICON_PATH
+from backend.utils.stem_lexicon import StemLexicon
+
+def collect_strings(value):
+    """
+    Mengambil semua string dari struktur JSON (dict, list, string)
+    
+    Parameters
+    ----------
+    value : object
+        Data JSON
+    
+    Returns
+    -------
+    list
+        Semua string, termasuk key dictionary
+    """
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        return [text for key, item in value.items() for text in [key] + collect_strings(item)]
+    if isinstance(value, list):
+        return [text for item in value for text in collect_strings(item)]
+    return []
+
+def collect_texts(csv_paths, column, json_paths, wordlists):
+    """
+    Mengumpulkan teks korpus dari semua sumber
+    
+    Parameters
+    ----------
+    csv_paths : list
+        Path file CSV data training
+    column : str
+        Nama kolom teks di CSV
+    json_paths : list
+        Path file JSON (database film, FAQ)
+    wordlists : list
+        Path file daftar kata (satu kata per baris)
+    
+    Returns
+    -------
+    tuple
+        (list teks training, list semua teks korpus)
+    """
+    training_texts = []
+    for path in csv_paths:
+        if os.path.exists(path):
+            training_texts.extend(pd.read_csv(path)[column].dropna().astype(str).tolist())
+    
+    texts = list(training_texts)
+    for path in json_paths:
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as file:
+                texts.extend(collect_strings(json.load(file)))
+    
+    for path in wordlists:
+        with open(path, 'r', encoding='utf-8') as file:
+            texts.extend(line.strip() for line in file if line.strip())
+    
+    return training_texts, texts
+
+def verify(lexicon_path, training_texts, tokens):
+    """
+    Memastikan leksikon menghasilkan stem yang sama dengan Sastrawi
+    
+    Parameters
+    ----------
+    lexicon_path : str
+        Path file leksikon
+    training_texts : list
+        Teks training untuk membandingkan preprocess_text
+    tokens : list
+        Token korpus untuk membandingkan hasil stem per token
+    
+    Returns
+    -------
+    bool
+        True jika semua hasil sama
+    """
+    # Stemmer baru agar cache Sastrawi dari proses build tidak ikut dipakai
+    reference = StemmerFactory().create_stemmer()
+    lexicon = StemLexicon(reference, path=lexicon_path, write_back=False)
+    
+    ok = True
+    for token in tokens:
+        if lexicon.roots.get(token) != reference.stem(token):
+            print(f"Stem token '{token}' berbeda")
+            ok = False
+    
+    # Sama dengan preprocess_text mode 'lexicon', tetapi memakai leksikon yang baru dibangun
+    for text in training_texts:
+        unstemmed = preprocess_text(text, do_stemming=False).split()
+        if " ".join(lexicon.stem(token) for token in unstemmed) != preprocess_text(text, stemming_mode='sastrawi'):
+            print(f"Hasil preprocess_text berbeda untuk: {text}")
+            ok = False
+    
+    return ok
+
+def main():
+    """Membangun leksikon stem"""
+    parser = argparse.ArgumentParser(description="Bangun leksikon stem dari korpus dengan Sastrawi")
+    parser.add_argument('--csv', action='append', default=None,
+                        help="File CSV data training (boleh berulang, default: data/training_films.csv)")
+    parser.add_argument('--column', default='preferences', help="Nama kolom teks di CSV (default: preferences)")
+    parser.add_argument('--json', action='append', default=None,
+                        help="File JSON katalog/FAQ (boleh berulang, default: data/films.json, "
+                             "data/faq_films.json, data/faq.json)")
+    parser.add_argument('--wordlist', action='append', default=[],
+                        help="File daftar kata, satu kata per baris (boleh berulang)")
+    parser.add_argument('--output', default=STEM_LEXICON_PATH,
+                        help=f"Path file leksikon (default: {STEM_LEXICON_PATH})")
+    parser.add_argument('--verify', action='store_true',
+                        help="Bandingkan hasil leksikon dengan Sastrawi biasa")
+    args = parser.parse_args()
+    
+    csv_paths = args.csv or [os.path.join('data', 'training_films.csv')]
+    json_paths = args.json or [os.path.join('data', name) for name in ('films.json', 'faq_films.json', 'faq.json')]
+    training_texts, texts = collect_texts(csv_paths, args.column, json_paths, args.wordlist)
+    
+    # Token diambil dengan normalisasi dan tokenisasi yang sama seperti preprocess_text
+    tokens = sorted({token for text in texts for token in tokenize_only(text)})
+    
+    start = time.perf_counter()
+    stemmer = StemmerFactory().create_stemmer()
+    roots = {token: stemmer.stem(token) for token in tokens}
+    StemLexicon.write(args.output, roots)
+    elapsed = time.perf_counter() - start
+    
+    changed = sum(1 for token, root in roots.items() if root != token)
+    print(f"Leksikon {len(roots)} kata ({changed} berubah bentuk) ditulis ke {args.output} "
+          f"({os.path.getsize(args.output) / 1024:.1f} KB) dalam {elapsed:.2f} detik")
+    
+    start = time.perf_counter()
+    StemLexicon(stemmer, path=args.output, write_back=False)
+    print(f"Waktu muat leksikon: {(time.perf_counter() - start) * 1000:.1f} ms")
+    
+    if args.verify:
+        if verify(args.output, training_texts, tokens):
+            print("Verifikasi berhasil: hasil leksikon sama dengan Sastrawi")
+        else:
+            print("Verifikasi gagal")
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+Script untuk menyalin stopwords bahasa Indonesia NLTK ke file teks
+
+Server membaca stopwords dari file ini sehingga tidak perlu mengimpor NLTK
+(yang ikut memuat scikit-learn) saat start. Dengan --verify, isi file
+dibandingkan dengan corpus NLTK.
+
+Jalankan dari direktori backend:
+    python scripts/build_stopwords.py --verify
+"""
+import os
+import sys
+import argparse
+
+# Menambahkan path untuk import
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.utils.preprocessor import write_stopwords, STOPWORDS_PATH
+
+def main():
+    """Menyalin stopwords NLTK"""
+    parser = argparse.ArgumentParser(description="Salin stopwords bahasa Indonesia NLTK ke file teks")
+    parser.add_argument('--output', default=STOPWORDS_PATH,
+                        help=f"Path file stopwords (default: {STOPWORDS_PATH})")
+    parser.add_argument('--verify', action='store_true',
+                        help="Bandingkan isi file dengan corpus NLTK")
+    args = parser.parse_args()
+    
+    words = write_stopwords(args.output)
+    print(f"{len(words)} stopwords ditulis ke {args.output}")
+    
+    if args.verify:
+        with open(args.output, 'r', encoding='utf-8') as file:
+            written = [word for word in file.read().split('\n') if word]
+        if written == words:
+            print("Verifikasi berhasil: isi file sama dengan corpus NLTK")
+        else:
+            print("Verifikasi gagal")
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
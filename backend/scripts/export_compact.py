@@ -0,0 +1,157 @@
+"""
+Script untuk mengekspor model rekomendasi ke runtime compact (hanya NumPy)
+
+Model compact ditulis ke models/film_recommender.npz (juga otomatis setiap
+model dilatih). Dengan --verify, hasil top_genres CompactRecommender
+dibandingkan dengan FilmRecommender.predict pada teks training dan teks
+acak. Dengan --benchmark, waktu import + muat model dan memori proses
+(RSS, Linux) kedua runtime diukur di proses terpisah.
+
+Jalankan dari direktori backend:
+    python scripts/export_compact.py --dtype float32 --verify --benchmark
+    RECOMMENDER_RUNTIME=compact python app.py
+"""
+import os
+import sys
+import json
+import argparse
+import subprocess
+import pandas as pd
+
+# Menambahkan path untuk import
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.models.classifier import FilmRecommender
+from backend.models.compact import CompactRecommender, export_compact, COMPACT_DTYPES
+from backend.scripts.benchmark_tokenizer import random_texts
+
+# Kode yang dijalankan di proses terpisah untuk mengukur start satu worker
+LOAD_CODE = """
+import sys, time, json
+sys.path.append({root!r})
+start = time.perf_counter()
+from backend.models.compact import open_recommender
+recommender = open_recommender({runtime!r})
+load_seconds = time.perf_counter() - start
+start = time.perf_counter()
+for text in {texts!r}:
+    recommender.predict(text)
+print(json.dumps({{
+    'load_seconds': load_seconds,
+    'predict_ms': (time.perf_counter() - start) / len({texts!r}) * 1000,
+    'rss_kb': int(next(line.split()[1] for line in open('/proc/self/status') if line.startswith('VmRSS'))),
+    'sklearn': 'sklearn' in sys.modules
+}}))
+"""
+
+def compare(expected, actual, tolerance):
+    """
+    Membandingkan top_genres dua hasil prediksi
+    
+    Parameters
+    ----------
+    expected : dict
+        Hasil FilmRecommender.predict
+    actual : dict
+        Hasil CompactRecommender.predict
+    tolerance : float
+        Selisih confidence maksimum
+    
+    Returns
+    -------
+    float or None
+        Selisih confidence terbesar, None jika urutan genre berbeda di luar toleransi
+    """
+    expected_genres = expected['top_genres']
+    actual_genres = actual['top_genres']
+    if len(expected_genres) != len(actual_genres):
+        return None
+    
+    # Genre boleh bertukar posisi hanya jika confidence-nya sama dalam toleransi
+    expected_confidence = {item['genre']: item['confidence'] for item in expected_genres}
+    max_difference = 0.0
+    for expected_item, actual_item in zip(expected_genres, actual_genres):
+        difference = abs(expected_item['confidence'] - actual_item['confidence'])
+        if actual_item['genre'] != expected_item['genre']:
+            swapped = expected_confidence.get(actual_item['genre'], expected_item['confidence'])
+            difference = max(difference, abs(swapped - actual_item['confidence']))
+        max_difference = max(max_difference, difference)
+    
+    return max_difference if max_difference <= tolerance else None
+
+def measure_runtime(runtime, texts):
+    """
+    Mengukur start dan prediksi satu runtime di proses Python baru
+    
+    Parameters
+    ----------
+    runtime : str
+        'sklearn' atau 'compact'
+    texts : list
+        Teks untuk mengukur latensi predict
+    
+    Returns
+    -------
+    dict
+        Waktu muat, latensi predict, RSS, dan apakah scikit-learn ter-import
+    """
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    code = LOAD_CODE.format(root=root, runtime=runtime, texts=texts)
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main():
+    """Mengekspor, memverifikasi, dan mengukur model compact"""
+    parser = argparse.ArgumentParser(description="Ekspor model rekomendasi ke runtime compact NumPy")
+    parser.add_argument('--dtype', default='float32', choices=COMPACT_DTYPES,
+                        help="Tipe data idf dan koefisien (default: float32)")
+    parser.add_argument('--csv', default=os.path.join('data', 'training_films.csv'),
+                        help="CSV teks untuk verifikasi (default: data/training_films.csv)")
+    parser.add_argument('--random-texts', type=int, default=500, help="Jumlah teks acak untuk verifikasi")
+    parser.add_argument('--tolerance', type=float, default=None,
+                        help="Selisih confidence maksimum (default: 1e-5 float32, 1e-2 float16)")
+    parser.add_argument('--verify', action='store_true', help="Bandingkan top_genres dengan FilmRecommender")
+    parser.add_argument('--benchmark', action='store_true', help="Ukur waktu muat dan memori kedua runtime")
+    args = parser.parse_args()
+    
+    recommender = FilmRecommender()
+    if recommender.multilabel_binarizer is None:
+        print(f"Model {recommender.model_path} belum dilatih")
+        sys.exit(1)
+    
+    path = export_compact(recommender, dtype=args.dtype)
+    print(f"Model compact {args.dtype} ditulis ke {path} ({os.path.getsize(path) / 1024:.1f} KB, "
+          f"artifact joblib {os.path.getsize(recommender.model_path) / 1024:.1f} KB)")
+    
+    texts = pd.read_csv(args.csv)['preferences'].astype(str).tolist() + random_texts(args.random_texts)
+    
+    if args.verify:
+        compact = CompactRecommender(path)
+        tolerance = args.tolerance or (1e-5 if args.dtype == 'float32' else 1e-2)
+        failures = 0
+        max_difference = 0.0
+        for text in texts:
+            difference = compare(recommender.predict(text), compact.predict(text), tolerance)
+            if difference is None:
+                failures += 1
+                if failures <= 5:
+                    print(f"Berbeda: {text!r}")
+            else:
+                max_difference = max(max_difference, difference)
+        
+        print(f"{len(texts)} teks, berbeda: {failures}, selisih confidence terbesar: {max_difference:.2e}")
+        if failures:
+            print("Verifikasi gagal")
+            sys.exit(1)
+        print(f"Verifikasi berhasil: top_genres sama dalam toleransi {tolerance:g}")
+    
+    if args.benchmark:
+        sample = texts[:200]
+        print(f"{'runtime':<8} {'muat (s)':>9} {'predict ms':>11} {'RSS MB':>11} {'sklearn':>8}")
+        for runtime in ('sklearn', 'compact'):
+            result = measure_runtime(runtime, sample)
+            print(f"{runtime:<8} {result['load_seconds']:>9.2f} {result['predict_ms']:>11.3f} "
+                  f"{result['rss_kb'] / 1024:>11.1f} {str(result['sklearn']):>8}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Script untuk mengimpor database film dari films.json ke SQLite
+
+Setelah diimpor, jalankan aplikasi dengan FILM_STORAGE=sqlite
+(dan FILM_DB_PATH jika path database bukan data/films.db).
+
+Jalankan dari direktori backend:
+    python scripts/import_films_sqlite.py --verify
+"""
+import os
+import sys
+import json
+import time
+import argparse
+
+# Menambahkan path untuk import
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.models.storage import SQLiteFilmStore, JSONFilmStore
+
+def verify(json_store, sqlite_store):
+    """
+    Memastikan isi database SQLite sama dengan file JSON
+    
+    Parameters
+    ----------
+    json_store : JSONFilmStore
+        Penyimpanan film dari file JSON
+    sqlite_store : SQLiteFilmStore
+        Penyimpanan film dari SQLite
+    
+    Returns
+    -------
+    bool
+        True jika data film, urutan, sidik jari, dan query genre sama
+    """
+    ok = True
+    
+    if list(json_store.films) != list(sqlite_store.films):
+        print("Daftar atau urutan nama film berbeda")
+        ok = False
+    
+    for film_name, film_data in json_store.films.items():
+        if sqlite_store.films.get(film_name) != film_data:
+            print(f"Data film '{film_name}' berbeda")
+            ok = False
+    
+    if json_store.fingerprint() != sqlite_store.fingerprint():
+        print("Sidik jari database berbeda")
+        ok = False
+    
+    genres = {genre for film_data in json_store.films.values() for genre in film_data.get('genre', [])}
+    for genre in genres:
+        if json_store.query(genre=genre.lower()) != sqlite_store.query(genre=genre.lower()):
+            print(f"Hasil query genre '{genre}' berbeda")
+            ok = False
+    
+    return ok
+
+def main():
+    """Mengimpor films.json ke database SQLite"""
+    parser = argparse.ArgumentParser(description="Impor database film dari JSON ke SQLite")
+    parser.add_argument('--films', default=os.path.join('data', 'films.json'),
+                        help="Path file database film JSON (default: data/films.json)")
+    parser.add_argument('--output', default=os.path.join('data', 'films.db'),
+                        help="Path database SQLite (default: data/films.db)")
+    parser.add_argument('--verify', action='store_true',
+                        help="Bandingkan isi database SQLite dengan file JSON setelah impor")
+    args = parser.parse_args()
+    
+    if not os.path.exists(args.films):
+        print(f"File {args.films} tidak ditemukan")
+        sys.exit(1)
+    
+    with open(args.films, 'r', encoding='utf-8') as file:
+        films_data = json.load(file)
+    
+    start = time.perf_counter()
+    sqlite_store = SQLiteFilmStore.create(args.output, films_data)
+    elapsed = time.perf_counter() - start
+    print(f"{len(films_data)} film diimpor ke {args.output} dalam {elapsed:.2f} detik")
+    
+    if args.verify:
+        if verify(JSONFilmStore(args.films), sqlite_store):
+            print("Verifikasi berhasil: isi SQLite sama dengan file JSON")
+        else:
+            print("Verifikasi gagal")
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Script untuk mencari hyperparameter terbaik model rekomendasi film
+
+Pencarian grid dengan cross-validation atas parameter TF-IDF dan Naive
+Bayes untuk semua genre. Model akhir dilatih dengan parameter terbaik dan
+disimpan ke models/film_recommender.joblib beserta parameternya.
+
+Jalankan dari direktori backend:
+    python scripts/tune_recommender.py --folds 5 --verify
+"""
+import os
+import sys
+import argparse
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import KFold
+from sklearn.preprocessing import MultiLabelBinarizer
+
+# Menambahkan path untuk import
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.models.classifier import (
+    FilmRecommender, fold_count_features, candidate_features, naive_bayes_counts, naive_bayes_predict
+)
+
+def verify(recommender, X_prep, Y, random_state):
+    """
+    Memastikan prediksi jalur cache (matrix jumlah term bersama + Naive Bayes
+    vektor) sama dengan Pipeline scikit-learn per genre pada fold pertama
+    
+    Parameters
+    ----------
+    recommender : FilmRecommender
+        Model dengan parameter hasil tuning
+    X_prep : list
+        Teks hasil preprocessing
+    Y : numpy.ndarray
+        Label multilabel
+    random_state : int
+        Seed pembagian fold
+    
+    Returns
+    -------
+    bool
+        True jika semua prediksi sama
+    """
+    train, test = next(KFold(n_splits=5, shuffle=True, random_state=random_state).split(X_prep))
+    X_train = [X_prep[i] for i in train]
+    X_test = [X_prep[i] for i in test]
+    
+    params = {name: value for name, value in recommender.params.items() if name != 'alpha'}
+    fold = fold_count_features(X_train, X_test, [params])
+    features_train, features_test = candidate_features(fold, params)
+    cached = naive_bayes_predict(features_test, naive_bayes_counts(features_train, Y[train]),
+                                 recommender.params['alpha'])
+    
+    reference = np.column_stack([
+        recommender._build_pipeline().fit(X_train, Y[train, g]).predict(X_test)
+        for g in range(Y.shape[1])
+    ]).astype(bool)
+    
+    return bool(np.array_equal(cached, reference))
+
+def main():
+    """Menjalankan pencarian hyperparameter"""
+    parser = argparse.ArgumentParser(description="Cari hyperparameter TF-IDF dan Naive Bayes terbaik")
+    parser.add_argument('--csv', default=os.path.join('data', 'training_films.csv'),
+                        help="Path file CSV data training (default: data/training_films.csv)")
+    parser.add_argument('--preferences-col', default='preferences', help="Kolom teks preferensi")
+    parser.add_argument('--genre-col', default='film_genre', help="Kolom genre (dipisah '|')")
+    parser.add_argument('--folds', type=int, default=5, help="Jumlah fold (default: 5)")
+    parser.add_argument('--workers', type=int, default=None, help="Jumlah proses (default: jumlah CPU)")
+    parser.add_argument('--top', type=int, default=10, help="Jumlah kandidat terbaik yang ditampilkan")
+    parser.add_argument('--verify', action='store_true',
+                        help="Bandingkan prediksi jalur cache dengan Pipeline scikit-learn")
+    args = parser.parse_args()
+    
+    data = pd.read_csv(args.csv)
+    X = data[args.preferences_col].tolist()
+    y = data[args.genre_col].tolist()
+    
+    recommender = FilmRecommender()
+    result = recommender.tune(X, y, n_splits=args.folds, workers=args.workers)
+    
+    print(f"{'F1 mikro':>9} {'akurasi':>8}  parameter")
+    for candidate in result['results'][:args.top]:
+        print(f"{candidate['f1_micro']:>9.4f} {candidate['average_accuracy']:>8.4f}  {candidate['params']}")
+    print(f"Akurasi rata-rata model akhir: {result['evaluation']['average_accuracy']:.4f} "
+          f"(total {result['seconds']:.2f} detik)")
+    
+    if args.verify:
+        X_prep = recommender._preprocess_data(X)
+        Y = MultiLabelBinarizer().fit_transform([genres.split('|') for genres in y])
+        if verify(recommender, X_prep, Y, random_state=42):
+            print("Verifikasi berhasil: prediksi jalur cache sama dengan Pipeline scikit-learn")
+        else:
+            print("Verifikasi gagal")
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,265 @@
+"""
+Kontrol penerimaan (admission control) untuk endpoint yang berat di CPU
+
+Setiap endpoint berat mendapat batas request yang diproses bersamaan dan
+antrean tunggu yang terbatas. Request ditolak cepat (503 + Retry-After)
+jika antrean penuh, atau jika perkiraan waktu tunggunya (posisi antrean x
+rata-rata waktu proses / batas bersamaan) melebihi batas waktu tunggu
+endpoint. Endpoint ringan seperti /api/film tidak dibatasi, sehingga tetap
+cepat saat endpoint berat kelebihan beban.
+
+Slot diberikan langsung ke request yang menunggu paling lama (FIFO) saat
+request lain selesai.
+"""
+import os
+import math
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+# Bobot pengamatan terbaru pada rata-rata waktu proses
+SERVICE_SMOOTHING = 0.2
+
+# Field kebijakan endpoint beserta tipenya, sesuai urutan di ADMISSION_<NAMA>
+POLICY_FIELDS = (('max_concurrent', int), ('max_queue', int), ('max_wait', float))
+
+class AdmissionRejected(Exception):
+    """Request ditolak karena endpoint kelebihan beban"""
+    
+    def __init__(self, name, reason, retry_after):
+        """
+        Parameters
+        ----------
+        name : str
+            Nama endpoint
+        reason : str
+            'queue_full', 'deadline', atau 'timeout'
+        retry_after : int
+            Saran detik sebelum mencoba lagi (header Retry-After)
+        """
+        super().__init__(f"Endpoint {name} kelebihan beban ({reason})")
+        self.name = name
+        self.reason = reason
+        self.retry_after = retry_after
+
+class ConcurrencyLimiter:
+    """
+    Batas request bersamaan dengan antrean tunggu terbatas untuk satu endpoint
+    """
+    
+    def __init__(self, name, max_concurrent, max_queue, max_wait):
+        """
+        Parameters
+        ----------
+        name : str
+            Nama endpoint
+        max_concurrent : int
+            Jumlah request yang diproses bersamaan
+        max_queue : int
+            Jumlah request yang boleh menunggu
+        max_wait : float
+            Batas waktu tunggu di antrean (detik)
+        """
+        self.name = name
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.max_queue = max(0, int(max_queue))
+        self.max_wait = max(0.0, float(max_wait))
+        
+        self._lock = threading.Lock()
+        self._active = 0
+        self._waiters = deque()
+        self._service_time = 0.0
+        
+        self._stats = {'admitted': 0, 'queue_full': 0, 'deadline': 0, 'timeout': 0, 'max_queue_depth': 0}
+    
+    def _retry_after(self, estimated_wait):
+        """Detik untuk header Retry-After (bilangan bulat, minimal 1)"""
+        return max(1, math.ceil(estimated_wait))
+    
+    def acquire(self):
+        """
+        Mengambil slot; menunggu di antrean jika semua slot terpakai
+        
+        Raises
+        ------
+        AdmissionRejected
+            Jika antrean penuh, perkiraan waktu tunggu melebihi max_wait,
+            atau slot tidak didapat sebelum max_wait
+        """
+        with self._lock:
+            if self._active < self.max_concurrent and not self._waiters:
+                self._active += 1
+                self._stats['admitted'] += 1
+                return
+            
+            # Perkiraan waktu tunggu: giliran dalam antrean dibagi slot bersamaan
+            estimated_wait = (len(self._waiters) + 1) / self.max_concurrent * self._service_time
+            if len(self._waiters) >= self.max_queue:
+                self._stats['queue_full'] += 1
+                raise AdmissionRejected(self.name, 'queue_full', self._retry_after(estimated_wait))
+            if estimated_wait > self.max_wait:
+                self._stats['deadline'] += 1
+                raise AdmissionRejected(self.name, 'deadline', self._retry_after(estimated_wait))
+            
+            granted = threading.Event()
+            self._waiters.append(granted)
+            self._stats['max_queue_depth'] = max(self._stats['max_queue_depth'], len(self._waiters))
+        
+        if granted.wait(timeout=self.max_wait):
+            return
+        
+        with self._lock:
+            # Slot bisa saja diberikan tepat setelah batas waktu habis
+            if granted.is_set():
+                return
+            self._waiters.remove(granted)
+            self._stats['timeout'] += 1
+            retry_after = self._retry_after(len(self._waiters) / self.max_concurrent * self._service_time)
+        
+        raise AdmissionRejected(self.name, 'timeout', retry_after)
+    
+    def release(self, service_seconds):
+        """
+        Melepas slot dan memberikannya ke request yang menunggu paling lama
+        
+        Parameters
+        ----------
+        service_seconds : float
+            Lama request diproses
+        """
+        with self._lock:
+            self._service_time += SERVICE_SMOOTHING * (service_seconds - self._service_time)
+            if self._waiters:
+                # Slot berpindah langsung, jumlah request aktif tidak berubah
+                self._waiters.popleft().set()
+                self._stats['admitted'] += 1
+            else:
+                self._active -= 1
+    
+    def metrics(self):
+        """
+        Mengambil metrik endpoint
+        
+        Returns
+        -------
+        dict
+            Batas, jumlah request aktif dan menunggu, jumlah diterima/ditolak,
+            kedalaman antrean maksimum, dan rata-rata waktu proses (ms)
+        """
+        with self._lock:
+            return {
+                'max_concurrent': self.max_concurrent,
+                'max_queue': self.max_queue,
+                'max_wait_ms': self.max_wait * 1000,
+                'active': self._active,
+                'queued': len(self._waiters),
+                'max_queue_depth': self._stats['max_queue_depth'],
+                'admitted': self._stats['admitted'],
+                'rejected': {reason: self._stats[reason] for reason in ('queue_full', 'deadline', 'timeout')},
+                'average_service_ms': self._service_time * 1000
+            }
+
+class AdmissionController:
+    """
+    Kumpulan pembatas per endpoint
+    """
+    
+    def __init__(self, policies):
+        """
+        Parameters
+        ----------
+        policies : dict
+            Nama endpoint -> (max_concurrent, max_queue, max_wait detik). Nilai
+            dapat diganti dengan environment variable ADMISSION_<NAMA>, misalnya
+            ADMISSION_CHAT="2,8,1.5"; field yang tidak diisi ("2" atau "2,,1.5")
+            memakai nilai default endpoint
+        
+        Raises
+        ------
+        ValueError
+            Jika nilai ADMISSION_<NAMA> tidak valid
+        """
+        self.limiters = {}
+        for name, policy in policies.items():
+            variable = f'ADMISSION_{name.upper()}'
+            override = os.environ.get(variable)
+            if override:
+                policy = self._parse_policy(variable, override, policy)
+            self.limiters[name] = ConcurrencyLimiter(name, *policy)
+    
+    @staticmethod
+    def _parse_policy(variable, override, default):
+        """
+        Membaca kebijakan endpoint dari environment variable
+        
+        Parameters
+        ----------
+        variable : str
+            Nama environment variable (untuk pesan error)
+        override : str
+            Nilai environment variable, "max_concurrent,max_queue,max_wait"
+        default : tuple
+            Kebijakan default endpoint untuk field yang tidak diisi
+        
+        Returns
+        -------
+        list
+            (max_concurrent, max_queue, max_wait)
+        
+        Raises
+        ------
+        ValueError
+            Jika jumlah field lebih dari tiga atau ada field yang bukan angka
+        """
+        values = [value.strip() for value in override.split(',')]
+        if len(values) > len(POLICY_FIELDS):
+            raise ValueError(f"{variable}='{override}' tidak valid: format 'max_concurrent,max_queue,max_wait' "
+                             f"(misalnya \"2,8,1.5\")")
+        
+        policy = list(default)
+        for i, value in enumerate(values):
+            if not value:
+                continue
+            field, cast = POLICY_FIELDS[i]
+            try:
+                policy[i] = cast(value)
+            except ValueError:
+                raise ValueError(f"{variable}='{override}' tidak valid: {field} harus berupa "
+                                 f"{'bilangan bulat' if cast is int else 'angka'}, bukan '{value}'")
+        
+        return policy
+    
+    @contextmanager
+    def admit(self, name):
+        """
+        Context manager untuk memproses satu request endpoint
+        
+        Parameters
+        ----------
+        name : str
+            Nama endpoint
+        
+        Raises
+        ------
+        AdmissionRejected
+            Jika request ditolak
+        """
+        limiter = self.limiters[name]
+        limiter.acquire()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            limiter.release(time.perf_counter() - start)
+    
+    def metrics(self):
+        """
+        Mengambil metrik semua endpoint
+        
+        Returns
+        -------
+        dict
+            Nama endpoint -> metrik
+        """
+        return {name: limiter.metrics() for name, limiter in self.limiters.items()}
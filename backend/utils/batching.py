@@ -0,0 +1,220 @@
+"""
+Penggabungan permintaan (micro-batching) untuk inferensi model
+
+Permintaan yang datang hampir bersamaan dari beberapa thread dikumpulkan
+oleh satu thread worker menjadi satu batch, lalu fungsi batch dipanggil
+sekali untuk seluruh batch dan setiap pemanggil menerima hasilnya sendiri.
+
+Jendela tunggu menyesuaikan beban dari rata-rata (EWMA) jarak antar
+kedatangan dan waktu proses satu batch. Worker hanya menunggu jika request
+datang lebih cepat dari waktu proses (menggabung menghemat kerja), dan
+hanya selama waktu yang diperkirakan untuk mengisi batch, dibatasi
+max_wait dan waktu proses satu batch. Saat lalu lintas sepi, atau satu klien yang menunggu hasilnya
+sebelum mengirim request berikutnya, batch langsung dijalankan tanpa
+menunggu; tambahan latensi tidak pernah lebih dari max_wait.
+"""
+import os
+import time
+import queue
+import threading
+from concurrent.futures import Future
+
+# Bobot pengamatan terbaru pada rata-rata jarak antar kedatangan dan waktu proses
+SMOOTHING = 0.2
+
+class RequestCoalescer:
+    """
+    Menggabungkan permintaan bersamaan menjadi satu pemanggilan fungsi batch
+    """
+    
+    def __init__(self, batch_function, max_batch_size=32, max_wait=0.002, name='coalescer'):
+        """
+        Inisialisasi penggabung permintaan
+        
+        Parameters
+        ----------
+        batch_function : callable
+            Fungsi yang menerima list input dan mengembalikan list hasil dengan urutan sama
+        max_batch_size : int, optional
+            Jumlah permintaan maksimal per batch, by default 32; 1 berarti
+            setiap permintaan langsung diproses di thread pemanggil
+        max_wait : float, optional
+            Waktu tunggu maksimal (detik) untuk mengumpulkan batch, by default 0.002
+        name : str, optional
+            Nama thread worker, by default 'coalescer'
+        """
+        self.batch_function = batch_function
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait))
+        self.name = name
+        
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker = None
+        self._worker_pid = None
+        
+        # Rata-rata jarak antar kedatangan dan waktu proses batch; awalnya
+        # dianggap sepi (tanpa tunggu)
+        self._arrival_gap = float('inf')
+        self._last_arrival = None
+        self._service_time = 0.0
+        
+        self._stats = {'requests': 0, 'batches': 0, 'max_batch': 0, 'wait_seconds': 0.0, 'batch_seconds': 0.0}
+    
+    def submit(self, item, timeout=None):
+        """
+        Memproses satu input lewat batch dan menunggu hasilnya
+        
+        Parameters
+        ----------
+        item : object
+            Input untuk fungsi batch
+        timeout : float, optional
+            Batas waktu menunggu hasil (detik), by default None
+        
+        Returns
+        -------
+        object
+            Hasil fungsi batch untuk input ini
+        
+        Raises
+        ------
+        Exception
+            Exception dari fungsi batch untuk input ini
+        """
+        if self.max_batch_size == 1:
+            return self.batch_function([item])[0]
+        
+        future = Future()
+        with self._lock:
+            self._record_arrival(time.perf_counter())
+            self._ensure_worker()
+        self._queue.put((item, future))
+        
+        return future.result(timeout=timeout)
+    
+    def _record_arrival(self, now):
+        """Memperbarui rata-rata jarak antar kedatangan (dipanggil dengan lock)"""
+        if self._last_arrival is not None:
+            gap = now - self._last_arrival
+            if self._arrival_gap == float('inf'):
+                self._arrival_gap = gap
+            else:
+                self._arrival_gap += SMOOTHING * (gap - self._arrival_gap)
+        self._last_arrival = now
+    
+    def _ensure_worker(self):
+        """Menjalankan thread worker (juga setelah fork ke proses worker server)"""
+        if self._worker is not None and self._worker.is_alive() and self._worker_pid == os.getpid():
+            return
+        
+        self._worker_pid = os.getpid()
+        self._worker = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._worker.start()
+    
+    def current_window(self, batch_size=1):
+        """
+        Menghitung waktu tunggu untuk batch yang sedang dikumpulkan
+        
+        Parameters
+        ----------
+        batch_size : int, optional
+            Jumlah permintaan yang sudah ada di batch, by default 1
+        
+        Returns
+        -------
+        float
+            Waktu tunggu (detik), 0 jika lalu lintas sepi
+        """
+        gap = self._arrival_gap
+        if gap >= self.max_wait or gap >= self._service_time:
+            return 0.0
+        
+        # Menunggu lebih lama dari waktu proses satu batch tidak pernah menguntungkan
+        return min(self.max_wait, self._service_time, gap * (self.max_batch_size - batch_size))
+    
+    def _run(self):
+        """Loop thread worker: kumpulkan batch, jalankan, kirim hasil"""
+        while True:
+            batch = [self._queue.get()]
+            start = time.perf_counter()
+            
+            # Permintaan yang sudah antre selalu ikut tanpa menunggu
+            deadline = start + self.current_window(len(batch))
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except queue.Empty:
+                    pass
+                
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            wait_seconds = time.perf_counter() - start
+            self._process(batch)
+            batch_seconds = time.perf_counter() - start - wait_seconds
+            
+            with self._lock:
+                self._service_time += SMOOTHING * (batch_seconds - self._service_time)
+                self._stats['requests'] += len(batch)
+                self._stats['batches'] += 1
+                self._stats['max_batch'] = max(self._stats['max_batch'], len(batch))
+                self._stats['wait_seconds'] += wait_seconds
+                self._stats['batch_seconds'] += batch_seconds
+    
+    def _process(self, batch):
+        """
+        Menjalankan fungsi batch dan mengirim hasil ke setiap pemanggil
+        
+        Parameters
+        ----------
+        batch : list
+            List pasangan (input, Future)
+        """
+        items = [item for item, _ in batch]
+        try:
+            results = self.batch_function(items)
+            if len(results) != len(items):
+                raise ValueError(f"Fungsi batch mengembalikan {len(results)} hasil untuk {len(items)} input")
+        except Exception as e:
+            if len(batch) == 1:
+                batch[0][1].set_exception(e)
+                return
+            
+            # Satu input bermasalah tidak boleh menggagalkan permintaan lain
+            for item_future in batch:
+                self._process([item_future])
+            return
+        
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+    
+    def stats(self):
+        """
+        Mengambil statistik penggabungan permintaan
+        
+        Returns
+        -------
+        dict
+            Jumlah permintaan dan batch, rata-rata dan maksimum ukuran batch,
+            rata-rata waktu tunggu dan waktu proses batch (ms), serta jendela saat ini (ms)
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        
+        batches = stats['batches'] or 1
+        return {
+            'requests': stats['requests'],
+            'batches': stats['batches'],
+            'average_batch_size': stats['requests'] / batches,
+            'max_batch_size': stats['max_batch'],
+            'average_wait_ms': stats['wait_seconds'] / batches * 1000,
+            'average_batch_ms': stats['batch_seconds'] / batches * 1000,
+            'window_ms': self.current_window() * 1000
+        }
@@ -0,0 +1,70 @@
+"""
+Utilitas encoding JSON cepat untuk respons API
+"""
+import json
+
+# orjson bersifat opsional; jika tidak terpasang gunakan encoder bawaan
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Encoder bawaan dengan separator ringkas dan output UTF-8 apa adanya
+_json_encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+def dumps_bytes(obj):
+    """
+    Encode objek Python menjadi bytes JSON (UTF-8)
+    
+    Parameters
+    ----------
+    obj : object
+        Objek yang dapat di-serialize ke JSON
+    
+    Returns
+    -------
+    bytes
+        Representasi JSON dari objek
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _json_encoder.encode(obj).encode('utf-8')
+
+def join_array(fragments):
+    """
+    Menggabungkan fragmen JSON yang sudah di-encode menjadi array JSON
+    
+    Parameters
+    ----------
+    fragments : list
+        List bytes, masing-masing berupa nilai JSON yang valid
+    
+    Returns
+    -------
+    bytes
+        Array JSON
+    """
+    return b'[' + b','.join(fragments) + b']'
+
+def extend_object(fragment, **fields):
+    """
+    Menambahkan field ke objek JSON yang sudah di-encode tanpa decode ulang
+    
+    Parameters
+    ----------
+    fragment : bytes
+        Objek JSON yang valid (diawali '{' dan diakhiri '}')
+    **fields
+        Field tambahan yang akan di-encode dan disisipkan
+    
+    Returns
+    -------
+    bytes
+        Objek JSON dengan field tambahan
+    """
+    if not fields:
+        return fragment
+    
+    extra = b','.join(dumps_bytes(key) + b':' + dumps_bytes(value) for key, value in fields.items())
+    separator = b',' if fragment != b'{}' else b''
+    return fragment[:-1] + separator + extra + b'}'
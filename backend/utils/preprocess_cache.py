@@ -0,0 +1,168 @@
+"""
+Cache persisten hasil preprocessing baris data training
+
+Hasil preprocess_text setiap baris disimpan di database SQLite dengan key
+hash SHA-1 teks aslinya, sehingga training ulang hanya memproses baris yang
+baru atau berubah. Database mencatat sidik jari konfigurasi preprocessing
+(preprocess_fingerprint); jika berbeda, seluruh isi cache dibuang.
+"""
+import os
+import time
+import sqlite3
+import hashlib
+
+from backend.utils.preprocessor import preprocess_batch, preprocess_fingerprint
+
+PREPROCESS_CACHE_PATH = os.environ.get('PREPROCESS_CACHE_PATH', os.path.join('models', 'preprocess_cache.db'))
+
+# Jumlah key per query IN (di bawah batas variabel SQLite)
+QUERY_CHUNK_SIZE = 500
+
+def row_hash(text):
+    """
+    Menghitung hash SHA-1 teks satu baris
+    
+    Parameters
+    ----------
+    text : str
+        Teks asli
+    
+    Returns
+    -------
+    str
+        Hash heksadesimal
+    """
+    return hashlib.sha1(str(text).encode('utf-8')).hexdigest()
+
+class PreprocessCache:
+    """
+    Penyimpanan hash teks -> teks hasil preprocessing di SQLite
+    """
+    
+    def __init__(self, path=PREPROCESS_CACHE_PATH, fingerprint=None):
+        """
+        Membuka cache dan membuang isinya jika konfigurasi preprocessing berubah
+        
+        Parameters
+        ----------
+        path : str, optional
+            Path database, by default PREPROCESS_CACHE_PATH
+        fingerprint : str, optional
+            Sidik jari preprocessing, by default None (preprocess_fingerprint())
+        """
+        self.path = path
+        self.fingerprint = fingerprint or preprocess_fingerprint()
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS rows (hash TEXT PRIMARY KEY, text TEXT NOT NULL)")
+        
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+        if row is None or row[0] != self.fingerprint:
+            with self.connection:
+                self.connection.execute("DELETE FROM rows")
+                self.connection.execute("INSERT OR REPLACE INTO meta VALUES ('fingerprint', ?)", (self.fingerprint,))
+    
+    def get_many(self, hashes):
+        """
+        Mengambil hasil preprocessing yang ada di cache
+        
+        Parameters
+        ----------
+        hashes : list
+            Hash baris yang dicari
+        
+        Returns
+        -------
+        dict
+            Hash -> teks hasil preprocessing (hanya yang ditemukan)
+        """
+        found = {}
+        for i in range(0, len(hashes), QUERY_CHUNK_SIZE):
+            chunk = hashes[i:i + QUERY_CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            found.update(self.connection.execute(
+                f"SELECT hash, text FROM rows WHERE hash IN ({placeholders})", chunk
+            ))
+        return found
+    
+    def put_many(self, items):
+        """
+        Menyimpan hasil preprocessing
+        
+        Parameters
+        ----------
+        items : iterable
+            Pasangan (hash, teks hasil preprocessing)
+        """
+        with self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO rows VALUES (?, ?)", items)
+    
+    def __len__(self):
+        """Jumlah baris di cache"""
+        return self.connection.execute("SELECT COUNT(*) FROM rows").fetchone()[0]
+    
+    def close(self):
+        """Menutup koneksi database"""
+        self.connection.close()
+
+def preprocess_cached(texts, path=PREPROCESS_CACHE_PATH, workers=None, report=True):
+    """
+    Preprocessing banyak teks dengan cache baris persisten: hanya teks yang
+    belum ada di cache yang diproses (paralel dengan preprocess_batch).
+    Jika cache tidak bisa dibuka, semua teks diproses tanpa cache.
+    
+    Parameters
+    ----------
+    texts : iterable
+        Teks yang akan diproses
+    path : str, optional
+        Path database cache, by default PREPROCESS_CACHE_PATH
+    workers : int, optional
+        Jumlah proses worker, by default None (lihat `preprocess_batch`)
+    report : bool, optional
+        Cetak jumlah teks dari cache dan yang diproses, by default True
+    
+    Returns
+    -------
+    list
+        List teks yang telah diproses, sesuai urutan input
+    """
+    texts = list(texts)
+    start = time.perf_counter()
+    
+    try:
+        cache = PreprocessCache(path)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Cache preprocessing tidak bisa dibuka ({e}), semua teks diproses")
+        return preprocess_batch(texts, workers=workers, report=report)
+    
+    try:
+        hashes = [row_hash(text) for text in texts]
+        results = cache.get_many(list(set(hashes)))
+        
+        # Teks yang sama cukup diproses sekali
+        missing = {}
+        for digest, text in zip(hashes, texts):
+            if digest not in results:
+                missing.setdefault(digest, text)
+        
+        if missing:
+            processed = preprocess_batch(list(missing.values()), workers=workers)
+            results.update(zip(missing, processed))
+            try:
+                cache.put_many(zip(missing, processed))
+            except sqlite3.Error as e:
+                print(f"Gagal menyimpan cache preprocessing: {e}")
+    finally:
+        cache.close()
+    
+    if report:
+        print(f"Preprocessing {len(texts)} teks: {len(missing)} teks baru diproses, sisanya dari cache "
+              f"({time.perf_counter() - start:.2f} detik)")
+    
+    return [results[digest] for digest in hashes]
@@ -1,29 +1,66 @@
 """
 Module untuk preprocessing teks dalam bahasa Indonesia
 """
+import os
 import re
+import time
 import string
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
+import hashlib
 from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
+from backend.utils.stem_lexicon import StemLexicon
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import unicodedata
 
-# Download NLTK data yang diperlukan
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
+# NLTK diimpor saat dibutuhkan saja (impor paket nltk memuat scikit-learn):
+# stopwords dibaca dari salinan di STOPWORDS_PATH (dibuat dengan
+# scripts/build_stopwords.py) dan baru dari NLTK jika salinan belum ada,
+# punkt hanya untuk tokenizer mode 'nltk' (lihat _ensure_punkt)
+STOPWORDS_PATH = os.environ.get('STOPWORDS_PATH', os.path.join('models', 'stopwords_indonesian.txt'))
 
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+# Jumlah teks minimal agar preprocessing batch dijalankan di process pool;
+# di bawah ini biaya menjalankan proses worker lebih besar dari hasilnya
+MIN_PARALLEL_TEXTS = 2000
+
+# Jumlah teks per potongan yang dikirim ke satu proses worker
+DEFAULT_CHUNK_SIZE = 500
 
 # Setup stemmer bahasa Indonesia dari Sastrawi
 stemmer_factory = StemmerFactory()
 stemmer = stemmer_factory.create_stemmer()
 
+# Mode tokenizer: 'fast' memecah teks hasil normalize_text dengan split (hasil
+# sama dengan word_tokenize untuk kata \w dan tanda hubung dari pengganti frasa
+# seperti 'sci-fi', tanpa resource punkt), 'nltk' memakai word_tokenize NLTK
+TOKENIZER_MODES = ('fast', 'nltk')
+TOKENIZER_MODE = os.environ.get('TOKENIZER_MODE', 'fast')
+
+# Kontraksi bahasa Inggris tanpa apostrof yang dipecah tokenizer Treebank NLTK
+# setelah 3 huruf pertama (misalnya "cannot" -> "can", "not")
+TREEBANK_CONTRACTIONS = frozenset(['cannot', 'gimme', 'gonna', 'gotta', 'lemme', 'wanna'])
+
+# Mode stemming: 'lexicon' memakai leksikon stem hasil kompilasi (hasil sama
+# dengan Sastrawi, kata baru di-stem Sastrawi dan disimpan di cache LRU),
+# 'sastrawi' memanggil Sastrawi untuk setiap token
+STEMMING_MODES = ('lexicon', 'sastrawi')
+STEMMING_MODE = os.environ.get('STEMMING_MODE', 'lexicon')
+STEM_LEXICON_PATH = os.environ.get('STEM_LEXICON_PATH', os.path.join('models', 'stem_lexicon.txt'))
+# Tambahkan kata baru ke file leksikon (default mati; leksikon dibangun dengan scripts/build_stem_lexicon.py)
+STEM_LEXICON_WRITE_BACK = os.environ.get('STEM_LEXICON_WRITE_BACK', '0') == '1'
+
+# Leksikon stem dimuat saat pertama kali dibutuhkan
+_stem_lexicon = None
+
+# Resource punkt diperiksa saat tokenizer 'nltk' pertama kali dipakai
+_punkt_ready = False
+
+# Stopwords bahasa Indonesia dimuat saat pertama kali dibutuhkan
+_stopwords = None
+
+# Versi aturan preprocessing; naikkan jika perubahan kode mengubah hasil
+# preprocess_text agar cache baris dan artifact model dianggap usang
+PREPROCESS_VERSION = 1
+
 # Normalisasi singkatan dan slang words bahasa Indonesia
 word_normalization = {
     'gak': 'tidak', 'ga': 'tidak', 'ngga': 'tidak', 'nggak': 'tidak', 'g': 'tidak',
@@ -77,9 +114,123 @@ film_keywords = {
     'klasik': 'klasik', 'lama': 'klasik', 'jadul': 'klasik'
 }
 
+# Key node trie untuk nilai pengganti frasa (token tidak pernah berupa None)
+_TRIE_VALUE = None
+
+# Kata: rangkaian huruf, angka, atau garis bawah
+_WORD_PATTERN = re.compile(r'\w+')
+
+def _split_words(text):
+    """
+    Membersihkan teks menjadi list kata: huruf kecil, unicode dinormalisasi
+    ke ASCII, dan semua karakter selain huruf/angka/garis bawah menjadi pemisah
+    
+    Parameters
+    ----------
+    text : str
+        Teks mentah
+        
+    Returns
+    -------
+    list
+        List kata
+    """
+    text = text.lower()
+    
+    # Normalisasi unicode (teks ASCII tidak berubah oleh NFKD, jadi dilewati)
+    if not text.isascii():
+        text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('utf-8', 'ignore')
+    
+    return _WORD_PATTERN.findall(text)
+
+def build_phrase_trie(*mappings):
+    """
+    Mengompilasi kamus normalisasi menjadi trie per token. Key berisi
+    beberapa kata (misalnya "science fiction") menjadi jalur beberapa node.
+    Jika key yang sama ada di beberapa kamus, kamus yang lebih awal menang.
+    
+    Parameters
+    ----------
+    *mappings : dict
+        Kamus frasa -> pengganti, urut dari prioritas tertinggi
+        
+    Returns
+    -------
+    dict
+        Trie: token -> node anak; nilai pengganti disimpan di key None
+    """
+    trie = {}
+    for mapping in reversed(mappings):
+        for phrase, replacement in mapping.items():
+            words = _split_words(phrase)
+            if not words:
+                continue
+            
+            node = trie
+            for word in words:
+                node = node.setdefault(word, {})
+            node[_TRIE_VALUE] = replacement
+    
+    return trie
+
+def apply_phrase_trie(words, trie):
+    """
+    Mengganti frasa dalam list kata dalam satu kali lintasan. Pada setiap
+    posisi dipilih frasa terpanjang yang cocok (longest match).
+    
+    Parameters
+    ----------
+    words : list
+        List kata hasil _split_words
+    trie : dict
+        Trie dari build_phrase_trie
+        
+    Returns
+    -------
+    list
+        List kata dan pengganti frasa
+    """
+    result = []
+    i = 0
+    n = len(words)
+    
+    while i < n:
+        node = trie.get(words[i])
+        if node is None:
+            result.append(words[i])
+            i += 1
+            continue
+        
+        # Telusuri trie selama token berikutnya masih cocok, simpan kecocokan terpanjang
+        match_value, match_end = node.get(_TRIE_VALUE), i + 1
+        j = i + 1
+        while j < n:
+            node = node.get(words[j])
+            if node is None:
+                break
+            j += 1
+            if _TRIE_VALUE in node:
+                match_value, match_end = node[_TRIE_VALUE], j
+        
+        if match_value is None:
+            result.append(words[i])
+            i += 1
+        else:
+            result.append(match_value)
+            i = match_end
+    
+    return result
+
+# Trie normalisasi: slang/singkatan diprioritaskan di atas kata kunci film
+NORMALIZATION_TRIE = build_phrase_trie(word_normalization, film_keywords)
+
+# Himpunan kata kunci film hasil normalisasi untuk lookup O(1)
+FILM_KEYWORD_VALUES = frozenset(film_keywords.values())
+
 def normalize_text(text):
     """
-    Normalisasi teks: mengganti singkatan dan slang dengan bentuk formal
+    Normalisasi teks: mengganti singkatan, slang, dan kata kunci film
+    (termasuk frasa beberapa kata) dengan bentuk formal
     
     Parameters
     ----------
@@ -91,30 +242,177 @@ def normalize_text(text):
     str
         Teks yang telah dinormalisasi
     """
-    text = text.lower()
-    
-    # Normalisasi unicode
-    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('utf-8', 'ignore')
+    return ' '.join(apply_phrase_trie(_split_words(text), NORMALIZATION_TRIE))
+
+def _ensure_punkt():
+    """Memastikan resource punkt NLTK tersedia (hanya dipanggil sekali)"""
+    global _punkt_ready
+    if _punkt_ready:
+        return
     
-    # Ganti karakter tidak standar dan multiple spaces
-    text = re.sub(r'[^\w\s]', ' ', text)
-    text = re.sub(r'\s+', ' ', text)
+    import nltk
+    try:
+        nltk.data.find('tokenizers/punkt_tab')
+    except LookupError:
+        nltk.download('punkt_tab')
+    _punkt_ready = True
+
+def fast_tokenize(text):
+    """
+    Tokenisasi cepat untuk teks hasil normalize_text: huruf kecil, kata berisi
+    huruf, angka, dan garis bawah, ditambah tanda hubung dari pengganti frasa
+    (misalnya 'sci-fi', 'tidak apa-apa'). Hasilnya sama dengan word_tokenize
+    NLTK untuk teks tersebut: token dipisah spasi (tanda hubung di dalam kata
+    tidak dipecah), dan kontraksi Treebank tanpa apostrof dipecah dua.
     
-    # Normalisasi kata-kata
-    words = text.split()
-    normalized_words = []
+    Parameters
+    ----------
+    text : str
+        Teks hasil normalize_text
+        
+    Returns
+    -------
+    list
+        List token
+    """
+    tokens = text.split()
+    if TREEBANK_CONTRACTIONS.isdisjoint(tokens):
+        return tokens
     
-    for word in words:
-        # Normalisasi kata umum
-        if word in word_normalization:
-            normalized_words.append(word_normalization[word])
-        # Normalisasi kata film
-        elif word in film_keywords:
-            normalized_words.append(film_keywords[word])
+    split_tokens = []
+    for token in tokens:
+        if token in TREEBANK_CONTRACTIONS:
+            split_tokens.extend((token[:3], token[3:]))
         else:
-            normalized_words.append(word)
+            split_tokens.append(token)
+    return split_tokens
+
+def tokenize(text, mode=None):
+    """
+    Tokenisasi teks hasil normalize_text
+    
+    Parameters
+    ----------
+    text : str
+        Teks hasil normalize_text
+    mode : str, optional
+        'fast' atau 'nltk', by default None (TOKENIZER_MODE)
+        
+    Returns
+    -------
+    list
+        List token
+    """
+    mode = mode or TOKENIZER_MODE
+    if mode not in TOKENIZER_MODES:
+        raise ValueError(f"Mode tokenizer '{mode}' tidak dikenal. Pilihan: {', '.join(TOKENIZER_MODES)}")
+    
+    if mode == 'fast':
+        return fast_tokenize(text)
     
-    return ' '.join(normalized_words)
+    _ensure_punkt()
+    from nltk.tokenize import word_tokenize
+    return word_tokenize(text)
+
+def get_stem_lexicon():
+    """
+    Mengambil leksikon stem (dimuat sekali per proses)
+    
+    Returns
+    -------
+    StemLexicon
+        Leksikon stem dengan fallback Sastrawi
+    """
+    global _stem_lexicon
+    if _stem_lexicon is None:
+        _stem_lexicon = StemLexicon(stemmer, path=STEM_LEXICON_PATH, write_back=STEM_LEXICON_WRITE_BACK)
+    return _stem_lexicon
+
+def stem_tokens(tokens, mode=None):
+    """
+    Mengubah token ke kata dasarnya
+    
+    Parameters
+    ----------
+    tokens : list
+        List token hasil normalisasi dan tokenisasi
+    mode : str, optional
+        'lexicon' atau 'sastrawi', by default None (STEMMING_MODE)
+        
+    Returns
+    -------
+    list
+        List kata dasar
+    """
+    mode = mode or STEMMING_MODE
+    if mode not in STEMMING_MODES:
+        raise ValueError(f"Mode stemming '{mode}' tidak dikenal. Pilihan: {', '.join(STEMMING_MODES)}")
+    
+    if mode == 'lexicon':
+        stem = get_stem_lexicon().stem
+        return [stem(token) for token in tokens]
+    
+    return [stemmer.stem(token) for token in tokens]
+
+def _nltk_stopwords():
+    """Membaca stopwords bahasa Indonesia dari corpus NLTK (diunduh jika belum ada)"""
+    import nltk
+    try:
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        nltk.download('stopwords')
+    from nltk.corpus import stopwords
+    return stopwords.words('indonesian')
+
+def get_stopwords():
+    """
+    Mengambil stopwords bahasa Indonesia NLTK (dimuat sekali per proses).
+    Salinan di STOPWORDS_PATH dipakai jika ada; jika belum, stopwords
+    dibaca dari NLTK dan hanya disimpan di memori.
+    
+    Returns
+    -------
+    list
+        List stopwords bahasa Indonesia
+    """
+    global _stopwords
+    if _stopwords is not None:
+        return _stopwords
+    
+    try:
+        with open(STOPWORDS_PATH, 'r', encoding='utf-8') as file:
+            _stopwords = [word for word in file.read().split('\n') if word]
+    except FileNotFoundError:
+        _stopwords = _nltk_stopwords()
+    
+    return _stopwords
+
+def write_stopwords(path=None):
+    """
+    Menyalin stopwords bahasa Indonesia NLTK ke file teks (satu kata per baris)
+    
+    Parameters
+    ----------
+    path : str, optional
+        Path file tujuan, by default STOPWORDS_PATH
+    
+    Returns
+    -------
+    list
+        List stopwords yang ditulis
+    """
+    path = path or STOPWORDS_PATH
+    words = _nltk_stopwords()
+    
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        file.write('\n'.join(words) + '\n')
+    os.replace(temp_path, path)
+    
+    return words
 
 def remove_stopwords(tokens, additional_stopwords=None):
     """
@@ -133,7 +431,7 @@ def remove_stopwords(tokens, additional_stopwords=None):
         List dari token tanpa stopwords
     """
     # Gabungkan stopwords bawaan dengan additional stopwords
-    stop_words = set(stopwords.words('indonesian'))
+    stop_words = set(get_stopwords())
     if additional_stopwords:
         stop_words.update(additional_stopwords)
     
@@ -158,12 +456,12 @@ def extract_film_keywords(text):
     keywords = []
     
     for word in words:
-        if word in film_keywords.values():
+        if word in FILM_KEYWORD_VALUES:
             keywords.append(word)
     
     return keywords
 
-def preprocess_text(text, remove_stop=True, do_stemming=True):
+def preprocess_text(text, remove_stop=True, do_stemming=True, stemming_mode=None):
     """
     Preprocessing teks lengkap: normalisasi, tokenisasi, hapus stopword, stemming
     
@@ -175,6 +473,8 @@ def preprocess_text(text, remove_stop=True, do_stemming=True):
         Flag untuk menghapus stopwords, by default True
     do_stemming : bool, optional
         Flag untuk melakukan stemming, by default True
+    stemming_mode : str, optional
+        'lexicon' atau 'sastrawi', by default None (STEMMING_MODE)
         
     Returns
     -------
@@ -188,7 +488,7 @@ def preprocess_text(text, remove_stop=True, do_stemming=True):
     text = normalize_text(text)
     
     # Tokenisasi
-    tokens = word_tokenize(text)
+    tokens = tokenize(text)
     
     # Hapus stopwords jika diminta
     if remove_stop:
@@ -196,17 +496,108 @@ def preprocess_text(text, remove_stop=True, do_stemming=True):
         film_stopwords_to_keep = ['film', 'movie', 'action', 'comedy', 'drama', 'horror', 'romance', 'thriller']
         
         # Definisikan stopwords custom yang tidak akan dihapus
-        custom_stopwords = [word for word in stopwords.words('indonesian') if word not in film_stopwords_to_keep]
+        custom_stopwords = [word for word in get_stopwords() if word not in film_stopwords_to_keep]
         
         tokens = remove_stopwords(tokens, additional_stopwords=custom_stopwords)
     
     # Stemming jika diminta
     if do_stemming:
-        tokens = [stemmer.stem(token) for token in tokens]
+        tokens = stem_tokens(tokens, stemming_mode)
     
     # Gabungkan kembali menjadi teks
     return " ".join(tokens)
 
+def _preprocess_chunk(texts, remove_stop=True, do_stemming=True):
+    """Preprocessing satu potongan teks di proses worker"""
+    return [preprocess_text(text, remove_stop=remove_stop, do_stemming=do_stemming) for text in texts]
+
+def preprocess_fingerprint(remove_stop=True, do_stemming=True):
+    """
+    Sidik jari konfigurasi preprocessing: versi aturan, opsi, kamus
+    normalisasi, dan stopwords. Mode tokenizer dan stemming tidak ikut
+    karena hasilnya sama.
+    
+    Parameters
+    ----------
+    remove_stop : bool, optional
+        Flag untuk menghapus stopwords, by default True
+    do_stemming : bool, optional
+        Flag untuk melakukan stemming, by default True
+    
+    Returns
+    -------
+    str
+        Hash SHA-1 konfigurasi preprocessing
+    """
+    digest = hashlib.sha1()
+    digest.update(f"v{PREPROCESS_VERSION}|{int(remove_stop)}|{int(do_stemming)}".encode('utf-8'))
+    for mapping in (word_normalization, film_keywords):
+        for key in sorted(mapping):
+            digest.update(f"\n{key}\t{mapping[key]}".encode('utf-8'))
+    if remove_stop:
+        digest.update('\n'.join(get_stopwords()).encode('utf-8'))
+    return digest.hexdigest()
+
+def preprocess_batch(texts, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, remove_stop=True,
+                     do_stemming=True, report=False):
+    """
+    Preprocessing banyak teks sekaligus. Teks dibagi menjadi potongan yang
+    diproses paralel di process pool (tokenisasi NLTK dan stemmer Sastrawi
+    terikat GIL, sehingga thread tidak membantu); urutan hasil sama dengan
+    urutan input.
+    
+    Parameters
+    ----------
+    texts : iterable
+        Teks yang akan diproses
+    workers : int, optional
+        Jumlah proses worker, by default None (environment variable
+        PREPROCESS_WORKERS, atau jumlah CPU). 1 berarti diproses serial.
+    chunk_size : int, optional
+        Jumlah teks per potongan, by default DEFAULT_CHUNK_SIZE
+    remove_stop : bool, optional
+        Flag untuk menghapus stopwords, by default True
+    do_stemming : bool, optional
+        Flag untuk melakukan stemming, by default True
+    report : bool, optional
+        Cetak jumlah teks, jumlah proses, dan throughput, by default False
+        
+    Returns
+    -------
+    list
+        List teks yang telah diproses, sesuai urutan input
+    """
+    texts = list(texts)
+    if workers is None:
+        workers = int(os.environ.get('PREPROCESS_WORKERS', 0)) or os.cpu_count() or 1
+    workers = max(1, min(workers, -(-len(texts) // chunk_size)))
+    
+    start = time.perf_counter()
+    results = None
+    
+    if workers > 1 and len(texts) >= MIN_PARALLEL_TEXTS:
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        worker_fn = partial(_preprocess_chunk, remove_stop=remove_stop, do_stemming=do_stemming)
+        
+        try:
+            # executor.map mengembalikan hasil sesuai urutan potongan
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = [text for chunk in executor.map(worker_fn, chunks) for text in chunk]
+        except (OSError, RuntimeError) as e:
+            print(f"Preprocessing paralel gagal ({e}), dilanjutkan secara serial")
+    
+    if results is None:
+        workers = 1
+        results = _preprocess_chunk(texts, remove_stop=remove_stop, do_stemming=do_stemming)
+    
+    if report:
+        elapsed = time.perf_counter() - start
+        rate = len(texts) / elapsed if elapsed > 0 else float('inf')
+        print(f"Preprocessing {len(texts)} teks dengan {workers} proses dalam {elapsed:.2f} detik "
+              f"({rate:.0f} teks/detik)")
+    
+    return results
+
 def tokenize_only(text):
     """
     Hanya lakukan tokenisasi tanpa preprocessing lain
@@ -228,11 +619,11 @@ def tokenize_only(text):
     text = normalize_text(text)
     
     # Tokenisasi
-    tokens = word_tokenize(text)
+    tokens = tokenize(text)
     
     return tokens
 
-def extract_film_patterns(text):
+def extract_film_patterns(text, known_person=None):
     """
     Ekstrak pola-pola referensi film dari teks input
     
@@ -240,6 +631,12 @@ def extract_film_patterns(text):
     ----------
     text : str
         Teks input pengguna
+    known_person : callable, optional
+        Fungsi (teks, field) -> bool yang memeriksa apakah teks memuat nama
+        sutradara ('director') atau aktor ('actors') yang ada di database,
+        misalnya `FilmTranslator.known_person`. Pola sutradara dan aktor tanpa
+        nama yang dikenal (misalnya "film dengan rating tinggi") dibuang.
+        By default None (tidak diperiksa)
         
     Returns
     -------
@@ -257,13 +654,13 @@ def extract_film_patterns(text):
     # Pattern untuk sutradara
     director_pattern = r'(film|movie)\s+(dari|oleh|garapan|karya|sutradara)\s+([a-zA-Z\s]+)'
     director_matches = re.findall(director_pattern, text.lower())
-    if director_matches:
+    if director_matches and (known_person is None or known_person(director_matches[0][2], 'director')):
         patterns['director'] = director_matches[0][2].strip()
     
     # Pattern untuk aktor
     actor_pattern = r'(film|movie)\s+(dengan|dibintangi|diperankan oleh|pemain)\s+([a-zA-Z\s]+)'
     actor_matches = re.findall(actor_pattern, text.lower())
-    if actor_matches:
+    if actor_matches and (known_person is None or known_person(actor_matches[0][2], 'actors')):
         patterns['actor'] = actor_matches[0][2].strip()
     
     # Pattern untuk tahun
@@ -273,7 +670,7 @@ def extract_film_patterns(text):
         patterns['year'] = year_matches[0][2].strip()
     
     # Pattern untuk rating
-    rating_pattern = r'(film|movie)\s+(dengan|rating|nilai|skor)\s+(tinggi|bagus|terbaik|atas)'
+    rating_pattern = r'(film|movie)\s+(dengan|rating|nilai|skor|dengan\s+(?:rating|nilai|skor))\s+(tinggi|bagus|terbaik|atas)'
     rating_matches = re.findall(rating_pattern, text.lower())
     if rating_matches:
         patterns['rating'] = 'high'
@@ -0,0 +1,205 @@
+"""
+Leksikon stem hasil kompilasi: pemetaan bentuk kata -> kata dasar Sastrawi
+
+Leksikon dibangun offline dengan menjalankan Sastrawi pada korpus training,
+teks katalog film, dan daftar kata (scripts/build_stem_lexicon.py), lalu
+disimpan sebagai file teks satu entri per baris:
+    kata            (kata dasar sama dengan bentuk kata)
+    kata<TAB>dasar  (kata dasar berbeda)
+
+Saat dimuat, leksikon menjadi dictionary sehingga stemming kata yang
+dikenal cukup satu lookup. Kata yang tidak dikenal di-stem dengan
+Sastrawi dan disimpan di cache LRU berukuran tetap, sehingga teks dari
+pengguna tidak bisa membuat memori atau file leksikon terus membesar.
+Penulisan kata baru ke akhir file (write-back) hanya dilakukan jika
+diaktifkan secara eksplisit.
+"""
+import os
+import atexit
+import threading
+from collections import OrderedDict
+
+try:
+    import fcntl
+except ImportError:  # Windows: penulisan file tanpa kunci
+    fcntl = None
+
+LEXICON_HEADER = '# stem-lexicon v1'
+
+# Jumlah entri baru yang dikumpulkan sebelum ditulis ke file
+WRITE_BACK_BATCH = 256
+
+# Jumlah maksimal kata di luar leksikon yang hasil stem-nya disimpan di memori
+STEM_CACHE_SIZE = int(os.environ.get('STEM_CACHE_SIZE', 50000))
+
+def format_entry(word, root):
+    """
+    Membuat satu baris entri leksikon
+    
+    Parameters
+    ----------
+    word : str
+        Bentuk kata
+    root : str
+        Kata dasar hasil Sastrawi
+    
+    Returns
+    -------
+    str
+        Baris entri (tanpa newline)
+    """
+    return word if root == word else f"{word}\t{root}"
+
+class StemLexicon:
+    """
+    Stemmer berbasis leksikon dengan fallback ke Sastrawi
+    """
+    
+    def __init__(self, stemmer, path=os.path.join('models', 'stem_lexicon.txt'), write_back=False,
+                 cache_size=STEM_CACHE_SIZE):
+        """
+        Memuat leksikon stem
+        
+        Parameters
+        ----------
+        stemmer : object
+            Stemmer Sastrawi untuk kata yang tidak ada di leksikon
+        path : str, optional
+            Path file leksikon, by default 'models/stem_lexicon.txt'
+        write_back : bool, optional
+            Tambahkan hasil stemming kata baru ke file leksikon, by default False
+        cache_size : int, optional
+            Jumlah maksimal kata di luar leksikon yang disimpan di cache LRU,
+            by default STEM_CACHE_SIZE
+        """
+        self.stemmer = stemmer
+        self.path = path
+        self.write_back = write_back
+        self.cache_size = cache_size
+        self.roots = self._load()
+        
+        # Kata di luar leksikon; entri yang paling lama tidak dipakai dibuang lebih dulu
+        self._recent = OrderedDict()
+        self._pending = []
+        self._lock = threading.Lock()
+        if write_back:
+            atexit.register(self.flush)
+    
+    def _load(self):
+        """
+        Membaca file leksikon
+        
+        Returns
+        -------
+        dict
+            Dictionary bentuk kata -> kata dasar (kosong jika file tidak ada)
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                lines = file.read().split('\n')
+        except FileNotFoundError:
+            return {}
+        
+        if not lines or lines[0] != LEXICON_HEADER:
+            print(f"Format leksikon stem {self.path} tidak dikenal, leksikon diabaikan")
+            return {}
+        
+        roots = {}
+        for line in lines[1:]:
+            if line:
+                word, separator, root = line.partition('\t')
+                roots[word] = root if separator else word
+        
+        return roots
+    
+    def stem(self, word):
+        """
+        Mencari kata dasar sebuah token
+        
+        Parameters
+        ----------
+        word : str
+            Token hasil normalisasi dan tokenisasi
+        
+        Returns
+        -------
+        str
+            Kata dasar, sama dengan hasil `stemmer.stem(word)`
+        """
+        root = self.roots.get(word)
+        if root is not None:
+            return root
+        
+        with self._lock:
+            root = self._recent.get(word)
+            if root is not None:
+                self._recent.move_to_end(word)
+                return root
+        
+        root = self.stemmer.stem(word)
+        
+        with self._lock:
+            self._recent[word] = root
+            if len(self._recent) > self.cache_size:
+                self._recent.popitem(last=False)
+            
+            if self.write_back:
+                self._pending.append(format_entry(word, root))
+                if len(self._pending) >= WRITE_BACK_BATCH:
+                    self._flush_locked()
+        
+        return root
+    
+    def flush(self):
+        """Menulis entri baru hasil fallback Sastrawi ke akhir file leksikon"""
+        with self._lock:
+            self._flush_locked()
+    
+    def _flush_locked(self):
+        if not self._pending:
+            return
+        
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            
+            with open(self.path, 'a', encoding='utf-8') as file:
+                # Kunci file agar beberapa proses tidak menulis baris yang bertumpuk
+                if fcntl is not None:
+                    fcntl.flock(file, fcntl.LOCK_EX)
+                try:
+                    header = '' if file.tell() > 0 else LEXICON_HEADER + '\n'
+                    file.write(header + '\n'.join(self._pending) + '\n')
+                    file.flush()
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(file, fcntl.LOCK_UN)
+        except OSError as e:
+            print(f"Gagal menulis leksikon stem: {e}")
+        
+        self._pending = []
+    
+    @staticmethod
+    def write(path, roots):
+        """
+        Menulis leksikon lengkap ke file (menimpa file lama secara atomik)
+        
+        Parameters
+        ----------
+        path : str
+            Path file leksikon
+        roots : dict
+            Dictionary bentuk kata -> kata dasar
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            file.write(LEXICON_HEADER + '\n')
+            for word in sorted(roots):
+                file.write(format_entry(word, roots[word]) + '\n')
+        
+        os.replace(temp_path, path)